@@ -10,6 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
+import sys
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -28,6 +30,10 @@ DEBUG = True
 ALLOWED_HOSTS = []
 
 
+# `manage.py test`: tanpa thread background yang menulis ke database test
+TESTING = sys.argv[1:2] == ['test']
+
+
 # Application definition
 
 INSTALLED_APPS = [
@@ -51,11 +57,14 @@ CRISPY_TEMPLATE_PACK = 'bootstrap5'
 
 
 MIDDLEWARE = [
+    'accounts.profiling.QueryProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'accounts.hashers.HasherCountMiddleware',
+    'accounts.tracking.ActivityTrackingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -85,14 +94,119 @@ WSGI_APPLICATION = 'PM.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# SQLite untuk banyak thread/proses:
+# - WAL: pembaca tidak memblokir penulis; synchronous=NORMAL aman dipakai dengan WAL
+# - busy_timeout: penulis menunggu lock, tidak langsung gagal "database is locked"
+# - transaction_mode IMMEDIATE: atomic() mengambil lock tulis di awal transaksi,
+#   sehingga transaksi baca-lalu-tulis tidak gagal saat upgrade lock
+# - CONN_MAX_AGE: koneksi (beserta pragma) dipakai ulang antar request
+# Bandingkan dengan konfigurasi bawaan: python manage.py benchmark_writes
+
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 20000,
+    'mmap_size': 256 * 1024 * 1024,
+    # Negatif = KiB per koneksi
+    'cache_size': -32 * 1024,
+    'temp_store': 'MEMORY',
+}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            'init_command': ';'.join(f'PRAGMA {name}={value}' for name, value in SQLITE_PRAGMAS.items()),
+            'transaction_mode': 'IMMEDIATE',
+        },
+        'CONN_MAX_AGE': int(os.environ.get('PM_DB_CONN_MAX_AGE', 600)),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
 
+# Cache
+# locmem cukup untuk satu proses. Untuk beberapa worker pakai PM_CACHE=file atau
+# PM_CACHE=db (jalankan `python manage.py createcachetable` terlebih dahulu).
+
+CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'pm-default',
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.cache',
+    },
+    'db': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'pm_cache',
+    },
+}
+
+CACHES = {
+    'default': {
+        **CACHE_BACKENDS[os.environ.get('PM_CACHE', 'locmem')],
+        'TIMEOUT': 300,
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    }
+}
+
+
+# Session: cached_db membaca session dari cache (database hanya saat cache miss).
+# PM_SESSION=signed_cookies menyimpan session di cookie bertanda tangan, tanpa query sama sekali.
+
+SESSION_ENGINES = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+}
+
+SESSION_ENGINE = SESSION_ENGINES[os.environ.get('PM_SESSION', 'cached_db')]
+
+
+# Audit log UserActivity: ditulis batch oleh thread background (lihat accounts/activity.py)
+
+ACTIVITY_LOG = {
+    'ASYNC': not TESTING,
+    'BATCH_SIZE': 200,
+    'FLUSH_INTERVAL': 2.0,
+    'MAX_QUEUE': 10000,
+    # Retensi: log mentah lebih tua dari ini dipindah ke file JSONL terkompresi
+    'RETENTION_DAYS': 90,
+    'ARCHIVE_DIR': BASE_DIR / 'activity_archive',
+}
+
+# Profiling SQL per request: Server-Timing, log, dan ring buffer request lambat (accounts/profiling.py)
+QUERY_PROFILING = {
+    'ENABLED': True,
+    'SERVER_TIMING': 'all' if DEBUG else 'staff',
+    'BUFFER_SIZE': 100,
+    'SLOW_REQUEST_MS': 300,
+    'SLOW_QUERY_COUNT': 50,
+    'DUPLICATE_THRESHOLD': 2,
+}
+
+# login_count, last_login_ip, last_activity: diagregasi di memori lalu ditulis
+# dengan satu UPDATE per batch user (lihat accounts/tracking.py)
+USER_TRACKING = {
+    'ASYNC': not TESTING,
+    'FLUSH_INTERVAL': 30.0,
+    'BATCH_SIZE': 500,
+    # Batch yang terus gagal dibuang setelah sekian percobaan ulang
+    'MAX_RETRIES': 5,
+}
+
+# Gambar profil diproses di luar request oleh pool proses (accounts/images.py)
+PROFILE_IMAGE = {
+    'ASYNC': True,
+    'WORKERS': 2,
+    'SIZES': {'large': 300, 'medium': 150, 'small': 48},
+    'QUALITY': 85,
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -134,3 +248,24 @@ STATIC_URL = 'static/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 AUTH_USER_MODEL = 'accounts.CustomUser'
+
+AUTHENTICATION_BACKENDS = ['accounts.backend.CustomAuthBackend']
+
+# Batas login gagal per IP dan per email (accounts/throttle.py).
+# STORE 'cache' dipakai bersama antar worker; 'memory' hanya untuk satu proses.
+LOGIN_THROTTLE = {
+    'STORE': 'cache',
+    'WINDOW': 900,
+    'IP_LIMIT': 50,
+    'EMAIL_LIMIT': 10,
+    'REPORT_INTERVAL': 60,
+}
+
+# Sama dengan default Django, ditambah penghitung hash per request (accounts/hashers.py)
+PASSWORD_HASHERS = [
+    'accounts.hashers.PBKDF2PasswordHasher',
+    'accounts.hashers.PBKDF2SHA1PasswordHasher',
+    'accounts.hashers.Argon2PasswordHasher',
+    'accounts.hashers.BCryptSHA256PasswordHasher',
+    'accounts.hashers.ScryptPasswordHasher',
+]
@@ -0,0 +1,222 @@
+"""
+Penulisan UserActivity secara batch di thread background.
+
+Event dimasukkan ke antrean in-process (dibatasi MAX_QUEUE) lalu ditulis
+dengan bulk_create oleh thread background saat antrean mencapai BATCH_SIZE,
+setiap FLUSH_INTERVAL detik, atau saat request selesai.
+"""
+import atexit
+import collections
+import logging
+import threading
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, connections
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'ASYNC': True,
+    'BATCH_SIZE': 200,
+    'FLUSH_INTERVAL': 2.0,
+    'MAX_QUEUE': 10000,
+    'RETENTION_DAYS': 90,
+    'ARCHIVE_DIR': None,  # default: BASE_DIR / 'activity_archive'
+}
+
+
+def get_activity_settings():
+    return {**DEFAULTS, **getattr(settings, 'ACTIVITY_LOG', {})}
+
+
+class ActivityWriter:
+    def __init__(self, batch_size=200, flush_interval=2.0, max_queue=10000, background=True):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.background = background
+
+        self._queue = collections.deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.flushes = 0
+
+    def submit(self, activity):
+        """
+        Masukkan UserActivity (belum disimpan) ke antrean; tidak pernah menunggu database
+        """
+        with self._lock:
+            if len(self._queue) >= self.max_queue:
+                # Antrean penuh: buang event daripada menahan request
+                self.dropped += 1
+                return False
+            self._queue.append(activity)
+            self.enqueued += 1
+            pending = len(self._queue)
+
+        if self.background:
+            self._ensure_thread()
+            if pending >= self.batch_size:
+                self._wakeup.set()
+        return True
+
+    def wake(self):
+        """
+        Minta thread background menulis antrean sekarang (misalnya di akhir request)
+        """
+        if self._queue:
+            self._wakeup.set()
+
+    def flush(self):
+        """
+        Tulis semua event di antrean per batch; mengembalikan jumlah baris yang ditulis
+        """
+        from .models import UserActivity
+
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    size = min(self.batch_size, len(self._queue))
+                    batch = [self._queue.popleft() for _ in range(size)]
+                if not batch:
+                    break
+                try:
+                    # ignore_conflicts: constraint unik tidak boleh menggagalkan batch
+                    UserActivity.objects.bulk_create(batch, ignore_conflicts=True)
+                except DatabaseError:
+                    logger.exception('Failed to write %d user activities', len(batch))
+                    with self._lock:
+                        self.failed += len(batch)
+                else:
+                    written += len(batch)
+                    with self._lock:
+                        self.written += len(batch)
+                        self.flushes += 1
+        return written
+
+    def stats(self):
+        with self._lock:
+            return {
+                'pending': len(self._queue),
+                'enqueued': self.enqueued,
+                'written': self.written,
+                'dropped': self.dropped,
+                'failed': self.failed,
+                'flushes': self.flushes,
+            }
+
+    def stop(self, timeout=None):
+        """
+        Hentikan thread background lalu tulis sisa antrean di thread pemanggil
+        """
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._stop.set()
+            self._wakeup.set()
+            thread.join(timeout)
+        return self.flush()
+
+    def _ensure_thread(self):
+        # Dicek ulang setelah fork: thread milik proses induk tidak ikut
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name='activity-writer', daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if self._stop.is_set():
+                break
+            close_old_connections()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('Activity writer flush failed')
+        # Koneksi milik thread ini tidak boleh tertinggal
+        connections.close_all()
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_activity_writer():
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                options = get_activity_settings()
+                _writer = ActivityWriter(
+                    batch_size=options['BATCH_SIZE'],
+                    flush_interval=options['FLUSH_INTERVAL'],
+                    max_queue=options['MAX_QUEUE'],
+                    background=options['ASYNC'],
+                )
+                atexit.register(_writer.stop)
+    return _writer
+
+
+def reset_activity_writer():
+    """
+    Hentikan writer yang ada (antrean ditulis lebih dulu); writer baru dibuat
+    dari settings saat get_activity_writer() berikutnya
+    """
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        atexit.unregister(writer.stop)
+        writer.stop()
+
+
+def reset_activity_writer_on_setting_change(setting, **kwargs):
+    """
+    Receiver setting_changed (override_settings di test)
+    """
+    if setting == 'ACTIVITY_LOG':
+        reset_activity_writer()
+
+
+def wake_activity_writer(**kwargs):
+    """
+    Receiver request_finished
+    """
+    if _writer is not None:
+        _writer.wake()
+
+
+def get_client_ip(request):
+    # X-Forwarded-For tidak dipakai: bisa dipalsukan client
+    return request.META.get('REMOTE_ADDR')
+
+
+def log_request_activity(request, user, activity_type, **kwargs):
+    """
+    Catat aktivitas dengan IP dan user agent dari request
+    """
+    from .models import UserActivity
+
+    return UserActivity.log_activity(
+        user,
+        activity_type,
+        ip_address=get_client_ip(request),
+        user_agent=request.META.get('HTTP_USER_AGENT', ''),
+        **kwargs
+    )
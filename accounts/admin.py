@@ -1,7 +1,8 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from django.utils.translation import gettext_lazy as _
-from .models import CustomUser, UserProfile, UserActivity
+from .admin_tools import AutocompleteFilter, ScalableAdminMixin
+from .models import CustomUser, UserProfile, UserActivity, UserActivityDaily
 
 @admin.register(CustomUser)
 class CustomUserAdmin(UserAdmin):
@@ -58,7 +59,7 @@ class CustomUserAdmin(UserAdmin):
     )
 
 @admin.register(UserProfile)
-class UserProfileAdmin(admin.ModelAdmin):
+class UserProfileAdmin(ScalableAdminMixin, admin.ModelAdmin):
     list_display = (
         'user', 'gender', 'education_level',
         'occupation', 'marital_status',
@@ -73,6 +74,7 @@ class UserProfileAdmin(admin.ModelAdmin):
         'phone_number', 'occupation',
         'city', 'country'
     )
+    autocomplete_fields = ('user',)
     readonly_fields = ('created_at', 'updated_at')
 
     fieldsets = (
@@ -116,7 +118,7 @@ class UserProfileAdmin(admin.ModelAdmin):
     get_completion_percentage.short_description = 'Profile Completion'
 
 @admin.register(UserActivity)
-class UserActivityAdmin(admin.ModelAdmin):
+class UserActivityAdmin(ScalableAdminMixin, admin.ModelAdmin):
     list_display = (
         'user', 'activity_type', 'severity',
         'timestamp', 'is_suspicious',
@@ -124,12 +126,17 @@ class UserActivityAdmin(admin.ModelAdmin):
     )
     list_filter = (
         'activity_type', 'severity',
-        'is_suspicious', 'timestamp'
+        'is_suspicious', 'timestamp',
+        ('user', AutocompleteFilter)
     )
     search_fields = (
         'user__username', 'user__email',
         'ip_address', 'activity_type'
     )
+    # Tanpa date_hierarchy (query tanggal distinct atas seluruh log); filter
+    # tanggal lewat 'timestamp' di list_filter
+    ordering = ('-timestamp',)
+    autocomplete_fields = ('user',)
     readonly_fields = ('timestamp',)
 
     def get_queryset(self, request):
@@ -156,6 +163,24 @@ class UserActivityAdmin(admin.ModelAdmin):
         }),
     )
 
+@admin.register(UserActivityDaily)
+class UserActivityDailyAdmin(ScalableAdminMixin, admin.ModelAdmin):
+    list_display = (
+        'date', 'user', 'activity_type',
+        'count', 'suspicious_count'
+    )
+    list_filter = ('activity_type',)
+    list_select_related = ('user',)
+    search_fields = ('user__username', 'user__email')
+    date_hierarchy = 'date'
+    readonly_fields = ('user', 'activity_type', 'date', 'count', 'suspicious_count')
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        if request.user.is_superuser:
+            return qs
+        return qs.filter(user=request.user)
+
 # Kustomisasi Admin Global
 admin.site.site_header = "User Management System"
 admin.site.site_title = "UMS Admin"
@@ -0,0 +1,182 @@
+"""
+Alat bantu admin untuk tabel besar (jutaan baris).
+
+- ScalableAdminMixin: list_select_related otomatis dari list_display,
+  paginator dengan count perkiraan, tanpa COUNT(*) kedua untuk total.
+- AutocompleteFilter: filter relasi yang hanya memuat objek terpilih;
+  pilihan lain dicari lewat endpoint autocomplete admin.
+"""
+from urllib.parse import urlencode
+
+from django.contrib import admin
+from django.core.exceptions import FieldDoesNotExist
+from django.core.paginator import EmptyPage, Paginator
+from django.db import DatabaseError, connections
+from django.urls import reverse
+from django.utils.functional import cached_property
+
+EXACT_COUNT_LIMIT = 10000
+
+
+def estimate_table_rows(model, using='default'):
+    """
+    Perkiraan jumlah baris dari statistik database (None bila tidak tersedia)
+    """
+    connection = connections[using]
+    table = model._meta.db_table
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass', [table])
+                row = cursor.fetchone()
+                return max(row[0], 0) if row else None
+            if connection.vendor == 'sqlite':
+                # MAX(rowid) dibaca dari ujung B-tree; lebih besar dari COUNT bila ada baris terhapus
+                cursor.execute(f'SELECT MAX(rowid) FROM {connection.ops.quote_name(table)}')
+                row = cursor.fetchone()
+                return row[0] or 0
+    except DatabaseError:
+        return None
+    return None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    COUNT(*) persis hanya sampai EXACT_COUNT_LIMIT baris. Di atas itu count
+    hanya perkiraan (is_estimate): statistik database untuk tabel tanpa filter,
+    atau batas bawah (is_lower_bound) untuk queryset ber-filter.
+
+    Nomor halaman tidak dibatasi perkiraan; count dikoreksi dari jumlah baris
+    halaman yang dibuka (halaman pendek = halaman terakhir, halaman penuh di
+    ujung perkiraan = masih ada halaman berikutnya).
+    """
+
+    exact_count_limit = EXACT_COUNT_LIMIT
+    is_estimate = False
+    is_lower_bound = False
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not hasattr(queryset, 'query'):
+            return super().count
+
+        # COUNT dibatasi: SELECT COUNT(*) FROM (... LIMIT n)
+        bounded = queryset.order_by()[:self.exact_count_limit + 1].count()
+        if bounded <= self.exact_count_limit:
+            return bounded
+        self.is_estimate = True
+        if not queryset.query.where:
+            estimate = estimate_table_rows(queryset.model, queryset.db)
+            if estimate is not None and estimate >= bounded:
+                return estimate
+        self.is_lower_bound = True
+        return bounded
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if not self.is_estimate or int(number) < 1:
+                raise
+            # Perkiraan bisa lebih kecil dari jumlah sebenarnya
+            return int(number)
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.is_estimate:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        object_list = self.object_list[bottom:top]
+        # Dievaluasi di sini; hasilnya di-cache queryset dan dipakai ulang oleh pemanggil
+        rows = len(object_list)
+        if rows == self.per_page:
+            if top >= self.count:
+                self._set_count(top + 1, lower_bound=True)
+        elif rows or number == 1:
+            self._set_count(bottom + rows, estimate=False)
+        else:
+            # Halaman kosong di luar data: jumlah sebenarnya paling banyak `bottom`
+            self._set_count(min(self.count, bottom))
+        return self._get_page(object_list, number, self)
+
+    def _set_count(self, count, estimate=True, lower_bound=False):
+        self.__dict__['count'] = count
+        self.__dict__.pop('num_pages', None)
+        self.is_estimate = estimate
+        self.is_lower_bound = lower_bound
+
+
+class ScalableAdminMixin:
+    paginator = EstimatedCountPaginator
+    # Tanpa COUNT(*) kedua atas seluruh tabel untuk teks "x of y"
+    show_full_result_count = False
+
+    def get_list_select_related(self, request):
+        if self.list_select_related:
+            return self.list_select_related
+        related = []
+        for name in self.get_list_display(request):
+            if not isinstance(name, str):
+                continue
+            try:
+                field = self.model._meta.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            if field.many_to_one or field.one_to_one:
+                related.append(name)
+        return tuple(related)
+
+
+class AutocompleteFilter(admin.RelatedFieldListFilter):
+    """
+    Filter relasi tanpa memuat semua pilihan ke sidebar.
+    Model tujuan harus terdaftar di admin dengan search_fields.
+    """
+
+    template = 'admin/autocomplete_filter.html'
+
+    def field_choices(self, field, request, model_admin):
+        return []
+
+    def has_output(self):
+        return True
+
+    @cached_property
+    def selected_object(self):
+        value = self.lookup_val[-1] if self.lookup_val else None
+        if value in (None, ''):
+            return None
+        related_model = self.field.remote_field.model
+        try:
+            return related_model._default_manager.filter(
+                **{self.field.target_field.name: value}
+            ).first()
+        except (ValueError, TypeError):
+            return None
+
+    def autocomplete_url(self):
+        params = {
+            'app_label': self.field.model._meta.app_label,
+            'model_name': self.field.model._meta.model_name,
+            'field_name': self.field.name,
+        }
+        return f"{reverse('admin:autocomplete')}?{urlencode(params)}"
+
+    def choices(self, changelist):
+        # Parameter lain di query string dipertahankan saat filter dipilih
+        yield {
+            'autocomplete_url': self.autocomplete_url(),
+            'lookup_kwarg': self.lookup_kwarg,
+            'selected': self.selected_object,
+            'preserved': [
+                (key, value)
+                for key, value in changelist.params.items()
+                if key not in (self.lookup_kwarg, self.lookup_kwarg_isnull)
+            ],
+            'clear_query_string': changelist.get_query_string(
+                remove=[self.lookup_kwarg, self.lookup_kwarg_isnull]
+            ),
+        }
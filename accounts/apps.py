@@ -6,4 +6,21 @@ class AccountsConfig(AppConfig):
 
     def ready(self):
         # Import signals saat aplikasi dimuat
-        import accounts.signals
\ No newline at end of file
+        import accounts.signals
+        from django.core.signals import request_finished
+        from django.test.signals import setting_changed
+        from .activity import reset_activity_writer_on_setting_change, wake_activity_writer
+        from .throttle import report_login_throttle
+        from .tracking import reset_user_tracker_on_setting_change
+
+        # Laporan throttle login masuk antrean aktivitas sebelum antrean ditulis
+        request_finished.connect(report_login_throttle, dispatch_uid='accounts.report_login_throttle')
+        # Tulis antrean aktivitas di akhir request (di thread background)
+        request_finished.connect(wake_activity_writer, dispatch_uid='accounts.wake_activity_writer')
+        # Writer dan tracker dibuat ulang bila ACTIVITY_LOG/USER_TRACKING diganti (override_settings)
+        setting_changed.connect(
+            reset_activity_writer_on_setting_change, dispatch_uid='accounts.reset_activity_writer'
+        )
+        setting_changed.connect(
+            reset_user_tracker_on_setting_change, dispatch_uid='accounts.reset_user_tracker'
+        )
\ No newline at end of file
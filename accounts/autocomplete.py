@@ -0,0 +1,65 @@
+"""
+Pencarian user untuk typeahead (picker anggota tim, assignee task).
+
+Prefix dicari sebagai rentang (LOWER(kolom) >= 'abc' AND < 'abd') agar memakai
+index fungsional LOWER(...) di CustomUser.Meta, bukan LIKE yang memindai tabel.
+"""
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.http import JsonResponse
+
+PAGE_SIZE = 20
+MAX_PAGE = 25
+SEARCH_FIELDS = ('username', 'email', 'first_name', 'last_name')
+
+
+def prefix_range(prefix):
+    """
+    Batas bawah dan atas string yang diawali `prefix`
+    """
+    prefix = prefix.lower()
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def search_users(queryset, term):
+    """
+    Filter user yang username, email, nama depan, atau nama belakangnya diawali term
+    """
+    queryset = queryset.annotate(**{f'{field}_lower': Lower(field) for field in SEARCH_FIELDS})
+    term = term.strip()
+    if term:
+        lower, upper = prefix_range(term)
+        condition = Q()
+        for field in SEARCH_FIELDS:
+            condition |= Q(**{f'{field}_lower__gte': lower, f'{field}_lower__lt': upper})
+        queryset = queryset.filter(condition)
+    return queryset.order_by('username_lower', 'pk')
+
+
+def user_label(user):
+    return f'{user.get_full_name()} ({user.username})'
+
+
+def active_users():
+    return get_user_model()._default_manager.filter(is_active=True)
+
+
+def autocomplete_response(request, queryset):
+    """
+    JSON {"results": [{"id", "text"}], "pagination": {"more"}} untuk parameter q dan page
+    """
+    try:
+        page = min(max(int(request.GET.get('page', 1)), 1), MAX_PAGE)
+    except ValueError:
+        page = 1
+    offset = (page - 1) * PAGE_SIZE
+
+    users = list(
+        search_users(queryset, request.GET.get('q', ''))
+        .only('pk', 'username', 'email', 'first_name', 'last_name')[offset:offset + PAGE_SIZE + 1]
+    )
+    return JsonResponse({
+        'results': [{'id': str(user.pk), 'text': user_label(user)} for user in users[:PAGE_SIZE]],
+        'pagination': {'more': len(users) > PAGE_SIZE and page < MAX_PAGE},
+    })
@@ -1,18 +1,32 @@
 from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+from .snapshot import get_cached_user
+
+
+class CustomAuthBackend(ModelBackend):
+    """
+    Login dengan email. Tepat satu hash password per percobaan:
+    email yang tidak terdaftar tetap menjalankan satu hash dummy agar waktunya sama
+    """
 
-class CustomAuthBackend:
     def authenticate(self, request, email=None, password=None, **kwargs):
         User = get_user_model()
+        if email is None:
+            email = kwargs.get(User.USERNAME_FIELD)
+        if email is None or password is None:
+            return None
         try:
-            user = User.objects.get(email=email)
-            if user.check_password(password):
-                return user
+            user = User._default_manager.get(email=email)
         except User.DoesNotExist:
+            # Hash dummy: respons email tak terdaftar tidak lebih cepat
+            User().set_password(password)
             return None
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
 
     def get_user(self, user_id):
-        User = get_user_model()
-        try:
-            return User.objects.get(pk=user_id)
-        except User.DoesNotExist:
-            return None
\ No newline at end of file
+        # Dari snapshot cache: request biasa tidak men-query user maupun profile
+        user = get_cached_user(user_id)
+        return user if user is not None and self.user_can_authenticate(user) else None
@@ -2,7 +2,9 @@ from django import forms
 from django.contrib.auth import authenticate
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
 from django.forms import DateInput
+from .activity import get_client_ip
 from .models import CustomUser, UserProfile
+from .throttle import get_login_throttle
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import FileExtensionValidator
@@ -94,16 +96,37 @@ class CustomUserLoginForm(forms.Form):
         })
     )
 
+    def __init__(self, *args, request=None, **kwargs):
+        self.request = request
+        self.user_cache = None
+        super().__init__(*args, **kwargs)
+
     def clean(self):
         email = self.cleaned_data.get('email')
         password = self.cleaned_data.get('password')
 
         if email and password:
-            user = authenticate(email=email, password=password)
-            if user is None:
+            throttle = get_login_throttle()
+            ip = get_client_ip(self.request) if self.request else None
+            # Ditolak sebelum hashing agar serangan tidak menghabiskan CPU
+            if not throttle.allow(ip, email):
+                throttle.register_rejected(ip, email)
+                raise forms.ValidationError(
+                    _("Too many failed login attempts. Please try again later."),
+                    code='throttled',
+                )
+
+            # Satu-satunya pemeriksaan password; view memakai get_user()
+            self.user_cache = authenticate(self.request, email=email, password=password)
+            if self.user_cache is None:
+                throttle.register_failure(ip, email)
                 raise forms.ValidationError(_("Invalid email or password."))
+            throttle.register_success(ip, email)
         return self.cleaned_data
 
+    def get_user(self):
+        return self.user_cache
+
 
 class UserProfileForm(forms.ModelForm):
     birth_date = forms.DateField(
@@ -0,0 +1,110 @@
+"""
+Password hasher dengan penghitung pemanggilan.
+
+Hasher di bawah identik dengan bawaan Django (algoritma dan format hash sama),
+hanya menambah hitungan encode/verify. HasherCountMiddleware mengatur hitungan
+per request sehingga jumlah hash per login bisa dipantau.
+"""
+import contextvars
+import logging
+import threading
+from contextlib import contextmanager
+
+from django.contrib.auth import hashers
+
+logger = logging.getLogger(__name__)
+
+_request_count = contextvars.ContextVar('password_hash_count', default=None)
+_in_hasher = contextvars.ContextVar('password_hash_active', default=False)
+_totals_lock = threading.Lock()
+_totals = {'encode': 0, 'verify': 0}
+
+
+def _record(operation):
+    counter = _request_count.get()
+    if counter is not None:
+        counter[operation] += 1
+    with _totals_lock:
+        _totals[operation] += 1
+
+
+def hasher_totals():
+    """
+    Jumlah encode/verify sejak proses berjalan
+    """
+    with _totals_lock:
+        return dict(_totals)
+
+
+@contextmanager
+def count_hashes():
+    """
+    Hitung pemanggilan hasher di dalam blok; menghasilkan dict {'encode': n, 'verify': n}
+    """
+    counter = {'encode': 0, 'verify': 0}
+    token = _request_count.set(counter)
+    try:
+        yield counter
+    finally:
+        _request_count.reset(token)
+
+
+def _counted(operation, func, *args, **kwargs):
+    # verify() PBKDF2 memanggil encode(); satu verifikasi dihitung sekali
+    if _in_hasher.get():
+        return func(*args, **kwargs)
+    _record(operation)
+    token = _in_hasher.set(True)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _in_hasher.reset(token)
+
+
+class CountingHasherMixin:
+    def encode(self, password, salt, *args, **kwargs):
+        return _counted('encode', super().encode, password, salt, *args, **kwargs)
+
+    def verify(self, password, encoded):
+        return _counted('verify', super().verify, password, encoded)
+
+
+class PBKDF2PasswordHasher(CountingHasherMixin, hashers.PBKDF2PasswordHasher):
+    pass
+
+
+class PBKDF2SHA1PasswordHasher(CountingHasherMixin, hashers.PBKDF2SHA1PasswordHasher):
+    pass
+
+
+class Argon2PasswordHasher(CountingHasherMixin, hashers.Argon2PasswordHasher):
+    pass
+
+
+class BCryptSHA256PasswordHasher(CountingHasherMixin, hashers.BCryptSHA256PasswordHasher):
+    pass
+
+
+class ScryptPasswordHasher(CountingHasherMixin, hashers.ScryptPasswordHasher):
+    pass
+
+
+class HasherCountMiddleware:
+    """
+    Catat jumlah hash password per request (request.password_hashes)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with count_hashes() as counter:
+            request.password_hashes = counter
+            response = self.get_response(request)
+        total = counter['encode'] + counter['verify']
+        if total:
+            logger.debug(
+                '%s %s ran %d password hash(es) (encode=%d, verify=%d)',
+                request.method, request.path, total, counter['encode'], counter['verify'],
+            )
+        return response
@@ -0,0 +1,187 @@
+"""
+Pemrosesan gambar profil di luar request.
+
+UserProfile.save hanya menghitung hash konten upload; decode, resize, dan
+encode JPEG dikerjakan oleh pool proses setelah transaksi commit. Semua
+ukuran (PROFILE_IMAGE['SIZES']) dibuat dari satu kali decode.
+"""
+import hashlib
+import io
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from PIL import Image as PilImage, ImageOps
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'ASYNC': True,
+    'WORKERS': 2,
+    'SIZES': {'large': 300, 'medium': 150, 'small': 48},
+    'QUALITY': 85,
+}
+
+
+def get_image_settings():
+    from django.conf import settings
+
+    return {**DEFAULTS, **getattr(settings, 'PROFILE_IMAGE', {})}
+
+
+def hash_file(file, chunk_size=64 * 1024):
+    """
+    SHA-256 konten file upload tanpa decode gambar
+    """
+    digest = hashlib.sha256()
+    file.seek(0)
+    for chunk in iter(lambda: file.read(chunk_size), b''):
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def render_variants(data, sizes, quality=85):
+    """
+    Decode sekali lalu buat semua ukuran sebagai JPEG.
+    Fungsi murni (tanpa Django) agar bisa berjalan di proses worker.
+    """
+    largest = max(sizes.values())
+    img = PilImage.open(io.BytesIO(data))
+    # JPEG: decoder langsung menurunkan skala (1/2, 1/4, 1/8) saat decode
+    img.draft('RGB', (largest, largest))
+    img = ImageOps.exif_transpose(img).convert('RGB')
+
+    variants = {}
+    # Dari ukuran terbesar ke terkecil, setiap resize memakai hasil sebelumnya
+    for name, size in sorted(sizes.items(), key=lambda item: -item[1]):
+        img.thumbnail((size, size), PilImage.LANCZOS)
+        output = io.BytesIO()
+        img.save(output, format='JPEG', quality=quality, optimize=True)
+        variants[name] = output.getvalue()
+    return variants
+
+
+class ProfileImageProcessor:
+    def __init__(self, workers=2, background=True):
+        self.workers = workers
+        self.background = background
+        self._lock = threading.Lock()
+        self._dispatcher = None
+        self._pool = None
+
+    def _executors(self):
+        with self._lock:
+            if self._dispatcher is None:
+                self._dispatcher = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='profile-image'
+                )
+                # spawn: aman dipakai dari server yang sudah punya banyak thread
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                )
+        return self._dispatcher, self._pool
+
+    def submit(self, profile_id, digest, stale=()):
+        """
+        Jadwalkan pemrosesan; `stale` adalah file varian lama yang dihapus setelah selesai
+        """
+        if not self.background:
+            return self.process(profile_id, digest, stale)
+        dispatcher, _ = self._executors()
+        return dispatcher.submit(self._process_safely, profile_id, digest, stale)
+
+    def drain(self):
+        """
+        Tunggu sampai semua pekerjaan yang sudah dijadwalkan selesai
+        """
+        if self._dispatcher is not None:
+            self._dispatcher.submit(lambda: None).result()
+
+    def _process_safely(self, profile_id, digest, stale=()):
+        from django.db import close_old_connections
+
+        close_old_connections()
+        try:
+            return self.process(profile_id, digest, stale)
+        except Exception:
+            logger.exception('Profile image processing failed for profile %s', profile_id)
+        finally:
+            close_old_connections()
+
+    def process(self, profile_id, digest, stale=()):
+        """
+        Buat varian gambar untuk profile; dilewati bila upload sudah diganti lagi
+        """
+        from django.core.files.base import ContentFile
+        from django.core.files.storage import default_storage
+
+        from .models import UserProfile
+        from .snapshot import invalidate_user_snapshot
+
+        profile = UserProfile.objects.filter(pk=profile_id, profile_image_hash=digest).first()
+        if profile is None or not profile.profile_image:
+            return None
+
+        options = get_image_settings()
+        with profile.profile_image.open('rb') as source:
+            data = source.read()
+
+        if self.background:
+            _, pool = self._executors()
+            rendered = pool.submit(
+                render_variants, data, options['SIZES'], options['QUALITY']
+            ).result()
+        else:
+            rendered = render_variants(data, options['SIZES'], options['QUALITY'])
+
+        directory = profile_image_directory(profile)
+        variants = {}
+        for name, content in rendered.items():
+            path = f'{directory}/{digest[:16]}-{name}.jpg'
+            if default_storage.exists(path):
+                default_storage.delete(path)
+            variants[name] = default_storage.save(path, ContentFile(content))
+
+        main_image = variants.get('large') or next(iter(variants.values()))
+        updated = UserProfile.objects.filter(pk=profile_id, profile_image_hash=digest).update(
+            profile_image=main_image,
+            profile_image_variants=variants,
+        )
+        if updated:
+            # QuerySet.update() tidak memicu signal: snapshot user (accounts/snapshot.py)
+            # masih menunjuk ke file lama, hapus dulu sebelum file-nya dihapus
+            invalidate_user_snapshot(profile.user_id)
+            # Upload asli dan varian gambar sebelumnya tidak dipakai lagi
+            delete_files({profile.profile_image.name, *stale} - set(variants.values()))
+        return variants
+
+
+def delete_files(names):
+    from django.core.files.storage import default_storage
+
+    for name in names:
+        default_storage.delete(name)
+
+
+def profile_image_directory(profile):
+    return f'profile_images/{profile.user_id}'
+
+
+_processor = None
+_processor_lock = threading.Lock()
+
+
+def get_image_processor():
+    global _processor
+    if _processor is None:
+        with _processor_lock:
+            if _processor is None:
+                options = get_image_settings()
+                _processor = ProfileImageProcessor(
+                    workers=options['WORKERS'],
+                    background=options['ASYNC'],
+                )
+    return _processor
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+
+from accounts.retention import archive_activities, rollup_activities
+
+
+class Command(BaseCommand):
+    help = 'Rollup harian UserActivity dan arsipkan log mentah yang melewati masa retensi'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--retention-days',
+            type=int,
+            help='Simpan log mentah selama N hari (default: ACTIVITY_LOG["RETENTION_DAYS"])'
+        )
+        parser.add_argument(
+            '--max-days',
+            type=int,
+            help='Batasi jumlah hari yang diproses per langkah dalam satu run'
+        )
+        parser.add_argument(
+            '--rollup-only',
+            action='store_true',
+            help='Hanya buat ringkasan harian, jangan arsipkan/hapus log mentah'
+        )
+
+    def handle(self, *args, **options):
+        rolled = rollup_activities(max_days=options['max_days'])
+        self.stdout.write(f'Rolled up {len(rolled)} day(s).')
+
+        if options['rollup_only']:
+            return
+
+        archived = archive_activities(
+            retention_days=options['retention_days'],
+            max_days=options['max_days'],
+        )
+        for day, count in archived.items():
+            self.stdout.write(f'  {day}: {count} activities archived')
+        self.stdout.write(self.style.SUCCESS(
+            f'Archived {sum(archived.values())} activities from {len(archived)} day(s).'
+        ))
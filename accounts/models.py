@@ -11,12 +11,10 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Lower
 from .managers import CustomUserManager  # Import CustomUser Manager
 from enum import Enum
-from django.core.files.base import ContentFile
-from PIL import Image as PilImage
-import io
 
 def user_profile_image_path(instance, filename):
     ext = filename.split('.')[-1]
@@ -54,6 +52,9 @@ class CustomUser (AbstractBaseUser , PermissionsMixin):
     language_preference = models.CharField(_('language preference'), max_length=10, choices=LANGUAGE_CHOICES, default='en')
     theme = models.CharField(max_length=20, choices=THEME_CHOICES, default='default')
 
+    # Diperbarui oleh accounts.tracking (UPDATE massal), jangan ditimpa save() biasa
+    TRACKED_FIELDS = ('login_count', 'last_login_ip', 'last_activity')
+
     objects = CustomUserManager()
 
     USERNAME_FIELD = 'email'
@@ -63,11 +64,34 @@ class CustomUser (AbstractBaseUser , PermissionsMixin):
         verbose_name = _('user')
         verbose_name_plural = _('users')
         ordering = ['-date_joined']
-        indexes = [models.Index(fields=['email', 'username'])]
+        indexes = [
+            models.Index(fields=['email', 'username']),
+            # Pencarian prefix typeahead (accounts/autocomplete.py)
+            models.Index(Lower('username'), name='user_username_lower_idx'),
+            models.Index(Lower('email'), name='user_email_lower_idx'),
+            models.Index(Lower('first_name'), name='user_first_name_lower_idx'),
+            models.Index(Lower('last_name'), name='user_last_name_lower_idx'),
+        ]
 
     def __str__(self):
         return self.email
 
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            # Kolom deferred (misalnya user dari snapshot cache) tidak ditulis ulang
+            deferred = self.get_deferred_fields()
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.TRACKED_FIELDS
+                and field.attname not in deferred
+            ]
+        super().save(*args, **kwargs)
+
+    def get_session_auth_hash(self):
+        # User dari snapshot cache membawa hash sesi tanpa hash password
+        session_auth_hash = getattr(self, '_session_auth_hash', None)
+        return session_auth_hash or super().get_session_auth_hash()
+
     def get_all_users(self):
         """
         Metode untuk mendapatkan semua user
@@ -157,17 +181,56 @@ class UserProfile(models.Model):
         validators=[FileExtensionValidator(allowed_extensions=['jpg', 'jpeg', 'png', 'gif'])]
     )
 
+    # Diisi oleh accounts.images setelah upload diproses di luar request
+    profile_image_hash = models.CharField(max_length=64, blank=True, editable=False)
+    profile_image_variants = models.JSONField(default=dict, blank=True, editable=False)
+
     def save(self, *args, **kwargs):
-        if self.profile_image:
-            img = PilImage.open(self.profile_image)
-            img = img.convert('RGB')
-            img.thumbnail((300, 300))  # Mengubah ukuran gambar menjadi 300x300
-            img_io = io.BytesIO()
-            img.save(img_io, format='JPEG', quality=85)  # Menyimpan gambar dengan kualitas 85
-            img_file = ContentFile(img_io.getvalue(), name=self.profile_image.name)
-            self.profile_image = img_file
+        from .images import delete_files, get_image_processor, hash_file
+
+        digest = None
+        stale = list(self.profile_image_variants.values())
+        # Hanya upload baru yang diproses; save biasa tidak menyentuh gambar
+        if self.profile_image and not self.profile_image._committed:
+            digest = hash_file(self.profile_image)
+            if digest == self.profile_image_hash and self.profile_image_variants:
+                # Gambar yang sama diupload ulang: pakai hasil sebelumnya
+                self.profile_image = self.profile_image_variants.get('large', self.profile_image.name)
+                digest = None
+                stale = []
+            else:
+                self.profile_image_hash = digest
+                self.profile_image_variants = {}
+        elif not self.profile_image and self.profile_image_variants:
+            self.profile_image_hash = ''
+            self.profile_image_variants = {}
+        else:
+            stale = []
+
         super().save(*args, **kwargs)
 
+        if digest:
+            profile_id = self.pk
+            transaction.on_commit(
+                lambda: get_image_processor().submit(profile_id, digest, stale),
+                using=kwargs.get('using'),
+            )
+        elif stale:
+            transaction.on_commit(lambda: delete_files(stale), using=kwargs.get('using'))
+
+    def get_image_url(self, size='large'):
+        """
+        URL varian gambar profil; upload asli dipakai selama varian belum selesai diproses
+        """
+        name = self.profile_image_variants.get(size)
+        if name:
+            return self.profile_image.storage.url(name)
+        return self.profile_image.url if self.profile_image else ''
+
+    @property
+    def avatar_url(self):
+        return self.get_image_url('small')
+
     address = models.TextField(_('Address'), blank=True, null=True)
     city = models.CharField(_('City'), max_length=100, blank=True)
     country = models.CharField(_('Country'), max_length=100, blank=True)
@@ -229,7 +292,8 @@ class UserActivity(models.Model):
     ip_address = models.GenericIPAddressField(_('IP Address'), null=True, blank=True)
     user_agent = models.TextField(_('User  Agent'), blank=True, null=True)
     location = models.JSONField(_('Location Information'), null=True, blank=True)
-    timestamp = models.DateTimeField(_('Timestamp'), auto_now_add=True, db_index=True)
+    # default (bukan auto_now_add) agar waktu event tetap benar saat ditulis belakangan secara batch
+    timestamp = models.DateTimeField(_('Timestamp'), default=timezone.now, db_index=True)
     additional_info = models.JSONField(_('Additional Information'), null=True, blank=True)
     is_suspicious = models.BooleanField(_('Suspicious Activity'), default=False)
 
@@ -238,7 +302,12 @@ class UserActivity(models.Model):
 
     @classmethod
     def log_activity(cls, user, activity_type, ip_address=None, user_agent=None, location=None, additional_info=None, severity=SeverityLevel.INFO.value, is_suspicious=False):
-        return cls.objects.create(
+        """
+        Catat aktivitas lewat antrean batch; request tidak menunggu INSERT
+        """
+        from .activity import get_activity_writer
+
+        activity = cls(
             user=user,
             activity_type=activity_type,
             ip_address=ip_address,
@@ -248,6 +317,11 @@ class UserActivity(models.Model):
             severity=severity,
             is_suspicious=is_suspicious
         )
+        writer = get_activity_writer()
+        writer.submit(activity)
+        if not writer.background:
+            writer.flush()
+        return activity
 
     @classmethod
     def get_user_activities(cls, user, activity_type=None, days=30):
@@ -267,12 +341,52 @@ class UserActivity(models.Model):
         ordering = ['-timestamp']
         indexes = [
             models.Index(fields=['user', 'activity_type', 'timestamp']),
+            models.Index(fields=['user', 'timestamp']),
             models.Index(fields=['is_suspicious', 'timestamp']),
         ]
         constraints = [
             models.UniqueConstraint(fields=['user', 'activity_type', 'timestamp'], name='unique_user_activity')
         ]
 
+
+class UserActivityDaily(models.Model):
+    """
+    Ringkasan harian UserActivity per user dan tipe (hasil rollup, lihat accounts/retention.py)
+    """
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='daily_activities', verbose_name=_('User '))
+    activity_type = models.CharField(_('Activity Type'), max_length=30, choices=[(tag.value, tag.name) for tag in UserActivity.ActivityType])
+    date = models.DateField(_('Date'))
+    count = models.PositiveIntegerField(_('Count'), default=0)
+    suspicious_count = models.PositiveIntegerField(_('Suspicious Count'), default=0)
+
+    def __str__(self):
+        return f"{self.user_id} - {self.activity_type} on {self.date}: {self.count}"
+
+    @classmethod
+    def get_user_summary(cls, user, days=365):
+        """
+        Jumlah aktivitas per tipe untuk periode panjang, tanpa membaca log mentah
+        """
+        cutoff_date = timezone.now().date() - timezone.timedelta(days=days)
+        return (
+            cls.objects.filter(user=user, date__gte=cutoff_date)
+            .values('activity_type')
+            .annotate(total=models.Sum('count'), suspicious=models.Sum('suspicious_count'))
+            .order_by('activity_type')
+        )
+
+    class Meta:
+        verbose_name = _('Daily User Activity')
+        verbose_name_plural = _('Daily User Activities')
+        ordering = ['-date']
+        indexes = [
+            models.Index(fields=['user', 'date']),
+            models.Index(fields=['date']),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'activity_type', 'date'], name='unique_user_activity_daily')
+        ]
+
 # next bakalalah di pindah ke Signal.py
 
 @receiver(post_save, sender=User)
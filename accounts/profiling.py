@@ -0,0 +1,214 @@
+"""
+Profiling SQL per request.
+
+QueryProfilingMiddleware memasang execute_wrapper di setiap koneksi database
+selama request dan mencatat jumlah query, total waktu SQL, fingerprint query
+yang berulang (kandidat N+1), serta waktu view. Hasilnya dikirim sebagai
+header Server-Timing, baris log terstruktur, dan request yang lambat disimpan
+di ring buffer per proses (lihat halaman staff profiling_report).
+
+Query yang dijalankan saat StreamingHttpResponse dikonsumsi tidak terhitung.
+"""
+import hashlib
+import logging
+import re
+import threading
+from collections import Counter, deque
+from contextlib import ExitStack
+from time import perf_counter
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'ENABLED': True,
+    # 'all', 'staff', atau None: siapa yang menerima header Server-Timing
+    'SERVER_TIMING': 'staff',
+    'BUFFER_SIZE': 100,
+    # Request masuk ring buffer bila salah satu batas ini terlampaui
+    'SLOW_REQUEST_MS': 300,
+    'SLOW_QUERY_COUNT': 50,
+    # Fingerprint yang muncul sebanyak ini atau lebih dianggap duplikat
+    'DUPLICATE_THRESHOLD': 2,
+    'MAX_DUPLICATES': 5,
+}
+
+_IN_LIST = re.compile(r'\((?:%s, )+%s\)')
+_NUMBER = re.compile(r'\b\d+\b')
+SAMPLE_LENGTH = 300
+
+
+def get_profiling_settings():
+    return {**DEFAULTS, **getattr(settings, 'QUERY_PROFILING', {})}
+
+
+def normalize_sql(sql):
+    """
+    SQL tanpa perbedaan panjang IN (...) dan angka literal (LIMIT/OFFSET)
+    """
+    return _NUMBER.sub('N', _IN_LIST.sub('(%s...)', sql))
+
+
+def fingerprint(sql):
+    return hashlib.md5(normalize_sql(sql).encode()).hexdigest()[:12]
+
+
+class RequestProfile:
+    """
+    Execute wrapper yang mengakumulasi statistik query satu request
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.sql_time = 0.0
+        self.fingerprints = Counter()
+        self.samples = {}
+        self.view_name = None
+        self.view_started = None
+
+    def __call__(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_time += perf_counter() - started
+            self.queries += 1
+            key = fingerprint(sql)
+            self.fingerprints[key] += 1
+            self.samples.setdefault(key, sql[:SAMPLE_LENGTH])
+
+    def duplicates(self, threshold=2, limit=5):
+        return [
+            {'fingerprint': key, 'count': count, 'sql': self.samples[key]}
+            for key, count in self.fingerprints.most_common(limit)
+            if count >= threshold
+        ]
+
+
+class ProfileBuffer:
+    """
+    Ring buffer request lambat (per proses)
+    """
+
+    def __init__(self, size=100):
+        self._entries = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, entry):
+        with self._lock:
+            self._entries.append(entry)
+
+    def slowest(self, limit=None):
+        with self._lock:
+            entries = sorted(self._entries, key=lambda entry: entry['total_ms'], reverse=True)
+        return entries[:limit] if limit else entries
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_profile_buffer():
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = ProfileBuffer(size=get_profiling_settings()['BUFFER_SIZE'])
+    return _buffer
+
+
+def server_timing(entry):
+    duplicated = sum(item['count'] for item in entry['duplicates'])
+    return ', '.join([
+        f'sql;dur={entry["sql_ms"]:.2f};desc="{entry["queries"]} queries, {duplicated} duplicated"',
+        f'view;dur={entry["view_ms"]:.2f}',
+        f'total;dur={entry["total_ms"]:.2f}',
+    ])
+
+
+class QueryProfilingMiddleware:
+    """
+    Letakkan paling atas di MIDDLEWARE agar query session/auth ikut terhitung
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.options = get_profiling_settings()
+        if not self.options['ENABLED']:
+            raise MiddlewareNotUsed
+
+    def __call__(self, request):
+        profile = RequestProfile()
+        request.query_profile = profile
+        started = perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(profile))
+            response = self.get_response(request)
+        finished = perf_counter()
+
+        entry = self.build_entry(request, response, profile, started, finished)
+        if self.show_header(request):
+            response['Server-Timing'] = server_timing(entry)
+        self.report(entry)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        profile = request.query_profile
+        match = request.resolver_match
+        profile.view_name = match.view_name if match else view_func.__qualname__
+        profile.view_started = perf_counter()
+
+    def build_entry(self, request, response, profile, started, finished):
+        view_started = profile.view_started or finished
+        return {
+            'timestamp': timezone.now(),
+            'method': request.method,
+            'path': request.path,
+            'view': profile.view_name,
+            'status': response.status_code,
+            'queries': profile.queries,
+            'sql_ms': profile.sql_time * 1000,
+            'view_ms': (finished - view_started) * 1000,
+            'total_ms': (finished - started) * 1000,
+            'duplicates': profile.duplicates(
+                self.options['DUPLICATE_THRESHOLD'], self.options['MAX_DUPLICATES']
+            ),
+        }
+
+    def show_header(self, request):
+        audience = self.options['SERVER_TIMING']
+        if audience == 'all':
+            return True
+        if audience == 'staff':
+            user = getattr(request, 'user', None)
+            return bool(user is not None and user.is_authenticated and user.is_staff)
+        return False
+
+    def report(self, entry):
+        slow = (
+            entry['total_ms'] >= self.options['SLOW_REQUEST_MS']
+            or entry['queries'] >= self.options['SLOW_QUERY_COUNT']
+        )
+        logger.log(
+            logging.WARNING if slow else logging.INFO,
+            'request method=%s path=%s view=%s status=%s queries=%d sql_ms=%.1f view_ms=%.1f '
+            'total_ms=%.1f duplicates=%d',
+            entry['method'], entry['path'], entry['view'], entry['status'], entry['queries'],
+            entry['sql_ms'], entry['view_ms'], entry['total_ms'], len(entry['duplicates']),
+            extra={'profile': entry},
+        )
+        if slow:
+            get_profile_buffer().record(entry)
@@ -0,0 +1,182 @@
+"""
+Rollup harian dan retensi UserActivity.
+
+1. rollup_activities: hari yang sudah lengkap (sebelum hari ini) diringkas ke
+   UserActivityDaily, mulai dari hari terakhir yang sudah di-rollup.
+2. archive_activities: log mentah yang lebih tua dari RETENTION_DAYS ditulis ke
+   file JSONL gzip per hari, lalu dihapus dari tabel.
+
+Keduanya bekerja per hari sehingga bisa dijalankan bertahap (--max-days).
+"""
+import datetime
+import gzip
+import json
+import os
+from pathlib import Path
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Count, Max, Min, Q
+from django.utils import timezone
+
+from .activity import get_activity_settings
+from .models import UserActivity, UserActivityDaily
+
+ARCHIVE_FIELDS = (
+    'id', 'user_id', 'activity_type', 'severity', 'ip_address', 'user_agent',
+    'location', 'timestamp', 'additional_info', 'is_suspicious',
+)
+
+
+def day_bounds(day):
+    start = datetime.datetime.combine(day, datetime.time.min, tzinfo=datetime.timezone.utc)
+    return start, start + datetime.timedelta(days=1)
+
+
+def _date_of(value):
+    return timezone.localtime(value, datetime.timezone.utc).date()
+
+
+def get_archive_dir():
+    archive_dir = get_activity_settings()['ARCHIVE_DIR']
+    return Path(archive_dir or settings.BASE_DIR / 'activity_archive')
+
+
+def rollup_day(day):
+    """
+    Ringkas satu hari log mentah ke UserActivityDaily (idempoten)
+    """
+    start, end = day_bounds(day)
+    rows = (
+        UserActivity.objects.filter(timestamp__gte=start, timestamp__lt=end)
+        .order_by()
+        .values('user_id', 'activity_type')
+        .annotate(count=Count('pk'), suspicious_count=Count('pk', filter=Q(is_suspicious=True)))
+    )
+    summaries = [
+        UserActivityDaily(
+            user_id=row['user_id'],
+            activity_type=row['activity_type'],
+            date=day,
+            count=row['count'],
+            suspicious_count=row['suspicious_count'],
+        )
+        for row in rows
+    ]
+    UserActivityDaily.objects.bulk_create(
+        summaries,
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=['user', 'activity_type', 'date'],
+        update_fields=['count', 'suspicious_count'],
+    )
+    return len(summaries)
+
+
+def rollup_activities(until=None, max_days=None):
+    """
+    Rollup hari-hari yang belum diringkas, sampai sebelum `until` (default: hari ini)
+    """
+    until = until or timezone.now().date()
+    last_rolled = UserActivityDaily.objects.aggregate(last=Max('date'))['last']
+    if last_rolled:
+        day = last_rolled + datetime.timedelta(days=1)
+    else:
+        first = UserActivity.objects.aggregate(first=Min('timestamp'))['first']
+        if first is None:
+            return []
+        day = _date_of(first)
+
+    rolled = []
+    while day < until and (max_days is None or len(rolled) < max_days):
+        rollup_day(day)
+        rolled.append(day)
+        day += datetime.timedelta(days=1)
+    return rolled
+
+
+def _archive_path(archive_dir, day):
+    return archive_dir / f'{day:%Y}' / f'{day:%m}' / f'user-activity-{day.isoformat()}.jsonl.gz'
+
+
+def _finalize_archive(partial, path):
+    # Gabungkan ke arsip yang sudah ada (member gzip boleh disambung)
+    if path.exists():
+        with open(path, 'ab') as target, open(partial, 'rb') as source:
+            target.write(source.read())
+        partial.unlink()
+    else:
+        os.replace(partial, path)
+
+
+def recover_partial_archives(archive_dir=None):
+    """
+    Selesaikan file .partial dari run yang terhenti.
+    Bila log mentah hari itu sudah terhapus, file partial adalah satu-satunya salinan.
+    """
+    archive_dir = archive_dir or get_archive_dir()
+    for partial in archive_dir.glob('*/*/user-activity-*.jsonl.gz.partial'):
+        day = datetime.date.fromisoformat(partial.name[len('user-activity-'):][:10])
+        start, end = day_bounds(day)
+        if UserActivity.objects.filter(timestamp__gte=start, timestamp__lt=end).exists():
+            # DELETE belum commit: baris akan ditulis ulang
+            partial.unlink()
+        else:
+            _finalize_archive(partial, _archive_path(archive_dir, day))
+
+
+def archive_day(day, archive_dir=None, chunk_size=2000):
+    """
+    Pindahkan log mentah satu hari ke file JSONL gzip lalu hapus dari database
+    """
+    archive_dir = archive_dir or get_archive_dir()
+    start, end = day_bounds(day)
+    queryset = UserActivity.objects.filter(timestamp__gte=start, timestamp__lt=end)
+
+    path = _archive_path(archive_dir, day)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + '.partial')
+
+    written = 0
+    with gzip.open(partial, 'wt', encoding='utf-8') as archive:
+        rows = queryset.order_by().values_list(*ARCHIVE_FIELDS).iterator(chunk_size=chunk_size)
+        for row in rows:
+            archive.write(json.dumps(dict(zip(ARCHIVE_FIELDS, row)), cls=DjangoJSONEncoder))
+            archive.write('\n')
+            written += 1
+
+    if not written:
+        partial.unlink()
+        return 0
+
+    with transaction.atomic():
+        queryset.delete()
+    _finalize_archive(partial, path)
+    return written
+
+
+def archive_activities(retention_days=None, max_days=None, archive_dir=None):
+    """
+    Arsipkan semua hari yang lebih tua dari batas retensi; mengembalikan {tanggal: jumlah baris}
+    """
+    if retention_days is None:
+        retention_days = get_activity_settings()['RETENTION_DAYS']
+    cutoff = timezone.now().date() - datetime.timedelta(days=retention_days)
+
+    archive_dir = archive_dir or get_archive_dir()
+    recover_partial_archives(archive_dir)
+
+    # Pastikan ringkasan harian ada sebelum log mentahnya dihapus
+    rollup_activities(until=cutoff)
+
+    archived = {}
+    while max_days is None or len(archived) < max_days:
+        first = UserActivity.objects.filter(
+            timestamp__lt=day_bounds(cutoff)[0]
+        ).aggregate(first=Min('timestamp'))['first']
+        if first is None:
+            break
+        day = _date_of(first)
+        archived[day] = archive_day(day, archive_dir=archive_dir)
+    return archived
@@ -1,8 +1,9 @@
 # accounts/signals.py
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.contrib.auth.models import User
-from .models import Profile  # Import langsung dari .models
+from .models import CustomUser, UserProfile as Profile  # Import langsung dari .models
+from .snapshot import invalidate_on_commit
 
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
@@ -19,4 +20,12 @@ def save_user_profile(sender, instance, **kwargs):
     try:
         instance.profile.save()
     except Profile.DoesNotExist:
-        Profile.objects.create(user=instance)
\ No newline at end of file
+        Profile.objects.create(user=instance)
+
+@receiver([post_save, post_delete], sender=CustomUser)
+def invalidate_user_snapshot_on_user_change(sender, instance, using, **kwargs):
+    invalidate_on_commit(instance.pk, using=using)
+
+@receiver([post_save, post_delete], sender=Profile)
+def invalidate_user_snapshot_on_profile_change(sender, instance, using, **kwargs):
+    invalidate_on_commit(instance.user_id, using=using)
@@ -0,0 +1,94 @@
+"""
+Snapshot user per request dari cache.
+
+CustomAuthBackend.get_user membangun user (beserta UserProfile) dari
+snapshot di cache, bukan dari database. Snapshot hanya berisi kolom yang
+dibaca autentikasi, middleware, dan template (USER_FIELDS, PROFILE_FIELDS);
+hash password tidak ikut disimpan, hanya hash sesi turunannya (nilai yang
+sama sudah tersimpan di session). Kolom lain ditangguhkan (deferred) dan
+dimuat dari database bila dibaca.
+
+Snapshot dihapus setelah commit setiap kali CustomUser atau UserProfile
+disimpan/dihapus. Perubahan lewat QuerySet.update() tidak terdeteksi; kolom
+yang diubah dengan cara itu (statistik login) boleh tertinggal sampai
+SNAPSHOT_TIMEOUT. Penulis yang mengubah kolom snapshot lewat update()
+(misalnya gambar profil di accounts/images.py) memanggil
+invalidate_user_snapshot sendiri.
+"""
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+SNAPSHOT_TIMEOUT = 300
+
+USER_FIELDS = (
+    'id', 'email', 'username', 'first_name', 'last_name', 'last_login', 'is_active', 'is_staff',
+    'is_superuser', 'is_verified', 'two_factor_enabled', 'language_preference', 'theme',
+)
+# Avatar di base.html
+PROFILE_FIELDS = ('id', 'user_id', 'profile_image', 'profile_image_variants')
+
+
+def snapshot_key(user_id):
+    return f'accounts:user_snapshot:{user_id}'
+
+
+def load_snapshot(user_id):
+    """
+    Query tunggal: kolom snapshot user dan profile-nya (profile None bila belum dibuat)
+    """
+    User = get_user_model()
+    profile_lookups = [f'profile__{name}' for name in PROFILE_FIELDS]
+    try:
+        row = User._default_manager.values(*USER_FIELDS, 'password', *profile_lookups).get(pk=user_id)
+    except (User.DoesNotExist, ValueError, ValidationError):
+        return None
+
+    password = row.pop('password')
+    profile = {name: row.pop(lookup) for name, lookup in zip(PROFILE_FIELDS, profile_lookups)}
+    return {
+        'user': row,
+        'profile': profile if profile['id'] is not None else None,
+        'session_auth_hash': User(password=password).get_session_auth_hash(),
+    }
+
+
+def _from_values(model, values):
+    # Urutan nilai harus mengikuti concrete_fields; kolom lain menjadi deferred
+    names = [field.attname for field in model._meta.concrete_fields if field.attname in values]
+    return model.from_db(DEFAULT_DB_ALIAS, names, [values[name] for name in names])
+
+
+def build_user(snapshot):
+    User = get_user_model()
+    user = _from_values(User, snapshot['user'])
+    user._session_auth_hash = snapshot['session_auth_hash']
+
+    related = User._meta.get_field('profile')
+    profile = None
+    if snapshot['profile'] is not None:
+        profile = _from_values(related.related_model, snapshot['profile'])
+        related.field.set_cached_value(profile, user)
+    # Cache None: user.profile langsung DoesNotExist tanpa query
+    related.set_cached_value(user, profile)
+    return user
+
+
+def get_cached_user(user_id):
+    key = snapshot_key(user_id)
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = load_snapshot(user_id)
+        if snapshot is None:
+            return None
+        cache.set(key, snapshot, SNAPSHOT_TIMEOUT)
+    return build_user(snapshot)
+
+
+def invalidate_user_snapshot(*user_ids):
+    cache.delete_many([snapshot_key(user_id) for user_id in user_ids if user_id])
+
+
+def invalidate_on_commit(*user_ids, using=None):
+    transaction.on_commit(lambda: invalidate_user_snapshot(*user_ids), using=using)
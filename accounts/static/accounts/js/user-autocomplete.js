@@ -0,0 +1,72 @@
+// Typeahead untuk <select data-autocomplete-url>: hanya pilihan terpilih yang ada di <option>.
+// Format respons: {"results": [{"id", "text"}], "pagination": {"more"}} (juga endpoint autocomplete admin)
+document.addEventListener('DOMContentLoaded', function () {
+    document.querySelectorAll('select[data-autocomplete-url]').forEach(function (select) {
+        // File ini bisa dimuat lebih dari sekali (misalnya beberapa filter admin)
+        if (select.dataset.autocompleteReady) return;
+        select.dataset.autocompleteReady = '1';
+
+        const url = select.dataset.autocompleteUrl;
+        const param = select.dataset.autocompleteParam || 'q';
+        const input = document.createElement('input');
+        const list = document.createElement('div');
+        let timer = null;
+
+        input.type = 'search';
+        input.className = 'form-control mb-1';
+        input.placeholder = select.dataset.autocompletePlaceholder || 'Search...';
+        list.className = 'list-group mb-2';
+        select.parentNode.insertBefore(input, select);
+        select.parentNode.insertBefore(list, select);
+
+        function choose(item) {
+            let option = Array.from(select.options).find(function (opt) { return opt.value === item.id; });
+            if (!option) {
+                option = new Option(item.text, item.id);
+                if (!select.multiple) {
+                    Array.from(select.options).forEach(function (opt) { if (opt.value) opt.remove(); });
+                }
+                select.add(option);
+            }
+            option.selected = true;
+            list.innerHTML = '';
+            input.value = '';
+            select.dispatchEvent(new Event('change'));
+        }
+
+        function search(page) {
+            const params = new URLSearchParams({page: page});
+            params.set(param, input.value);
+            fetch(url + (url.indexOf('?') === -1 ? '?' : '&') + params, {headers: {'Accept': 'application/json'}})
+                .then(function (response) { return response.json(); })
+                .then(function (data) {
+                    if (page === 1) list.innerHTML = '';
+                    data.results.forEach(function (item) {
+                        const button = document.createElement('button');
+                        button.type = 'button';
+                        button.className = 'list-group-item list-group-item-action';
+                        button.textContent = item.text;
+                        button.addEventListener('click', function () { choose(item); });
+                        list.appendChild(button);
+                    });
+                    if (data.pagination.more) {
+                        const more = document.createElement('button');
+                        more.type = 'button';
+                        more.className = 'list-group-item list-group-item-light';
+                        more.textContent = '...';
+                        more.addEventListener('click', function () { more.remove(); search(page + 1); });
+                        list.appendChild(more);
+                    }
+                });
+        }
+
+        input.addEventListener('input', function () {
+            clearTimeout(timer);
+            if (!input.value.trim()) {
+                list.innerHTML = '';
+                return;
+            }
+            timer = setTimeout(function () { search(1); }, 250);
+        });
+    });
+});
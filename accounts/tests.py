@@ -1,3 +1,559 @@
-from django.test import TestCase
+import datetime
+import gzip
+import io
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django import forms
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.cache import cache
+from django.db import DatabaseError, connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from PIL import Image as PilImage
+
+from . import images
+from .autocomplete import PAGE_SIZE, active_users, search_users
+from .hashers import count_hashes
+from .activity import ActivityWriter, get_activity_writer
+from .models import UserActivity, UserActivityDaily, UserProfile
+from .snapshot import get_cached_user, snapshot_key
+from .tracking import UserTracker, get_user_tracker
+from .widgets import UserAutocompleteSelectMultiple
+from .throttle import CacheStore, LoginThrottle, MemoryStore
+from .retention import archive_activities
+from .profiling import RequestProfile, fingerprint, get_profile_buffer
+
+
+def create_user(username, password='secret-pass-123'):
+    return get_user_model().objects.create_user(
+        email=f'{username}@example.com',
+        username=username,
+        password=password
+    )
+
+
+class ActivityWriterTest(TestCase):
+    def setUp(self):
+        self.user = create_user('auditor')
+
+    def make_activity(self, activity_type=UserActivity.ActivityType.LOGIN.value, **kwargs):
+        return UserActivity(user=self.user, activity_type=activity_type, **kwargs)
+
+    def test_flush_writes_in_batches(self):
+        writer = ActivityWriter(batch_size=3, background=False)
+        for _ in range(7):
+            writer.submit(self.make_activity())
+
+        with self.assertNumQueries(3):
+            self.assertEqual(writer.flush(), 7)
+        self.assertEqual(UserActivity.objects.filter(user=self.user).count(), 7)
+        self.assertEqual(writer.stats()['flushes'], 3)
+
+    def test_queue_is_bounded(self):
+        writer = ActivityWriter(max_queue=2, background=False)
+        results = [writer.submit(self.make_activity()) for _ in range(5)]
+        self.assertEqual(results, [True, True, False, False, False])
+        self.assertEqual(writer.stats()['dropped'], 3)
+        self.assertEqual(writer.stats()['pending'], 2)
+
+    def test_duplicate_event_does_not_fail_batch(self):
+        timestamp = timezone.now()
+        writer = ActivityWriter(background=False)
+        writer.submit(self.make_activity(timestamp=timestamp))
+        writer.submit(self.make_activity(timestamp=timestamp))
+        writer.submit(self.make_activity(UserActivity.ActivityType.LOGOUT.value))
+        writer.flush()
+        self.assertEqual(UserActivity.objects.filter(user=self.user).count(), 2)
+        self.assertEqual(writer.stats()['failed'], 0)
+
+    def test_writer_is_synchronous_under_test_runner(self):
+        self.assertFalse(get_activity_writer().background)
+
+    def test_override_settings_replaces_and_stops_writer(self):
+        with override_settings(ACTIVITY_LOG={'ASYNC': True, 'FLUSH_INTERVAL': 3600}):
+            writer = get_activity_writer()
+            self.assertTrue(writer.background)
+            writer.submit(self.make_activity())
+            thread = writer._thread
+            self.assertTrue(thread.is_alive())
+
+        # Thread berhenti tanpa menulis; sisa antrean ditulis di thread test
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(writer.stats()['pending'], 0)
+        self.assertTrue(UserActivity.objects.filter(user=self.user).exists())
+        self.assertIsNot(get_activity_writer(), writer)
+        self.assertFalse(get_activity_writer().background)
+
+
+class ActivityRetentionTest(TestCase):
+    def setUp(self):
+        self.user = create_user('retention')
+        self.archive_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.archive_dir)
+        now = timezone.now()
+        self.old_day = (now - datetime.timedelta(days=100)).date()
+        old = datetime.datetime.combine(self.old_day, datetime.time(10), tzinfo=datetime.timezone.utc)
+        activities = [
+            UserActivity(user=self.user, activity_type='LOGIN', timestamp=old + datetime.timedelta(minutes=i))
+            for i in range(3)
+        ]
+        activities.append(UserActivity(
+            user=self.user, activity_type='UNAUTHORIZED_ACCESS',
+            timestamp=old, is_suspicious=True
+        ))
+        activities.append(UserActivity(user=self.user, activity_type='LOGIN', timestamp=now))
+        UserActivity.objects.bulk_create(activities)
+
+    def test_archive_rolls_up_and_moves_old_rows(self):
+        archived = archive_activities(retention_days=90, archive_dir=self.archive_dir)
+
+        self.assertEqual(archived, {self.old_day: 4})
+        self.assertEqual(UserActivity.objects.filter(user=self.user).count(), 1)
+
+        daily = {
+            row.activity_type: row
+            for row in UserActivityDaily.objects.filter(user=self.user, date=self.old_day)
+        }
+        self.assertEqual(daily['LOGIN'].count, 3)
+        self.assertEqual(daily['UNAUTHORIZED_ACCESS'].suspicious_count, 1)
+
+        archive_file = next(self.archive_dir.glob('*/*/*.jsonl.gz'))
+        with gzip.open(archive_file, 'rt') as archive:
+            rows = [json.loads(line) for line in archive]
+        self.assertEqual(len(rows), 4)
+        self.assertEqual({row['user_id'] for row in rows}, {str(self.user.pk)})
+
+        # Run berikutnya tidak mengulang pekerjaan
+        self.assertEqual(archive_activities(retention_days=90, archive_dir=self.archive_dir), {})
+
+
+def make_upload(color='red', size=(800, 600), name='avatar.jpg'):
+    output = io.BytesIO()
+    PilImage.new('RGB', size, color).save(output, format='JPEG')
+    return SimpleUploadedFile(name, output.getvalue(), content_type='image/jpeg')
+
+
+class ProfileImageProcessingTest(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=self.media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+        processor = images.ProfileImageProcessor(background=False)
+        patcher = mock.patch.object(images, 'get_image_processor', return_value=processor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.profile = UserProfile.objects.create(user=create_user('painter'))
+
+    def upload(self, **kwargs):
+        self.profile.profile_image = make_upload(**kwargs)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile.save()
+        self.profile.refresh_from_db()
+
+    def test_variants_are_created_after_commit(self):
+        self.upload()
+
+        variants = self.profile.profile_image_variants
+        self.assertEqual(set(variants), {'large', 'medium', 'small'})
+        self.assertEqual(self.profile.profile_image.name, variants['large'])
+        with self.profile.profile_image.storage.open(variants['small']) as small:
+            self.assertEqual(max(PilImage.open(small).size), 48)
+        with self.profile.profile_image.open('rb') as large:
+            self.assertEqual(PilImage.open(large).size, (300, 225))
+
+    def test_same_content_is_not_processed_again(self):
+        self.upload()
+        variants = self.profile.profile_image_variants
+
+        with mock.patch.object(images, 'render_variants', wraps=images.render_variants) as render:
+            self.upload()
+            self.profile.bio = 'Tanpa gambar baru'
+            with self.captureOnCommitCallbacks(execute=True):
+                self.profile.save()
+        render.assert_not_called()
+        self.assertEqual(self.profile.profile_image_variants, variants)
+
+    def test_new_image_replaces_old_variants(self):
+        self.upload()
+        old_variants = self.profile.profile_image_variants
+
+        self.upload(color='blue')
+        storage = self.profile.profile_image.storage
+        self.assertNotEqual(self.profile.profile_image_variants, old_variants)
+        self.assertFalse(any(storage.exists(name) for name in old_variants.values()))
+
+    def test_processing_invalidates_cached_avatar(self):
+        processor = images.get_image_processor()
+        with mock.patch.object(processor, 'submit') as submit:
+            self.upload()
+        original = self.profile.profile_image.name
+        # Snapshot terisi dengan upload asli sebelum varian selesai diproses
+        self.assertEqual(get_cached_user(self.profile.user_id).profile.profile_image.name, original)
+
+        variants = processor.process(*submit.call_args.args)
+        profile = get_cached_user(self.profile.user_id).profile
+        self.assertEqual(profile.profile_image.name, variants['large'])
+        self.assertEqual(profile.avatar_url, profile.profile_image.storage.url(variants['small']))
+        self.assertFalse(profile.profile_image.storage.exists(original))
+
+
+class LoginHashingTest(TestCase):
+    def setUp(self):
+        self.user = create_user('signer')
+
+    def login(self, email, password):
+        response = self.client.post(reverse('login'), {'email': email, 'password': password})
+        return response, response.wsgi_request.password_hashes
+
+    def test_successful_login_hashes_once(self):
+        response, hashes = self.login('signer@example.com', 'secret-pass-123')
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(hashes, {'encode': 0, 'verify': 1})
+        self.assertEqual(response.wsgi_request.user.pk, self.user.pk)
+
+    def test_wrong_password_hashes_once(self):
+        response, hashes = self.login('signer@example.com', 'wrong-pass')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(hashes, {'encode': 0, 'verify': 1})
+
+    def test_unknown_email_runs_dummy_hash(self):
+        response, hashes = self.login('nobody@example.com', 'secret-pass-123')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(hashes, {'encode': 1, 'verify': 0})
+
+    def test_count_hashes_context(self):
+        with count_hashes() as hashes:
+            self.user.check_password('secret-pass-123')
+        self.assertEqual(hashes['verify'], 1)
+
+
+class LoginThrottleTest(TestCase):
+    def setUp(self):
+        self.user = create_user('target')
+        self.throttle = LoginThrottle(MemoryStore(), window=60, ip_limit=5, email_limit=2, report_interval=0)
+        patcher = mock.patch('accounts.forms.get_login_throttle', return_value=self.throttle)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def login(self, password, email='target@example.com', ip='10.0.0.1'):
+        response = self.client.post(
+            reverse('login'), {'email': email, 'password': password}, REMOTE_ADDR=ip
+        )
+        return response, response.wsgi_request.password_hashes
+
+    def test_over_limit_attempts_are_rejected_before_hashing(self):
+        self.login('wrong-1')
+        self.login('wrong-2')
+
+        response, hashes = self.login('secret-pass-123')
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(hashes, {'encode': 0, 'verify': 0})
+        self.assertEqual(self.throttle.stats()['hashed'], 2)
+        self.assertEqual(self.throttle.stats()['rejected'], 1)
+
+    def test_ip_limit_covers_many_emails(self):
+        for index in range(5):
+            self.login('wrong', email=f'guess{index}@example.com')
+
+        response, _ = self.login('secret-pass-123')
+        self.assertEqual(response.status_code, 429)
+        response, _ = self.login('secret-pass-123', ip='10.0.0.2')
+        self.assertEqual(response.status_code, 302)
+
+    # Writer sinkron: laporan langsung ditulis, tidak menunggu thread background
+    @override_settings(ACTIVITY_LOG={'ASYNC': False})
+    def test_rejections_are_reported_as_one_activity(self):
+        self.throttle.report_interval = 3600
+        for _ in range(2):
+            self.login('wrong')
+        for _ in range(4):
+            self.login('wrong')
+        self.assertFalse(UserActivity.objects.filter(activity_type='UNAUTHORIZED_ACCESS').exists())
+
+        self.assertEqual(self.throttle.report(), 1)
+        activity = UserActivity.objects.get(activity_type='UNAUTHORIZED_ACCESS')
+        self.assertEqual(activity.user, self.user)
+        self.assertTrue(activity.is_suspicious)
+        self.assertEqual(activity.additional_info['attempts'], 4)
+
+    def test_cache_store_sliding_window(self):
+        now = [1000.0]
+        store = CacheStore(prefix='test:throttle', clock=lambda: now[0])
+        for _ in range(4):
+            store.hit('ip:1.2.3.4', 100)
+        self.assertEqual(store.count('ip:1.2.3.4', 100), 4)
+
+        # Separuh window berikutnya: bucket lama diberi bobot 50%
+        now[0] = 1150.0
+        self.assertEqual(store.count('ip:1.2.3.4', 100), 2)
+        now[0] = 1250.0
+        self.assertEqual(store.count('ip:1.2.3.4', 100), 0)
+
+
+class UserSnapshotTest(TestCase):
+    def setUp(self):
+        self.user = create_user('cached')
+        self.profile = UserProfile.objects.create(user=self.user, occupation='Engineer')
+        self.client.force_login(self.user)
+        cache.delete(snapshot_key(self.user.pk))
+
+    def test_page_needs_no_auth_queries_once_cached(self):
+        self.client.get(reverse('home'))
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('home'))
+        self.assertEqual(response.context['user_profile'].occupation, 'Engineer')
+
+    def test_profile_save_invalidates_snapshot(self):
+        self.client.get(reverse('home'))
+
+        self.profile.occupation = 'Designer'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile.save()
+
+        response = self.client.get(reverse('home'))
+        self.assertEqual(response.context['user_profile'].occupation, 'Designer')
+
+    def test_snapshot_excludes_password_hash(self):
+        self.client.get(reverse('home'))
+
+        snapshot = cache.get(snapshot_key(self.user.pk))
+        self.assertNotIn('password', snapshot['user'])
+        self.assertNotIn(self.user.password, repr(snapshot))
+        self.assertEqual(snapshot['profile']['user_id'], self.user.pk)
+
+    def test_password_change_ends_cached_session(self):
+        self.client.get(reverse('home'))
+
+        self.user.set_password('another-pass-456')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+
+        response = self.client.get(reverse('home'))
+        self.assertFalse(response.wsgi_request.user.is_authenticated)
+
+    def test_saving_snapshot_user_keeps_deferred_fields(self):
+        response = self.client.get(reverse('home'))
+        user = response.wsgi_request.user
+        self.assertIn('password', user.get_deferred_fields())
+
+        user.first_name = 'Changed'
+        user.save()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, 'Changed')
+        self.assertTrue(self.user.check_password('secret-pass-123'))
+
+    def test_inactive_user_is_logged_out(self):
+        self.client.get(reverse('home'))
+
+        self.user.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+
+        response = self.client.get(reverse('home'))
+        self.assertFalse(response.wsgi_request.user.is_authenticated)
+
+
+class UserTrackerTest(TestCase):
+    def setUp(self):
+        self.alice = create_user('alice')
+        self.bob = create_user('bob')
+        self.tracker = UserTracker(batch_size=500, background=False)
+
+    def test_flush_aggregates_into_one_update(self):
+        earlier = timezone.now() - datetime.timedelta(minutes=5)
+        later = timezone.now()
+        self.tracker.record_login(self.alice.pk, '10.0.0.1', when=earlier)
+        self.tracker.record_login(self.alice.pk, '10.0.0.2', when=earlier)
+        self.tracker.touch(self.alice.pk, when=later)
+        self.tracker.touch(self.bob.pk, when=earlier)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.tracker.flush(), 2)
+
+        self.alice.refresh_from_db()
+        self.bob.refresh_from_db()
+        self.assertEqual(self.alice.login_count, 2)
+        self.assertEqual(self.alice.last_login_ip, '10.0.0.2')
+        self.assertEqual(self.alice.last_activity, later)
+        self.assertEqual(self.bob.login_count, 0)
+        self.assertEqual(self.bob.last_activity, earlier)
+
+    def test_older_activity_does_not_move_timestamp_back(self):
+        now = timezone.now()
+        self.tracker.touch(self.alice.pk, when=now)
+        self.tracker.flush()
+        self.tracker.touch(self.alice.pk, when=now - datetime.timedelta(hours=1))
+        self.tracker.flush()
+
+        self.alice.refresh_from_db()
+        self.assertEqual(self.alice.last_activity, now)
+
+    def test_full_save_keeps_tracked_fields(self):
+        stale = get_user_model().objects.get(pk=self.alice.pk)
+        self.tracker.record_login(self.alice.pk, '10.0.0.1')
+        self.tracker.flush()
+
+        stale.first_name = 'Alice'
+        stale.save()
+
+        self.alice.refresh_from_db()
+        self.assertEqual(self.alice.first_name, 'Alice')
+        self.assertEqual(self.alice.login_count, 1)
+
+    def test_failed_batches_are_dropped_after_max_retries(self):
+        tracker = UserTracker(background=False, max_retries=2)
+        tracker.record_login(self.alice.pk, '10.0.0.1')
+        with mock.patch.object(tracker, '_write', side_effect=DatabaseError('locked')):
+            with self.assertLogs('accounts.tracking', 'ERROR'):
+                for _ in range(2):
+                    tracker.flush()
+                    self.assertEqual(tracker.pending(), 1)
+                tracker.flush()
+        self.assertEqual(tracker.pending(), 0)
+        self.assertEqual(tracker.stats()['dropped_users'], 1)
+
+    def test_requeued_data_is_written_once_database_recovers(self):
+        self.tracker.record_login(self.alice.pk, '10.0.0.1')
+        with mock.patch.object(self.tracker, '_write', side_effect=DatabaseError('locked')):
+            with self.assertLogs('accounts.tracking', 'ERROR'):
+                self.tracker.flush()
+        self.tracker.record_login(self.alice.pk)
+        self.tracker.flush()
+
+        self.alice.refresh_from_db()
+        self.assertEqual(self.alice.login_count, 2)
+        self.assertEqual(self.alice.last_login_ip, '10.0.0.1')
+
+    def test_override_settings_replaces_and_stops_tracker(self):
+        self.assertFalse(get_user_tracker().background)
+        with override_settings(USER_TRACKING={'ASYNC': True, 'FLUSH_INTERVAL': 3600}):
+            tracker = get_user_tracker()
+            tracker.record_login(self.alice.pk, '10.0.0.1')
+            thread = tracker._thread
+            self.assertTrue(thread.is_alive())
+
+        self.assertFalse(thread.is_alive())
+        self.alice.refresh_from_db()
+        self.assertEqual(self.alice.login_count, 1)
+        self.assertFalse(get_user_tracker().background)
+
+
+class UserAutocompleteTest(TestCase):
+    def setUp(self):
+        self.viewer = create_user('viewer')
+        for index in range(PAGE_SIZE + 5):
+            create_user(f'dev{index:02d}', password=None)
+        self.ana = get_user_model().objects.create_user(
+            email='ana.lee@example.com', username='analyst', first_name='Ana', last_name='Lee'
+        )
+        self.client.force_login(self.viewer)
+
+    def test_prefix_matches_any_search_field(self):
+        usernames = lambda term: set(search_users(active_users(), term).values_list('username', flat=True))
+
+        self.assertEqual(usernames('ANA'), {'analyst'})
+        self.assertEqual(usernames('lee'), {'analyst'})
+        self.assertEqual(usernames('ana.l'), {'analyst'})
+        self.assertEqual(usernames('dev0'), {f'dev{index:02d}' for index in range(10)})
+
+    def test_prefix_search_uses_index(self):
+        plan = search_users(active_users(), 'ana').explain()
+        self.assertNotIn('SCAN accounts_customuser', plan)
+
+    def test_endpoint_paginates(self):
+        url = reverse('user_autocomplete')
+        first = self.client.get(url, {'q': 'dev'}).json()
+        second = self.client.get(url, {'q': 'dev', 'page': 2}).json()
+
+        self.assertEqual(len(first['results']), PAGE_SIZE)
+        self.assertTrue(first['pagination']['more'])
+        self.assertEqual(len(second['results']), 5)
+        self.assertFalse(second['pagination']['more'])
+        self.assertEqual(first['results'][0]['text'], 'dev00@example.com (dev00)')
+
+    def test_widget_renders_only_selected_users(self):
+        field = forms.ModelMultipleChoiceField(
+            queryset=active_users(), widget=UserAutocompleteSelectMultiple()
+        )
+        with self.assertNumQueries(1):
+            html = field.widget.render('team_members', [str(self.ana.pk)])
+
+        self.assertEqual(html.count('<option'), 1)
+        self.assertIn('selected', html)
+        self.assertIn(f'data-autocomplete-url="{reverse("user_autocomplete")}"', html)
+
+
+class QueryProfilingTest(TestCase):
+    def setUp(self):
+        self.staff = get_user_model().objects.create_user(
+            email='profiler@example.com', username='profiler', password=None, is_staff=True
+        )
+        self.user = get_user_model().objects.create_user(
+            email='visitor@example.com', username='visitor', password=None
+        )
+        get_profile_buffer().clear()
+        self.addCleanup(get_profile_buffer().clear)
+
+    def test_fingerprint_ignores_in_list_length_and_literals(self):
+        self.assertEqual(
+            fingerprint('SELECT * FROM t WHERE id IN (%s, %s) LIMIT 21'),
+            fingerprint('SELECT * FROM t WHERE id IN (%s, %s, %s, %s) LIMIT 5'),
+        )
+        self.assertNotEqual(fingerprint('SELECT a FROM t'), fingerprint('SELECT b FROM t'))
+
+    def test_profile_counts_duplicate_queries(self):
+        profile = RequestProfile()
+        with connection.execute_wrapper(profile):
+            for user in (self.staff, self.user):
+                get_user_model().objects.filter(pk=user.pk).exists()
+            get_user_model().objects.count()
+
+        self.assertEqual(profile.queries, 3)
+        self.assertGreater(profile.sql_time, 0)
+        duplicates = profile.duplicates()
+        self.assertEqual([item['count'] for item in duplicates], [2])
+
+    @override_settings(QUERY_PROFILING={'SERVER_TIMING': 'staff', 'SLOW_REQUEST_MS': 10 ** 6})
+    def test_server_timing_header_for_staff_only(self):
+        self.client.force_login(self.staff)
+        response = self.client.get(reverse('user_autocomplete'), {'q': 'pro'})
+        self.assertRegex(response['Server-Timing'], r'^sql;dur=[\d.]+;desc="\d+ queries, \d+ duplicated", view;dur=')
+        self.assertEqual(response.wsgi_request.query_profile.view_name, 'user_autocomplete')
+
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('user_autocomplete'), {'q': 'pro'})
+        self.assertFalse(response.has_header('Server-Timing'))
+        self.assertEqual(len(get_profile_buffer()), 0)
+
+    @override_settings(QUERY_PROFILING={'SLOW_REQUEST_MS': 0})
+    def test_slow_requests_are_logged_and_listed(self):
+        report = reverse('profiling_report')
+        with self.assertLogs('accounts.profiling', 'WARNING') as logs:
+            self.client.force_login(self.user)
+            self.client.get(reverse('user_autocomplete'), {'q': 'vis'})
+            self.assertEqual(self.client.get(report).status_code, 302)
+
+            self.client.force_login(self.staff)
+            response = self.client.get(report)
+            self.client.post(report)
+
+        self.assertIn('path=/accounts/users/autocomplete/', logs.output[0])
+        self.assertEqual(logs.records[0].profile['view'], 'user_autocomplete')
+        self.assertContains(response, '/accounts/users/autocomplete/')
+        # Setelah dikosongkan hanya request POST itu sendiri yang tercatat
+        self.assertEqual([entry['method'] for entry in get_profile_buffer().slowest()], ['POST'])
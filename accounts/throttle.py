@@ -0,0 +1,274 @@
+"""
+Throttle login per IP dan per email dengan sliding window.
+
+Percobaan yang melewati batas ditolak sebelum password di-hash. Penolakan
+dikumpulkan per email lalu dicatat sebagai satu UserActivity UNAUTHORIZED_ACCESS
+per REPORT_INTERVAL, bukan satu baris per percobaan.
+
+Store:
+- MemoryStore: timestamp per key di memori proses (satu worker)
+- CacheStore: dua bucket per key di cache Django (dipakai bersama antar worker)
+"""
+import collections
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+DEFAULTS = {
+    'STORE': 'cache',  # 'cache' atau 'memory'
+    'WINDOW': 900,
+    'IP_LIMIT': 50,
+    'EMAIL_LIMIT': 10,
+    'REPORT_INTERVAL': 60,
+}
+
+
+def get_throttle_settings():
+    return {**DEFAULTS, **getattr(settings, 'LOGIN_THROTTLE', {})}
+
+
+class MemoryStore:
+    """
+    Sliding window persis: deque timestamp per key
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self._hits = {}
+        self._lock = threading.Lock()
+        self._calls = 0
+
+    def _prune(self, hits, window, now):
+        while hits and hits[0] <= now - window:
+            hits.popleft()
+
+    def count(self, key, window):
+        now = self.clock()
+        with self._lock:
+            hits = self._hits.get(key)
+            if not hits:
+                return 0
+            self._prune(hits, window, now)
+            return len(hits)
+
+    def hit(self, key, window):
+        now = self.clock()
+        with self._lock:
+            hits = self._hits.setdefault(key, collections.deque())
+            self._prune(hits, window, now)
+            hits.append(now)
+            self._calls += 1
+            if self._calls % 1000 == 0:
+                self._purge(window, now)
+            return len(hits)
+
+    def reset(self, key, window):
+        with self._lock:
+            self._hits.pop(key, None)
+
+    def _purge(self, window, now):
+        # Buang key yang sudah tidak punya hit dalam window
+        for key in [key for key, hits in self._hits.items() if not hits or hits[-1] <= now - window]:
+            del self._hits[key]
+
+
+class CacheStore:
+    """
+    Sliding window counter: bucket sekarang + bucket sebelumnya yang diberi bobot
+    """
+
+    def __init__(self, cache=cache, prefix='accounts:throttle', clock=time.time):
+        self.cache = cache
+        self.prefix = prefix
+        self.clock = clock
+
+    def _keys(self, key, window, now):
+        bucket = int(now // window)
+        return (
+            f'{self.prefix}:{key}:{bucket}',
+            f'{self.prefix}:{key}:{bucket - 1}',
+            (now % window) / window,
+        )
+
+    def _estimate(self, current, previous, elapsed):
+        return current + int(previous * (1 - elapsed))
+
+    def count(self, key, window):
+        current_key, previous_key, elapsed = self._keys(key, window, self.clock())
+        values = self.cache.get_many([current_key, previous_key])
+        return self._estimate(values.get(current_key, 0), values.get(previous_key, 0), elapsed)
+
+    def hit(self, key, window):
+        current_key, previous_key, elapsed = self._keys(key, window, self.clock())
+        self.cache.add(current_key, 0, window * 2)
+        try:
+            current = self.cache.incr(current_key)
+        except ValueError:
+            # Key kedaluwarsa di antara add dan incr
+            self.cache.set(current_key, 1, window * 2)
+            current = 1
+        return self._estimate(current, self.cache.get(previous_key, 0), elapsed)
+
+    def reset(self, key, window):
+        current_key, previous_key, _ = self._keys(key, window, self.clock())
+        self.cache.delete_many([current_key, previous_key])
+
+
+class LoginThrottle:
+    def __init__(self, store, window=900, ip_limit=50, email_limit=10, report_interval=60):
+        self.store = store
+        self.window = window
+        self.ip_limit = ip_limit
+        self.email_limit = email_limit
+        self.report_interval = report_interval
+
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._last_report = time.monotonic()
+        self.rejected = 0
+        self.hashed = 0
+        self.failed = 0
+        self.reported = 0
+
+    @staticmethod
+    def email_key(email):
+        # Email di-hash: key cache pendek dan tanpa data pribadi
+        digest = hashlib.sha256(email.strip().lower().encode()).hexdigest()[:32]
+        return f'email:{digest}'
+
+    @staticmethod
+    def ip_key(ip):
+        return f'ip:{ip}'
+
+    def allow(self, ip, email):
+        """
+        False bila IP atau email sudah melewati batas kegagalan dalam window
+        """
+        if ip and self.store.count(self.ip_key(ip), self.window) >= self.ip_limit:
+            return False
+        if email and self.store.count(self.email_key(email), self.window) >= self.email_limit:
+            return False
+        return True
+
+    def register_rejected(self, ip, email):
+        with self._lock:
+            self.rejected += 1
+            if email:
+                entry = self._pending.setdefault(
+                    email.strip().lower(), {'attempts': 0, 'ips': set(), 'first_seen': timezone.now()}
+                )
+                entry['attempts'] += 1
+                if ip and len(entry['ips']) < 20:
+                    entry['ips'].add(ip)
+        self.report_if_due()
+
+    def register_failure(self, ip, email):
+        with self._lock:
+            self.hashed += 1
+            self.failed += 1
+        if ip:
+            self.store.hit(self.ip_key(ip), self.window)
+        if email:
+            self.store.hit(self.email_key(email), self.window)
+
+    def register_success(self, ip, email):
+        with self._lock:
+            self.hashed += 1
+        if email:
+            self.store.reset(self.email_key(email), self.window)
+
+    def report_if_due(self):
+        with self._lock:
+            due = self._pending and time.monotonic() - self._last_report >= self.report_interval
+        if due:
+            self.report()
+
+    def report(self):
+        """
+        Tulis penolakan yang terkumpul sebagai UserActivity UNAUTHORIZED_ACCESS (satu per email)
+        """
+        from django.contrib.auth import get_user_model
+
+        from .activity import get_activity_writer
+        from .models import UserActivity
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_report = time.monotonic()
+        if not pending:
+            return 0
+
+        users = (
+            get_user_model()._default_manager
+            .annotate(email_lower=Lower('email'))
+            .filter(email_lower__in=list(pending))
+            .only('pk', 'email')
+        )
+        writer = get_activity_writer()
+        reported = 0
+        for user in users:
+            entry = pending[user.email_lower]
+            ips = sorted(entry['ips'])
+            writer.submit(UserActivity(
+                user=user,
+                activity_type=UserActivity.ActivityType.UNAUTHORIZED_ACCESS.value,
+                severity=UserActivity.SeverityLevel.WARNING.value,
+                ip_address=ips[0] if ips else None,
+                is_suspicious=True,
+                additional_info={
+                    'reason': 'login_throttled',
+                    'attempts': entry['attempts'],
+                    'ips': ips,
+                    'first_seen': entry['first_seen'].isoformat(),
+                },
+            ))
+            reported += 1
+        if not writer.background:
+            writer.flush()
+        with self._lock:
+            self.reported += reported
+        return reported
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hashed': self.hashed,
+                'rejected': self.rejected,
+                'failed': self.failed,
+                'reported': self.reported,
+                'pending_reports': len(self._pending),
+            }
+
+
+_throttle = None
+_throttle_lock = threading.Lock()
+
+
+def get_login_throttle():
+    global _throttle
+    if _throttle is None:
+        with _throttle_lock:
+            if _throttle is None:
+                options = get_throttle_settings()
+                store = MemoryStore() if options['STORE'] == 'memory' else CacheStore()
+                _throttle = LoginThrottle(
+                    store,
+                    window=options['WINDOW'],
+                    ip_limit=options['IP_LIMIT'],
+                    email_limit=options['EMAIL_LIMIT'],
+                    report_interval=options['REPORT_INTERVAL'],
+                )
+    return _throttle
+
+
+def report_login_throttle(**kwargs):
+    """
+    Receiver request_finished: tulis laporan penolakan yang sudah jatuh tempo
+    """
+    if _throttle is not None:
+        _throttle.report_if_due()
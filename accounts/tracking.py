@@ -0,0 +1,256 @@
+"""
+Write-behind untuk login_count, last_login_ip, dan last_activity.
+
+Request hanya memperbarui agregat di memori proses (per user). Thread
+background menulis agregat tersebut setiap FLUSH_INTERVAL detik sebagai
+UPDATE massal: login_count = login_count + n, last_activity = nilai terbesar.
+Setiap worker menulis tambahannya sendiri, jadi aman untuk beberapa proses.
+Batch yang gagal ditulis digabung kembali ke antrean, paling banyak
+MAX_RETRIES kali; setelah itu dibuang dan dicatat di log.
+"""
+import atexit
+import logging
+import threading
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import DatabaseError, close_old_connections, connections
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'ASYNC': True,  # False: tidak ada thread, flush() dipanggil manual (test)
+    'FLUSH_INTERVAL': 30.0,
+    'BATCH_SIZE': 500,
+    'MAX_RETRIES': 5,
+}
+
+
+def get_tracking_settings():
+    return {**DEFAULTS, **getattr(settings, 'USER_TRACKING', {})}
+
+
+class UserTracker:
+    def __init__(self, flush_interval=30.0, batch_size=500, background=True, max_retries=5):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.background = background
+        self.max_retries = max_retries
+
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+        self.flushed_users = 0
+        self.updates = 0
+        self.dropped_users = 0
+
+    def _entry(self, user_id):
+        return self._pending.setdefault(
+            user_id, {'logins': 0, 'ip': None, 'last_activity': None, 'failures': 0}
+        )
+
+    def record_login(self, user_id, ip_address=None, when=None):
+        when = when or timezone.now()
+        with self._lock:
+            entry = self._entry(user_id)
+            entry['logins'] += 1
+            if ip_address:
+                entry['ip'] = ip_address
+            if entry['last_activity'] is None or when > entry['last_activity']:
+                entry['last_activity'] = when
+        self._ensure_thread()
+
+    def touch(self, user_id, when=None):
+        when = when or timezone.now()
+        with self._lock:
+            entry = self._entry(user_id)
+            if entry['last_activity'] is None or when > entry['last_activity']:
+                entry['last_activity'] = when
+        self._ensure_thread()
+
+    def pending(self):
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self):
+        """
+        Tulis semua agregat; satu UPDATE per BATCH_SIZE user
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            items = list(pending.items())
+            for start in range(0, len(items), self.batch_size):
+                batch = dict(items[start:start + self.batch_size])
+                try:
+                    self._write(batch)
+                except DatabaseError:
+                    logger.exception('Failed to write tracking data for %d users', len(batch))
+                    self._requeue(batch)
+                else:
+                    with self._lock:
+                        self.flushed_users += len(batch)
+                        self.updates += 1
+            return len(items)
+
+    def _write(self, batch):
+        User = get_user_model()
+        logins = [
+            When(pk=user_id, then=Value(entry['logins']))
+            for user_id, entry in batch.items() if entry['logins']
+        ]
+        ips = [When(pk=user_id, then=Value(entry['ip'])) for user_id, entry in batch.items() if entry['ip']]
+        seen = [
+            When(pk=user_id, then=Value(entry['last_activity']))
+            for user_id, entry in batch.items() if entry['last_activity']
+        ]
+
+        field = User._meta.get_field
+        values = {}
+        if logins:
+            values['login_count'] = F('login_count') + Case(
+                *logins, default=Value(0), output_field=field('login_count')
+            )
+        if ips:
+            values['last_login_ip'] = Case(*ips, default=F('last_login_ip'), output_field=field('last_login_ip'))
+        if seen:
+            latest = Case(*seen, default=F('last_activity'), output_field=field('last_activity'))
+            # Greatest bernilai NULL bila salah satu NULL (SQLite/PostgreSQL)
+            values['last_activity'] = Coalesce(Greatest(F('last_activity'), latest), latest)
+        if values:
+            User._default_manager.filter(pk__in=list(batch)).update(**values)
+
+    def _requeue(self, batch):
+        # Gabungkan kembali agar data tidak hilang saat database sedang sibuk;
+        # user yang sudah gagal max_retries kali dibuang agar antrean tidak tumbuh terus
+        dropped = 0
+        with self._lock:
+            for user_id, failed in batch.items():
+                failures = failed['failures'] + 1
+                if failures > self.max_retries:
+                    dropped += 1
+                    continue
+                entry = self._entry(user_id)
+                entry['failures'] = max(entry['failures'], failures)
+                entry['logins'] += failed['logins']
+                entry['ip'] = entry['ip'] or failed['ip']
+                if failed['last_activity'] and (
+                    entry['last_activity'] is None or failed['last_activity'] > entry['last_activity']
+                ):
+                    entry['last_activity'] = failed['last_activity']
+            self.dropped_users += dropped
+        if dropped:
+            logger.error(
+                'Dropped tracking data for %d users after %d failed writes', dropped, self.max_retries + 1
+            )
+
+    def stats(self):
+        with self._lock:
+            return {
+                'pending': len(self._pending),
+                'flushed_users': self.flushed_users,
+                'updates': self.updates,
+                'dropped_users': self.dropped_users,
+            }
+
+    def stop(self, timeout=None):
+        """
+        Hentikan thread background lalu tulis sisa agregat di thread pemanggil
+        """
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._stop.set()
+            self._wakeup.set()
+            thread.join(timeout)
+        return self.flush()
+
+    def _ensure_thread(self):
+        if not self.background:
+            return
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='user-tracker', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if self._stop.is_set():
+                break
+            close_old_connections()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('User tracker flush failed')
+        # Koneksi milik thread ini tidak boleh tertinggal
+        connections.close_all()
+
+
+_tracker = None
+_tracker_lock = threading.Lock()
+
+
+def get_user_tracker():
+    global _tracker
+    if _tracker is None:
+        with _tracker_lock:
+            if _tracker is None:
+                options = get_tracking_settings()
+                _tracker = UserTracker(
+                    flush_interval=options['FLUSH_INTERVAL'],
+                    batch_size=options['BATCH_SIZE'],
+                    background=options['ASYNC'],
+                    max_retries=options['MAX_RETRIES'],
+                )
+                if _tracker.background:
+                    atexit.register(_tracker.stop)
+    return _tracker
+
+
+def reset_user_tracker():
+    """
+    Hentikan tracker yang ada (agregat ditulis lebih dulu); tracker baru dibuat
+    dari settings saat get_user_tracker() berikutnya
+    """
+    global _tracker
+    with _tracker_lock:
+        tracker, _tracker = _tracker, None
+    if tracker is not None:
+        atexit.unregister(tracker.stop)
+        tracker.stop()
+
+
+def reset_user_tracker_on_setting_change(setting, **kwargs):
+    """
+    Receiver setting_changed (override_settings di test)
+    """
+    if setting == 'USER_TRACKING':
+        reset_user_tracker()
+
+
+class ActivityTrackingMiddleware:
+    """
+    Catat last_activity user yang login tanpa menulis ke database di dalam request
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            get_user_tracker().touch(user.pk)
+        return response
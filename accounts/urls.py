@@ -5,7 +5,9 @@ from .views import (
     user_login,
     edit_profile,
     profile_detail,
-    logout_view, HomeView
+    logout_view, HomeView,
+    user_autocomplete,
+    profiling_report,
 )
 
 
@@ -31,6 +33,12 @@ urlpatterns = [
     # Detail Profil
     path('profile/', profile_detail, name='profile_detail'),
 
+    # Typeahead user (JSON)
+    path('users/autocomplete/', user_autocomplete, name='user_autocomplete'),
+
+    # Request lambat dari profiling SQL (staff)
+    path('profiling/', profiling_report, name='profiling_report'),
+
     # Password Reset
     path('password-reset/',
          auth_views.PasswordResetView.as_view(
@@ -1,17 +1,22 @@
 from django.shortcuts import render, redirect
-from django.contrib.auth import login, authenticate, logout
+from django.contrib.auth import login, logout
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.views.generic import TemplateView
 from django.utils.translation import gettext_lazy as _
-from django.core.exceptions import ValidationError
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
 
 from .forms import (
     CustomUserCreationForm,
     CustomUserLoginForm,
     UserProfileForm
 )
-from .models import UserProfile, CustomUser
+from .activity import get_client_ip, log_request_activity
+from .autocomplete import active_users, autocomplete_response
+from .profiling import get_profile_buffer, get_profiling_settings
+from .models import UserProfile, CustomUser, UserActivity
+from .tracking import get_user_tracker
 
 
 def register(request):
@@ -34,6 +39,7 @@ def register(request):
 
                 # Login langsung setelah registrasi
                 login(request, user)
+                log_request_activity(request, user, UserActivity.ActivityType.REGISTRATION.value)
 
                 # Pesan sukses
                 messages.success(
@@ -65,16 +71,15 @@ def user_login(request):
         return redirect('home')
 
     if request.method == 'POST':
-        form = CustomUserLoginForm(request.POST)
+        form = CustomUserLoginForm(request.POST, request=request)
         if form.is_valid():
-            email = form.cleaned_data.get('email')
-            password = form.cleaned_data.get('password')
-
-            # Autentikasi pengguna
-            user = authenticate(email=email, password=password)
+            # User sudah diautentikasi oleh form; password tidak di-hash ulang
+            user = form.get_user()
 
             if user is not None:
                 login(request, user)
+                log_request_activity(request, user, UserActivity.ActivityType.LOGIN.value)
+                get_user_tracker().record_login(user.pk, get_client_ip(request))
 
                 # Pesan selamat datang
                 messages.success(
@@ -102,10 +107,12 @@ def user_login(request):
     else:
         form = CustomUserLoginForm()
 
+    # 429 agar klien/proxy tahu percobaan sedang dibatasi
+    status = 429 if form.has_error(NON_FIELD_ERRORS, 'throttled') else 200
     return render(request, 'accounts/login.html', {
         'form': form,
         'title': _('Login')
-    })
+    }, status=status)
 
 
 @login_required
@@ -114,7 +121,8 @@ def edit_profile(request):
     View untuk mengedit profil pengguna
     """
     try:
-        user_profile = request.user.profile
+        # Profil lengkap dari database: request.user.profile dari snapshot hanya memuat kolom avatar
+        user_profile = UserProfile.objects.get(user=request.user)
     except UserProfile.DoesNotExist:
         user_profile = UserProfile.objects.create(user=request.user)
 
@@ -128,6 +136,7 @@ def edit_profile(request):
             profile = form.save(commit=False)
             profile.user = request.user
             profile.save()
+            log_request_activity(request, request.user, UserActivity.ActivityType.PROFILE_UPDATE.value)
 
             messages.success(
                 request,
@@ -149,7 +158,7 @@ def profile_detail(request):
     View untuk menampilkan detail profil
     """
     try:
-        profile = request.user.profile
+        profile = UserProfile.objects.get(user=request.user)
     except UserProfile.DoesNotExist:
         # Buat profile jika belum ada
         profile = UserProfile.objects.create(user=request.user)
@@ -161,12 +170,39 @@ def profile_detail(request):
     })
 
 
+@login_required
+def user_autocomplete(request):
+    """
+    Endpoint JSON typeahead user (q, page)
+    """
+    return autocomplete_response(request, active_users())
+
+
+@staff_member_required
+def profiling_report(request):
+    """
+    Request paling lambat dari ring buffer profiling (proses ini saja)
+    """
+    buffer = get_profile_buffer()
+    if request.method == 'POST':
+        buffer.clear()
+        messages.success(request, _('Profiling buffer cleared.'))
+        return redirect('profiling_report')
+
+    return render(request, 'accounts/profiling_report.html', {
+        'entries': buffer.slowest(),
+        'options': get_profiling_settings(),
+    })
+
+
 def logout_view(request):
     """
     View untuk logout
     """
     # Simpan username untuk pesan
     username = request.user.username if request.user.is_authenticated else ''
+    if request.user.is_authenticated:
+        log_request_activity(request, request.user, UserActivity.ActivityType.LOGOUT.value)
 
     # Logout
     logout(request)
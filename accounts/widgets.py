@@ -0,0 +1,44 @@
+from django import forms
+from django.urls import reverse
+
+from .autocomplete import user_label
+
+
+class UserAutocompleteMixin:
+    """
+    Hanya user yang terpilih yang dirender sebagai <option>; pilihan lain
+    diambil dari endpoint JSON oleh accounts/js/user-autocomplete.js
+    """
+
+    def __init__(self, url_name='user_autocomplete', url_kwargs=None, attrs=None):
+        self.url_name = url_name
+        self.url_kwargs = url_kwargs or {}
+        super().__init__(attrs=attrs)
+
+    class Media:
+        js = ('accounts/js/user-autocomplete.js',)
+
+    def build_attrs(self, base_attrs, extra_attrs=None):
+        attrs = super().build_attrs(base_attrs, extra_attrs)
+        attrs.setdefault('class', 'form-control')
+        attrs['data-autocomplete-url'] = reverse(self.url_name, kwargs=self.url_kwargs)
+        return attrs
+
+    def optgroups(self, name, value, attrs=None):
+        selected = [item for item in value if item not in ('', None)]
+        options = []
+        if not self.allow_multiple_selected and not self.is_required:
+            options.append(self.create_option(name, '', '', not selected, 0))
+        if selected:
+            users = self.choices.queryset.filter(pk__in=selected)
+            for user in users:
+                options.append(self.create_option(name, str(user.pk), user_label(user), True, len(options)))
+        return [(None, options, 0)]
+
+
+class UserAutocompleteSelect(UserAutocompleteMixin, forms.Select):
+    pass
+
+
+class UserAutocompleteSelectMultiple(UserAutocompleteMixin, forms.SelectMultiple):
+    pass
@@ -0,0 +1,67 @@
+"""
+Kontrol akses project: siapa yang boleh melihat project mana
+"""
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+
+from .models import Project
+
+VISIBLE_IDS_TIMEOUT = 300
+
+TeamMembership = Project.team_members.through
+
+
+def _visible_ids_key(user_id):
+    return f'projects:visible_ids:{user_id}'
+
+
+def visible_projects(user):
+    """
+    Project yang dimiliki atau di-team oleh user.
+    Memakai subquery ke tabel team_members (terindeks), tanpa join dan distinct()
+    """
+    membership = TeamMembership.objects.filter(customuser_id=user.pk).values('project_id')
+    return Project.objects.filter(Q(owner_id=user.pk) | Q(pk__in=membership))
+
+
+def visible_project_ids(user):
+    """
+    Set ID project yang bisa dilihat user, di-cache dan di-invalidate lewat signal
+    """
+    key = _visible_ids_key(user.pk)
+    project_ids = cache.get(key)
+    if project_ids is None:
+        # Tanpa ORDER BY bawaan Meta: hasilnya set
+        project_ids = frozenset(visible_projects(user).order_by().values_list('pk', flat=True))
+        cache.set(key, project_ids, VISIBLE_IDS_TIMEOUT)
+    return project_ids
+
+
+def invalidate_visible_projects(*user_ids):
+    cache.delete_many([_visible_ids_key(user_id) for user_id in user_ids if user_id])
+
+
+def invalidate_on_commit(*user_ids, using=None):
+    """
+    Hapus cache setelah commit; sebelum itu request lain masih bisa mengisinya dengan keanggotaan lama
+    """
+    transaction.on_commit(lambda: invalidate_visible_projects(*user_ids), using=using)
+
+
+def can_view_project(user, project):
+    """
+    Pemilik atau anggota tim; tidak memuat daftar anggota tim
+    """
+    if not user.is_authenticated:
+        return False
+    if project.owner_id == user.pk:
+        return True
+    return project.pk in visible_project_ids(user)
+
+
+def can_manage_project(user, project):
+    """
+    Hanya pemilik yang boleh mengubah, menghapus, atau mengelola tim
+    """
+    return user.is_authenticated and project.owner_id == user.pk
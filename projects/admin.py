@@ -1,7 +1,9 @@
 from django.contrib import admin
 from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
-from .models import ProjectCategory, Project, ProjectTask
+from accounts.admin_tools import AutocompleteFilter, ScalableAdminMixin
+
+from .models import ProjectCategory, Project, ProjectTask, TaskDependency
 
 
 @admin.register(ProjectCategory)
@@ -21,7 +23,7 @@ class ProjectCategoryAdmin(admin.ModelAdmin):
 
 
 @admin.register(Project)
-class ProjectAdmin(admin.ModelAdmin):
+class ProjectAdmin(ScalableAdminMixin, admin.ModelAdmin):
     list_display = (
         'title', 'owner', 'category', 'status',
         'priority', 'progress', 'start_date',
@@ -35,11 +37,14 @@ class ProjectAdmin(admin.ModelAdmin):
         'title', 'description',
         'owner__username', 'category__name'
     )
+    date_hierarchy = 'created_at'
+    autocomplete_fields = ('owner', 'team_members')
 
     # Inline untuk Task
     class ProjectTaskInline(admin.TabularInline):
         model = ProjectTask
         extra = 0
+        autocomplete_fields = ('assigned_to',)
         readonly_fields = ('created_at', 'updated_at')
         fields = (
             'title', 'assigned_to', 'status',
@@ -65,13 +70,24 @@ class ProjectAdmin(admin.ModelAdmin):
         (_('Team'), {
             'fields': ('team_members',)
         }),
+        (_('Task Counters'), {
+            'fields': (
+                'tasks_total', 'tasks_todo', 'tasks_in_progress',
+                'tasks_review', 'tasks_done'
+            ),
+            'classes': ('collapse',)
+        }),
         (_('Metadata'), {
             'fields': ('created_at', 'updated_at'),
             'classes': ('collapse',)
         })
     )
 
-    readonly_fields = ('created_at', 'updated_at')
+    readonly_fields = (
+        'created_at', 'updated_at',
+        'tasks_total', 'tasks_todo', 'tasks_in_progress',
+        'tasks_review', 'tasks_done'
+    )
     prepopulated_fields = {'slug': ('title',)}
 
     def is_overdue(self, obj):
@@ -88,21 +104,25 @@ class ProjectAdmin(admin.ModelAdmin):
 
 
 @admin.register(ProjectTask)
-class ProjectTaskAdmin(admin.ModelAdmin):
+class ProjectTaskAdmin(ScalableAdminMixin, admin.ModelAdmin):
     list_display = (
         'title', 'project', 'assigned_to',
         'status', 'priority', 'due_date',
         'is_overdue'
     )
+    # Project dan user dicari lewat autocomplete, tidak dimuat semua ke sidebar
     list_filter = (
         'status', 'priority',
-        'project', 'assigned_to',
+        ('project', AutocompleteFilter),
+        ('assigned_to', AutocompleteFilter),
         'due_date'
     )
     search_fields = (
         'title', 'description',
         'project__title', 'assigned_to__username'
     )
+    date_hierarchy = 'due_date'
+    autocomplete_fields = ('project', 'assigned_to')
 
     fieldsets = (
         (_('Task Information'), {
@@ -116,13 +136,16 @@ class ProjectTaskAdmin(admin.ModelAdmin):
                 'priority', 'due_date'
             )
         }),
+        (_('Schedule'), {
+            'fields': ('duration', 'earliest_start', 'downstream_length')
+        }),
         (_('Metadata'), {
             'fields': ('created_at', 'updated_at'),
             'classes': ('collapse',)
         })
     )
 
-    readonly_fields = ('created_at', 'updated_at')
+    readonly_fields = ('created_at', 'updated_at', 'earliest_start', 'downstream_length')
 
     def is_overdue(self, obj):
         return obj.is_overdue()
@@ -140,6 +163,21 @@ class ProjectTaskAdmin(admin.ModelAdmin):
         )
 
 
+@admin.register(TaskDependency)
+class TaskDependencyAdmin(ScalableAdminMixin, admin.ModelAdmin):
+    list_display = ('predecessor', 'successor', 'project', 'created_at')
+    list_filter = (('project', AutocompleteFilter),)
+    search_fields = ('predecessor__title', 'successor__title')
+    autocomplete_fields = ('predecessor', 'successor')
+    readonly_fields = ('project', 'created_at')
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        if request.user.is_superuser:
+            return qs
+        return qs.filter(project__owner=request.user)
+
+
 # Kustomisasi Admin Global
 admin.site.site_header = "Project Management System"
 admin.site.site_title = "PMS Admin"
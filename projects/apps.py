@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class ProjectsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'projects'
+
+    def ready(self):
+        # Import signals saat aplikasi dimuat
+        import projects.signals
+        from .search import create_search_tables
+
+        # Tabel virtual FTS5 tidak dikelola migrasi
+        post_migrate.connect(create_search_tables, sender=self)
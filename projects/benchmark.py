@@ -0,0 +1,218 @@
+"""
+Benchmark hot path aplikasi lewat Django test client.
+
+Setiap skenario dijalankan `warmup` kali (tidak dihitung) lalu `iterations`
+kali; per iterasi dicatat latensi dan jumlah query (execute_wrapper yang sama
+dengan accounts.profiling). Hasil ditulis sebagai JSON dan bisa dibandingkan
+dengan baseline: regresi bila p50/p95 naik lebih dari `threshold` (dan lebih
+dari MIN_DELTA_MS) atau jumlah query bertambah.
+"""
+import io
+import json
+import platform
+import statistics
+from collections import Counter
+from contextlib import ExitStack
+from time import perf_counter
+
+import django
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection, connections
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+
+from accounts.profiling import RequestProfile
+
+from .models import Project
+from .seeding import DEFAULT_PASSWORD, WORDS
+
+PERCENTILES = (50, 90, 95, 99)
+MIN_DELTA_MS = 1.0
+COMPARED_METRICS = ('p50_ms', 'p95_ms')
+
+
+class BenchmarkData:
+    """
+    User dan object yang dipakai skenario (user pertama dataset seed)
+    """
+
+    def __init__(self, prefix='bench', password=DEFAULT_PASSWORD):
+        User = get_user_model()
+        self.user = User.objects.get(username=f'{prefix}0')
+        self.password = password
+        self.project_id = (
+            Project.objects.filter(owner=self.user).order_by('pk').values_list('pk', flat=True).first()
+        )
+        self.search_term = WORDS[0]
+        self.image = self.make_image()
+
+    @staticmethod
+    def make_image(size=(1200, 900)):
+        output = io.BytesIO()
+        Image.new('RGB', size, 'steelblue').save(output, 'JPEG', quality=90)
+        return output.getvalue()
+
+
+class Scenario:
+    """
+    prepare() dijalankan di luar pengukuran, run() diukur
+    """
+    login = True
+
+    def prepare(self, client, data):
+        pass
+
+    def run(self, client, data):
+        raise NotImplementedError
+
+
+class GetScenario(Scenario):
+    def __init__(self, url_name, params=None, kwargs=None):
+        self.url_name = url_name
+        self.params = params or (lambda data: None)
+        self.kwargs = kwargs or (lambda data: {})
+
+    def run(self, client, data):
+        return client.get(reverse(self.url_name, kwargs=self.kwargs(data)), self.params(data))
+
+
+class LoginScenario(Scenario):
+    login = False
+
+    def prepare(self, client, data):
+        client.cookies.clear()
+
+    def run(self, client, data):
+        return client.post(reverse('login'), {'email': data.user.email, 'password': data.password})
+
+
+class ProfileUploadScenario(Scenario):
+    def run(self, client, data):
+        upload = SimpleUploadedFile('avatar.jpg', data.image, content_type='image/jpeg')
+        return client.post(reverse('edit_profile'), {'profile_image': upload})
+
+
+SCENARIOS = {
+    'project_list': GetScenario('project_list'),
+    'project_search': GetScenario('project_list', params=lambda data: {'search_query': data.search_term}),
+    'project_detail': GetScenario('project_detail', kwargs=lambda data: {'pk': data.project_id}),
+    'project_board': GetScenario('project_board', kwargs=lambda data: {'pk': data.project_id}),
+    'dashboard': GetScenario('dashboard'),
+    'login': LoginScenario(),
+    'edit_profile_upload': ProfileUploadScenario(),
+}
+
+
+def percentile(sorted_values, percent):
+    """
+    Persentil dengan interpolasi linear (sorted_values sudah terurut)
+    """
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(timings, queries, statuses):
+    timings = sorted(timings)
+    summary = {f'p{percent}_ms': round(percentile(timings, percent), 3) for percent in PERCENTILES}
+    summary.update({
+        'iterations': len(timings),
+        'min_ms': round(timings[0], 3),
+        'max_ms': round(timings[-1], 3),
+        'mean_ms': round(statistics.fmean(timings), 3),
+        'queries': max(queries),
+        'queries_median': statistics.median(queries),
+        'status': Counter(statuses).most_common(1)[0][0],
+    })
+    return summary
+
+
+def measure(scenario, client, data):
+    profile = RequestProfile()
+    scenario.prepare(client, data)
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(profile))
+        started = perf_counter()
+        response = scenario.run(client, data)
+        elapsed = (perf_counter() - started) * 1000
+    return elapsed, profile.queries, response.status_code
+
+
+def run_scenario(scenario, data, iterations=20, warmup=2):
+    client = Client()
+    if scenario.login:
+        client.force_login(data.user)
+
+    timings, queries, statuses = [], [], []
+    try:
+        for index in range(warmup + iterations):
+            elapsed, count, status = measure(scenario, client, data)
+            if status >= 400:
+                return {'error': f'HTTP {status}'}
+            if index >= warmup:
+                timings.append(elapsed)
+                queries.append(count)
+                statuses.append(status)
+    except Exception as error:
+        return {'error': f'{type(error).__name__}: {error}'}
+    return summarize(timings, queries, statuses)
+
+
+def run_benchmarks(data, names=None, iterations=20, warmup=2, meta=None):
+    results = {
+        'meta': {
+            'timestamp': timezone.now().isoformat(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'iterations': iterations,
+            'warmup': warmup,
+            **(meta or {}),
+        },
+        'scenarios': {},
+    }
+    for name in names or SCENARIOS:
+        results['scenarios'][name] = run_scenario(SCENARIOS[name], data, iterations, warmup)
+    return results
+
+
+def compare(results, baseline, threshold=0.2, min_delta_ms=MIN_DELTA_MS):
+    """
+    Daftar regresi terhadap baseline (skenario yang error atau tidak ada di baseline dilewati)
+    """
+    regressions = []
+    for name, current in results['scenarios'].items():
+        previous = baseline.get('scenarios', {}).get(name)
+        if not previous or 'error' in current or 'error' in previous:
+            continue
+        for metric in COMPARED_METRICS:
+            limit = max(previous[metric] * (1 + threshold), previous[metric] + min_delta_ms)
+            if current[metric] > limit:
+                regressions.append({
+                    'scenario': name, 'metric': metric,
+                    'baseline': previous[metric], 'current': current[metric],
+                })
+        if current['queries'] > previous['queries']:
+            regressions.append({
+                'scenario': name, 'metric': 'queries',
+                'baseline': previous['queries'], 'current': current['queries'],
+            })
+    return regressions
+
+
+def write_results(results, path):
+    with open(path, 'w') as output:
+        json.dump(results, output, indent=2, sort_keys=True)
+        output.write('\n')
+
+
+def load_results(path):
+    with open(path) as source:
+        return json.load(source)
@@ -0,0 +1,98 @@
+"""
+Cache per-user untuk dashboard dan listing project.
+
+Setiap user punya nomor versi; key fragment menyertakan versi tersebut,
+sehingga invalidasi cukup dengan menaikkan versi (fragment lama dibiarkan kedaluwarsa).
+Versi yang hilang (culling/eviction) diisi ulang dengan nilai baru dari jam,
+bukan konstanta, agar fragment dengan versi lama tidak pernah terpakai lagi.
+"""
+import hashlib
+import time
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+from django.db import transaction
+
+FRAGMENT_TIMEOUT = 300
+VERSION_TIMEOUT = None  # versi tidak boleh hilang sebelum fragmentnya
+
+
+def _version_key(user_id):
+    return f'projects:cache_version:{user_id}'
+
+
+def _new_version():
+    # Nanodetik dari jam: praktis tidak pernah sama dengan versi yang pernah dipakai
+    return time.time_ns()
+
+
+def get_user_cache_version(user_id):
+    version = cache.get(_version_key(user_id))
+    if version is None:
+        seed = _new_version()
+        cache.add(_version_key(user_id), seed, VERSION_TIMEOUT)
+        version = cache.get(_version_key(user_id), seed)
+    return version
+
+
+def bump_user_cache_version(*user_ids):
+    """
+    Naikkan versi cache user; semua fragment lama otomatis tidak terpakai
+    """
+    for user_id in {user_id for user_id in user_ids if user_id}:
+        try:
+            cache.incr(_version_key(user_id))
+        except ValueError:
+            # Versi hilang: fragment lama mungkin masih ada, jadi jangan mulai dari nilai tetap
+            cache.add(_version_key(user_id), _new_version(), VERSION_TIMEOUT)
+
+
+def bump_on_commit(*user_ids, using=None):
+    """
+    Invalidasi setelah transaksi commit, agar cache tidak terisi data yang belum commit
+    """
+    transaction.on_commit(lambda: bump_user_cache_version(*user_ids), using=using)
+
+
+def params_digest(params, exclude=()):
+    """
+    Ringkasan query string (QueryDict) untuk dipakai sebagai bagian key cache
+    """
+    items = sorted(
+        (key, value)
+        for key, values in params.lists()
+        for value in values
+        if key not in exclude
+    )
+    return hashlib.md5(urlencode(items).encode()).hexdigest()
+
+
+def fragment_key(user_id, name, *parts):
+    version = get_user_cache_version(user_id)
+    suffix = ':'.join(str(part) for part in parts)
+    return f'projects:fragment:{name}:{user_id}:v{version}:{suffix}'
+
+
+def cached_fragment(user, name, builder, *parts, timeout=FRAGMENT_TIMEOUT):
+    """
+    Ambil fragment dari cache atau bangun dengan builder() lalu simpan
+    """
+    key = fragment_key(user.pk, name, *parts)
+    value = cache.get(key)
+    if value is None:
+        value = builder()
+        cache.set(key, value, timeout)
+    return value
+
+
+def project_audience(project_id):
+    """
+    ID user yang bisa melihat project: pemilik dan anggota tim
+    """
+    from .models import Project
+
+    owner_ids = Project.objects.filter(pk=project_id).values_list('owner_id', flat=True)
+    member_ids = Project.team_members.through.objects.filter(
+        project_id=project_id
+    ).values_list('customuser_id', flat=True)
+    return set(owner_ids) | set(member_ids)
@@ -0,0 +1,138 @@
+"""
+Ekspor project dan task yang bisa dilihat user sebagai CSV atau JSON Lines.
+
+Baris dibaca dengan values_list().iterator(chunk_size) (tanpa membuat instance
+model) dan ditulis sebagai generator bytes, opsional dikompres gzip secara
+bertahap. Memori tetap konstan berapa pun jumlah barisnya.
+"""
+import csv
+import json
+import zlib
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .access import visible_projects
+from .models import ProjectTask
+
+CHUNK_SIZE = 2000
+BUFFER_SIZE = 64 * 1024
+
+EXPORT_FIELDS = {
+    'projects': (
+        ('id', 'id'),
+        ('title', 'title'),
+        ('slug', 'slug'),
+        ('status', 'status'),
+        ('priority', 'priority'),
+        ('category', 'category__name'),
+        ('owner', 'owner__username'),
+        ('start_date', 'start_date'),
+        ('end_date', 'end_date'),
+        ('progress', 'progress'),
+        ('budget', 'budget'),
+        ('tasks_total', 'tasks_total'),
+        ('tasks_done', 'tasks_done'),
+        ('created_at', 'created_at'),
+        ('updated_at', 'updated_at'),
+    ),
+    'tasks': (
+        ('id', 'id'),
+        ('project_id', 'project_id'),
+        ('project', 'project__title'),
+        ('title', 'title'),
+        ('status', 'status'),
+        ('priority', 'priority'),
+        ('assigned_to', 'assigned_to__username'),
+        ('due_date', 'due_date'),
+        ('created_at', 'created_at'),
+        ('updated_at', 'updated_at'),
+    ),
+}
+
+FORMATS = {
+    'csv': 'text/csv',
+    'jsonl': 'application/x-ndjson',
+}
+
+
+def export_queryset(user, kind):
+    projects = visible_projects(user)
+    if kind == 'projects':
+        return projects
+    return ProjectTask.objects.filter(project_id__in=projects.values('pk'))
+
+
+def export_rows(user, kind, chunk_size=CHUNK_SIZE):
+    """
+    (header, iterator tuple) untuk jenis ekspor `kind`
+    """
+    columns = EXPORT_FIELDS[kind]
+    rows = (
+        export_queryset(user, kind)
+        .order_by('pk')
+        .values_list(*[lookup for _, lookup in columns])
+        .iterator(chunk_size=chunk_size)
+    )
+    return [name for name, _ in columns], rows
+
+
+class _LineBuffer:
+    """
+    Target csv.writer: write() mengembalikan baris, tidak menyimpannya
+    """
+
+    def write(self, value):
+        return value
+
+
+def csv_lines(header, rows):
+    writer = csv.writer(_LineBuffer())
+    yield writer.writerow(header)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def jsonl_lines(header, rows):
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for row in rows:
+        yield encoder.encode(dict(zip(header, row))) + '\n'
+
+
+def buffered(lines, size=BUFFER_SIZE):
+    """
+    Gabungkan baris kecil menjadi potongan bytes sekitar `size`
+    """
+    chunk = []
+    length = 0
+    for line in lines:
+        data = line.encode('utf-8')
+        chunk.append(data)
+        length += len(data)
+        if length >= size:
+            yield b''.join(chunk)
+            chunk, length = [], 0
+    if chunk:
+        yield b''.join(chunk)
+
+
+def gzipped(chunks, level=6):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_stream(user, kind, fmt='csv', compress=False, chunk_size=CHUNK_SIZE):
+    """
+    Generator bytes hasil ekspor
+    """
+    header, rows = export_rows(user, kind, chunk_size=chunk_size)
+    lines = csv_lines(header, rows) if fmt == 'csv' else jsonl_lines(header, rows)
+    chunks = buffered(lines)
+    return gzipped(chunks) if compress else chunks
+
+
+def export_filename(kind, fmt, compress=False):
+    return f'{kind}.{fmt}' + ('.gz' if compress else '')
@@ -3,6 +3,9 @@ from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 
+from accounts.autocomplete import active_users
+from accounts.widgets import UserAutocompleteSelect, UserAutocompleteSelectMultiple
+
 from .models import Project, ProjectTask, ProjectCategory
 
 
@@ -20,7 +23,8 @@ class ProjectForm(forms.ModelForm):
     team_members = forms.ModelMultipleChoiceField(
         queryset=None,  # Akan diset di __init__
         required=False,
-        widget=forms.SelectMultiple(attrs={'class': 'form-control select2'})
+        # Typeahead: hanya anggota terpilih yang dirender, bukan seluruh user
+        widget=UserAutocompleteSelectMultiple()
     )
 
     class Meta:
@@ -52,9 +56,8 @@ class ProjectForm(forms.ModelForm):
         user = kwargs.pop('user', None)
         super().__init__(*args, **kwargs)
 
-        # Hanya menampilkan user yang terkait
-        if user:
-            self.fields['team_members'].queryset = user.get_all_users()  # Sesuaikan dengan method di User model
+        # Queryset hanya dipakai untuk validasi ID terpilih, tidak pernah dimuat seluruhnya
+        self.fields['team_members'].queryset = active_users()
 
         # Set initial untuk team_members jika sedang update
         if self.instance.pk:
@@ -73,6 +76,19 @@ class ProjectForm(forms.ModelForm):
         return cleaned_data
 
 
+class ProjectTeamForm(forms.ModelForm):
+    class Meta:
+        model = Project
+        fields = ['team_members']
+        widgets = {
+            'team_members': UserAutocompleteSelectMultiple(),
+        }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields['team_members'].queryset = active_users()
+
+
 class ProjectTaskForm(forms.ModelForm):
     class Meta:
         model = ProjectTask
@@ -82,12 +98,14 @@ class ProjectTaskForm(forms.ModelForm):
             'assigned_to',
             'status',
             'priority',
-            'due_date'
+            'due_date',
+            'duration'
         ]
         widgets = {
             'title': forms.TextInput(attrs={'class': 'form-control'}),
             'description': forms.Textarea(attrs={'class': 'form-control', 'rows': 4}),
-            'assigned_to': forms.Select(attrs={'class': 'form-control'}),
+            'duration': forms.NumberInput(attrs={'class': 'form-control', 'min': 0}),
+            'assigned_to': UserAutocompleteSelect(),
             'status': forms.Select(attrs={'class': 'form-control'}),
             'priority': forms.Select(attrs={'class': 'form-control'}),
             'due_date': forms.DateInput(attrs={'class': 'form-control datepicker', 'type': 'date'})
@@ -100,6 +118,15 @@ class ProjectTaskForm(forms.ModelForm):
         # Filter assigned_to berdasarkan project members
         if project:
             self.fields['assigned_to'].queryset = project.team_members.all()
+            self.fields['assigned_to'].widget.url_name = 'project_member_autocomplete'
+            self.fields['assigned_to'].widget.url_kwargs = {'project_pk': project.pk}
+
+        # Kosong berarti durasi tidak diubah (default 1 hari untuk task baru)
+        self.fields['duration'].required = False
+
+    def clean_duration(self):
+        duration = self.cleaned_data.get('duration')
+        return self.instance.duration if duration is None else duration
 
     def clean_due_date(self):
         due_date = self.cleaned_data.get('due_date')
@@ -111,6 +138,19 @@ class ProjectTaskForm(forms.ModelForm):
         return due_date
 
 
+class TaskImportForm(forms.Form):
+    file = forms.FileField(
+        label=_('File'),
+        help_text=_('CSV or JSON Lines (.jsonl): title, description, status, priority, due_date, assigned_to'),
+        widget=forms.ClearableFileInput(attrs={'class': 'form-control', 'accept': '.csv,.jsonl,.ndjson'})
+    )
+    dry_run = forms.BooleanField(
+        label=_('Validate only'),
+        required=False,
+        widget=forms.CheckboxInput(attrs={'class': 'form-check-input'})
+    )
+
+
 class ProjectSearchForm(forms.Form):
     search_query = forms.CharField(
         required=False,
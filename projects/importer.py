@@ -0,0 +1,265 @@
+"""
+Impor task massal dari CSV atau JSON Lines.
+
+File dibaca baris demi baris dan diproses per batch:
+1. validasi seluruh batch sekaligus (judul unik per project, tanggal, status,
+   assignee lewat satu peta lookup),
+2. bulk_create baris valid dalam satu transaksi per batch,
+3. setelah semua batch: counter, progress, indeks pencarian, dan cache
+   diperbarui sekali per project (bukan per task seperti lewat save()).
+
+Kolom: project_id (opsional bila project ditentukan), title, description,
+status, priority, due_date (YYYY-MM-DD), assigned_to (username atau email).
+"""
+import codecs
+import csv
+import datetime
+import json
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .cache import bump_on_commit, project_audience
+from .models import Project, ProjectTask
+from .search import index_tasks
+
+BATCH_SIZE = 1000
+MAX_ERRORS = 1000
+FORMATS = ('csv', 'jsonl')
+
+STATUSES = {value for value, _ in ProjectTask.STATUS_CHOICES}
+PRIORITIES = {value for value, _ in ProjectTask.PRIORITY_CHOICES}
+TITLE_MAX_LENGTH = ProjectTask._meta.get_field('title').max_length
+
+
+class ImportResult:
+    def __init__(self):
+        self.created = 0
+        self.rows = 0
+        self.errors = []
+        self.error_count = 0
+        self.project_ids = set()
+
+    def add_error(self, line, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append((line, message))
+
+    @property
+    def ok(self):
+        return not self.error_count
+
+
+def detect_format(filename):
+    name = filename.lower()
+    if name.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    return 'csv'
+
+
+def read_rows(binary_file, fmt):
+    """
+    Generator (nomor baris, dict) dari file biner tanpa memuat seluruh isinya
+    """
+    text = codecs.getreader('utf-8-sig')(binary_file)
+    if fmt == 'csv':
+        reader = csv.DictReader(text)
+        for row in reader:
+            yield reader.line_num, row
+    else:
+        for line_number, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = None
+            yield line_number, row if isinstance(row, dict) else None
+
+
+def batched(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _clean(value):
+    if value is None:
+        return ''
+    return str(value).strip()
+
+
+class TaskImporter:
+    def __init__(self, project=None, allowed_project_ids=None, batch_size=BATCH_SIZE, dry_run=False):
+        self.project = project
+        self.allowed_project_ids = allowed_project_ids
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.today = timezone.now().date()
+        # Judul yang sudah dipakai di file ini, per project
+        self._seen_titles = set()
+        self._users = {}
+
+    def run(self, rows):
+        result = ImportResult()
+        for batch in batched(rows, self.batch_size):
+            self._import_batch(batch, result)
+        if result.project_ids and not self.dry_run:
+            self._refresh_projects(result.project_ids)
+        return result
+
+    def _parse_row(self, line, row, result):
+        if row is None:
+            result.add_error(line, 'Invalid row.')
+            return None
+
+        project_id = self.project.pk if self.project else _clean(row.get('project_id'))
+        try:
+            project_id = int(project_id)
+        except (TypeError, ValueError):
+            result.add_error(line, 'Invalid or missing project_id.')
+            return None
+
+        title = _clean(row.get('title'))
+        if not title:
+            result.add_error(line, 'Title is required.')
+            return None
+        if len(title) > TITLE_MAX_LENGTH:
+            result.add_error(line, f'Title is longer than {TITLE_MAX_LENGTH} characters.')
+            return None
+
+        status = _clean(row.get('status')) or 'todo'
+        priority = _clean(row.get('priority')) or 'medium'
+        if status not in STATUSES:
+            result.add_error(line, f'Unknown status "{status}".')
+            return None
+        if priority not in PRIORITIES:
+            result.add_error(line, f'Unknown priority "{priority}".')
+            return None
+
+        due_date = _clean(row.get('due_date'))
+        if due_date:
+            try:
+                due_date = datetime.date.fromisoformat(due_date)
+            except ValueError:
+                result.add_error(line, f'Invalid due_date "{due_date}".')
+                return None
+            if due_date < self.today:
+                result.add_error(line, 'Due date cannot be in the past.')
+                return None
+        else:
+            due_date = None
+
+        return {
+            'line': line,
+            'project_id': project_id,
+            'title': title,
+            'description': _clean(row.get('description')) or None,
+            'status': status,
+            'priority': priority,
+            'due_date': due_date,
+            'assignee': _clean(row.get('assigned_to')),
+        }
+
+    def _resolve_users(self, keys):
+        """
+        Peta username/email -> id user; satu query untuk key yang belum dikenal
+        """
+        missing = {key for key in keys if key not in self._users}
+        if missing:
+            lowered = {key.lower() for key in missing}
+            found = get_user_model()._default_manager.filter(
+                Q(username__in=missing) | Q(email__in=lowered) | Q(email__in=missing)
+            ).values_list('pk', 'username', 'email')
+            for pk, username, email in found:
+                self._users[username] = pk
+                self._users[email] = pk
+                self._users[email.lower()] = pk
+            for key in missing:
+                self._users.setdefault(key, self._users.get(key.lower()))
+        return self._users
+
+    def _import_batch(self, batch, result):
+        result.rows += len(batch)
+        parsed = [item for item in (self._parse_row(line, row, result) for line, row in batch) if item]
+        if not parsed:
+            return
+
+        project_ids = {item['project_id'] for item in parsed}
+        existing_projects = set(Project.objects.filter(pk__in=project_ids).values_list('pk', flat=True))
+        existing_titles = set(
+            ProjectTask.objects.filter(
+                project_id__in=project_ids,
+                title__in={item['title'] for item in parsed},
+            ).values_list('project_id', 'title')
+        )
+        users = self._resolve_users({item['assignee'] for item in parsed if item['assignee']})
+        memberships = set(
+            Project.team_members.through.objects.filter(
+                project_id__in=project_ids,
+                customuser_id__in={users[item['assignee']] for item in parsed if users.get(item['assignee'])},
+            ).values_list('project_id', 'customuser_id')
+        )
+
+        tasks = []
+        for item in parsed:
+            line, project_id = item['line'], item['project_id']
+            key = (project_id, item['title'])
+            if project_id not in existing_projects or (
+                self.allowed_project_ids is not None and project_id not in self.allowed_project_ids
+            ):
+                result.add_error(line, f'Project {project_id} not found.')
+                continue
+            if key in existing_titles or key in self._seen_titles:
+                result.add_error(line, f'Task "{item["title"]}" already exists in project {project_id}.')
+                continue
+
+            assignee_id = None
+            if item['assignee']:
+                assignee_id = users.get(item['assignee'])
+                if assignee_id is None:
+                    result.add_error(line, f'Unknown user "{item["assignee"]}".')
+                    continue
+                if (project_id, assignee_id) not in memberships:
+                    result.add_error(line, f'User "{item["assignee"]}" is not a member of project {project_id}.')
+                    continue
+
+            self._seen_titles.add(key)
+            tasks.append(ProjectTask(
+                project_id=project_id,
+                title=item['title'],
+                description=item['description'],
+                status=item['status'],
+                priority=item['priority'],
+                due_date=item['due_date'],
+                assigned_to_id=assignee_id,
+            ))
+
+        if tasks and not self.dry_run:
+            with transaction.atomic():
+                created = ProjectTask.objects.bulk_create(tasks)
+                index_tasks([task for task in created if task.pk])
+        result.created += len(tasks)
+        result.project_ids.update(task.project_id for task in tasks)
+
+    def _refresh_projects(self, project_ids):
+        """
+        Sekali per project: counter, progress, dan cache (bulk_create tidak mengirim signal)
+        """
+        queryset = Project.objects.filter(pk__in=project_ids)
+        with transaction.atomic():
+            Project.rebuild_task_counters(queryset)
+            Project.recompute_progress(queryset)
+            for project_id in project_ids:
+                bump_on_commit(*project_audience(project_id))
+
+
+def import_tasks(binary_file, fmt='csv', **kwargs):
+    return TaskImporter(**kwargs).run(read_rows(binary_file, fmt))
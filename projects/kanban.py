@@ -0,0 +1,115 @@
+"""
+Papan Kanban per project.
+
+Kolom dibangun dari satu query task yang dikelompokkan di Python. Perubahan
+status hasil drag-and-drop dikirim sebagai satu batch dan diterapkan dengan
+satu UPDATE ... WHERE id IN (...) per status tujuan; counter, progress, dan
+cache project diperbarui sekali per batch (bukan per task lewat save()).
+"""
+from collections import defaultdict
+
+from django.db import transaction
+from django.utils import timezone
+
+from .cache import bump_on_commit, project_audience
+from .models import Project, ProjectTask
+
+STATUSES = [value for value, _ in ProjectTask.STATUS_CHOICES]
+MAX_BATCH = 500
+
+BOARD_FIELDS = (
+    'pk', 'project_id', 'title', 'status', 'priority', 'due_date',
+    'assigned_to__username', 'assigned_to__first_name', 'assigned_to__last_name',
+)
+
+
+def board_queryset(project):
+    """
+    Task project untuk papan, terurut due_date (indeks project + due_date)
+    """
+    return (
+        project.tasks
+        .select_related('assigned_to')
+        .only(*BOARD_FIELDS)
+        .order_by('due_date', 'pk')
+    )
+
+
+def board_columns(project):
+    """
+    Daftar kolom {'status', 'label', 'tasks'} sesuai urutan STATUS_CHOICES
+    """
+    tasks = defaultdict(list)
+    queryset = board_queryset(project)
+    for task in queryset:
+        tasks[task.status].append(task)
+    return [
+        {'status': status, 'label': label, 'tasks': tasks[status]}
+        for status, label in ProjectTask.STATUS_CHOICES
+    ]
+
+
+def parse_changes(data):
+    """
+    {'changes': {task_id: status}} -> {int: str}; ValueError bila tidak valid
+    """
+    changes = data.get('changes') if isinstance(data, dict) else None
+    if not isinstance(changes, dict) or not changes:
+        raise ValueError('Expected a non-empty "changes" object.')
+    if len(changes) > MAX_BATCH:
+        raise ValueError(f'At most {MAX_BATCH} changes per batch.')
+
+    parsed = {}
+    for task_id, status in changes.items():
+        try:
+            task_id = int(task_id)
+        except (TypeError, ValueError):
+            raise ValueError(f'Invalid task id "{task_id}".')
+        if status not in STATUSES:
+            raise ValueError(f'Unknown status "{status}".')
+        parsed[task_id] = status
+    return parsed
+
+
+def move_tasks(project, changes):
+    """
+    Terapkan {task_id: status baru} untuk task di project ini.
+    Task yang tidak ada (mis. sudah dihapus) dilewati dan dilaporkan di 'missing'.
+    """
+    with transaction.atomic():
+        current = dict(
+            ProjectTask.objects.select_for_update()
+            .filter(project=project, pk__in=changes)
+            .values_list('pk', 'status')
+        )
+
+        targets = defaultdict(list)
+        transitions = []
+        for task_id, status in changes.items():
+            previous = current.get(task_id)
+            if previous is None or previous == status:
+                continue
+            targets[status].append(task_id)
+            transitions.append((previous, status))
+
+        now = timezone.now()
+        for status, task_ids in targets.items():
+            ProjectTask.objects.filter(project=project, pk__in=task_ids).update(
+                status=status, updated_at=now
+            )
+
+        if transitions:
+            Project.move_task_counters(project.pk, transitions)
+            Project.recompute_progress(Project.objects.filter(pk=project.pk))
+            bump_on_commit(*project_audience(project.pk))
+
+        counters = Project.objects.filter(pk=project.pk).values(
+            'progress', 'tasks_total', *Project.TASK_COUNTER_FIELDS.values()
+        ).get()
+
+    return {
+        'updated': len(transitions),
+        'missing': sorted(set(changes) - set(current)),
+        'progress': counters.pop('progress'),
+        'counters': counters,
+    }
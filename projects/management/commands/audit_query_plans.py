@@ -0,0 +1,48 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from projects.query_plans import HOT_QUERIES, audit
+
+
+class Command(BaseCommand):
+    help = (
+        'Jalankan EXPLAIN QUERY PLAN untuk queryset yang sering dipakai dan tandai '
+        'full table scan serta temp B-tree'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'names', nargs='*', metavar='name',
+            help=f'Query yang diaudit (default: semua): {", ".join(sorted(HOT_QUERIES))}'
+        )
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+        parser.add_argument('--fail-on-issues', action='store_true', help='Gagal bila ada temuan')
+
+    def handle(self, *args, **options):
+        unknown = sorted(set(options['names']) - set(HOT_QUERIES))
+        if unknown:
+            raise CommandError(f'Unknown query name(s): {", ".join(unknown)}')
+        try:
+            results = audit(options['names'] or None, using=options['database'])
+        except ImproperlyConfigured as error:
+            raise CommandError(str(error))
+
+        flagged = 0
+        for result in results:
+            if result['issues']:
+                flagged += 1
+                self.stdout.write(self.style.ERROR(f"FLAGGED {result['name']}"))
+            else:
+                self.stdout.write(self.style.SUCCESS(f"ok      {result['name']}"))
+            if result['issues'] or options['verbosity'] > 1:
+                for detail in result['plan']:
+                    self.stdout.write(f'        {detail}')
+            for kind, detail in result['issues']:
+                self.stdout.write(f'        ! {kind}: {detail}')
+            if result['allowed'] and options['verbosity'] > 1:
+                self.stdout.write(f"        allowed: {result['note']}")
+
+        if flagged and options['fail_on_issues']:
+            raise CommandError(f'{flagged} query plan(s) with full scans or temp B-trees.')
+        self.stdout.write(f'{len(results)} query plan(s) audited, {flagged} flagged.')
@@ -0,0 +1,109 @@
+import tempfile
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+
+from accounts.activity import get_activity_writer
+from accounts.images import get_image_processor
+from accounts.tracking import get_user_tracker
+from projects.benchmark import SCENARIOS, BenchmarkData, compare, load_results, run_benchmarks, write_results
+from projects.seeding import Scale, seed
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark hot path (list, search, detail, dashboard, login, upload profil) '
+        'di database test terpisah yang diisi data sintetis'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=20)
+        parser.add_argument('--projects-per-user', type=int, default=5)
+        parser.add_argument('--tasks-per-project', type=int, default=20)
+        parser.add_argument('--team-size', type=int, default=3)
+        parser.add_argument('--activities-per-user', type=int, default=20)
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument('--warmup', type=int, default=2)
+        parser.add_argument('--seed', type=int, default=0, help='Seed generator data (hasil deterministik)')
+        parser.add_argument(
+            '--scenario', action='append', choices=sorted(SCENARIOS), dest='scenarios',
+            help='Jalankan skenario ini saja (boleh berulang)'
+        )
+        parser.add_argument('-o', '--output', default='benchmark-results.json')
+        parser.add_argument('--baseline', help='File hasil sebelumnya untuk dibandingkan')
+        parser.add_argument(
+            '--threshold', type=float, default=0.2,
+            help='Kenaikan p50/p95 yang dianggap regresi (0.2 = 20%%)'
+        )
+        parser.add_argument('--fail-on-regression', action='store_true')
+
+    def handle(self, *args, **options):
+        scale = Scale(
+            users=options['users'],
+            projects_per_user=options['projects_per_user'],
+            tasks_per_project=options['tasks_per_project'],
+            team_size=options['team_size'],
+            activities_per_user=options['activities_per_user'],
+        )
+        if scale.users < 1:
+            raise CommandError('At least one user is required.')
+        baseline = load_results(options['baseline']) if options['baseline'] else None
+
+        results = self.run_isolated(scale, options)
+        write_results(results, options['output'])
+        self.report(results)
+        self.stdout.write(f"Results written to {options['output']}")
+
+        if baseline is None:
+            return
+        regressions = compare(results, baseline, options['threshold'])
+        for item in regressions:
+            self.stderr.write(
+                f"Regression in {item['scenario']} {item['metric']}: "
+                f"{item['baseline']} -> {item['current']}"
+            )
+        if not regressions:
+            self.stdout.write(self.style.SUCCESS('No regressions against baseline.'))
+        elif options['fail_on_regression']:
+            raise CommandError(f'{len(regressions)} regression(s) against baseline.')
+
+    def run_isolated(self, scale, options):
+        """
+        Database test sementara dan MEDIA_ROOT sementara; data asli tidak disentuh
+        """
+        setup_test_environment()
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            with tempfile.TemporaryDirectory() as media_root, override_settings(MEDIA_ROOT=media_root):
+                self.stdout.write(f'Seeding {scale.as_dict()} ...')
+                counts = seed(scale, seed_value=options['seed'])
+                self.stdout.write(f'Seeded {counts}')
+                try:
+                    return run_benchmarks(
+                        BenchmarkData(),
+                        names=options['scenarios'],
+                        iterations=options['iterations'],
+                        warmup=options['warmup'],
+                        meta={'scale': scale.as_dict(), 'rows': counts, 'seed': options['seed']},
+                    )
+                finally:
+                    # Pekerjaan latar belakang harus selesai sebelum database test dihapus
+                    get_image_processor().drain()
+                    get_activity_writer().flush()
+                    get_user_tracker().flush()
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+    def report(self, results):
+        self.stdout.write(f"{'scenario':<22}{'p50':>10}{'p95':>10}{'p99':>10}{'queries':>9}")
+        for name, summary in results['scenarios'].items():
+            if 'error' in summary:
+                self.stdout.write(f"{name:<22}  {self.style.ERROR(summary['error'])}")
+                continue
+            self.stdout.write(
+                f"{name:<22}{summary['p50_ms']:>10.2f}{summary['p95_ms']:>10.2f}"
+                f"{summary['p99_ms']:>10.2f}{summary['queries']:>9}"
+            )
@@ -0,0 +1,49 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.write_benchmark import get_profiles, run_write_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark kontensi tulis SQLite dengan beberapa thread: konfigurasi bawaan Django '
+        'dibandingkan dengan DATABASES["default"] (WAL, BEGIN IMMEDIATE, koneksi persisten)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--writers', type=int, default=8)
+        parser.add_argument('--readers', type=int, default=2)
+        parser.add_argument('--iterations', type=int, default=100, help='Transaksi per thread penulis')
+        parser.add_argument(
+            '--profile', action='append', choices=['stock', 'configured'], dest='profiles',
+            help='Jalankan profil ini saja (boleh berulang)'
+        )
+        parser.add_argument('--directory', help='Lokasi file database sementara (default: direktori temp)')
+
+    def handle(self, *args, **options):
+        if options['writers'] < 1 or options['readers'] < 0 or options['iterations'] < 1:
+            raise CommandError('--writers and --iterations must be positive.')
+        try:
+            get_profiles()
+        except ImproperlyConfigured as error:
+            raise CommandError(str(error))
+
+        results = run_write_benchmark(
+            options['profiles'], options['writers'], options['readers'], options['iterations'],
+            options['directory'],
+        )
+        self.stdout.write(
+            f"{'profile':<12}{'committed':>10}{'failed':>8}{'writes/s':>10}{'reads/s':>10}"
+            f"{'read err':>9}{'seconds':>9}  consistent"
+        )
+        for result in results:
+            self.stdout.write(
+                f"{result['profile']:<12}{result['committed']:>10}{result['failed']:>8}"
+                f"{result['writes_per_s']:>10.1f}{result['reads_per_s']:>10.1f}"
+                f"{result['read_failures']:>9}{result['seconds']:>9.2f}  {result['consistent']}"
+            )
+
+        by_name = {result['profile']: result for result in results}
+        if {'stock', 'configured'} <= by_name.keys() and by_name['stock']['writes_per_s']:
+            gain = by_name['configured']['writes_per_s'] / by_name['stock']['writes_per_s']
+            self.stdout.write(self.style.SUCCESS(f'Write throughput: {gain:.1f}x stock configuration.'))
@@ -0,0 +1,39 @@
+import sys
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.export import CHUNK_SIZE, EXPORT_FIELDS, FORMATS, export_stream
+
+
+class Command(BaseCommand):
+    help = 'Ekspor project atau task yang bisa dilihat user ke CSV/JSON Lines (streaming)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('email', help='Email user yang datanya diekspor')
+        parser.add_argument('--type', dest='kind', choices=sorted(EXPORT_FIELDS), default='projects')
+        parser.add_argument('--format', dest='fmt', choices=sorted(FORMATS), default='csv')
+        parser.add_argument('--gzip', action='store_true', help='Kompres output dengan gzip')
+        parser.add_argument('--output', '-o', help='File tujuan (default: stdout)')
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        try:
+            user = User.objects.get(email=options['email'])
+        except User.DoesNotExist:
+            raise CommandError(f"User {options['email']} does not exist.")
+
+        chunks = export_stream(
+            user, options['kind'], options['fmt'],
+            compress=options['gzip'], chunk_size=options['chunk_size'],
+        )
+        if options['output']:
+            with open(options['output'], 'wb') as output:
+                for chunk in chunks:
+                    output.write(chunk)
+        else:
+            output = getattr(self.stdout._out, 'buffer', sys.stdout.buffer)
+            for chunk in chunks:
+                output.write(chunk)
+            output.flush()
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.importer import BATCH_SIZE, FORMATS, detect_format, import_tasks
+from projects.models import Project
+
+
+class Command(BaseCommand):
+    help = 'Impor task massal dari file CSV atau JSON Lines (bulk_create per batch)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='File CSV/JSONL')
+        parser.add_argument('--project', type=int, help='ID project untuk semua baris (default: kolom project_id)')
+        parser.add_argument('--format', dest='fmt', choices=FORMATS, help='Default: dari ekstensi file')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+        parser.add_argument('--dry-run', action='store_true', help='Hanya validasi, tidak menyimpan')
+
+    def handle(self, *args, **options):
+        project = None
+        if options['project']:
+            try:
+                project = Project.objects.get(pk=options['project'])
+            except Project.DoesNotExist:
+                raise CommandError(f"Project {options['project']} does not exist.")
+
+        fmt = options['fmt'] or detect_format(options['path'])
+        with open(options['path'], 'rb') as source:
+            result = import_tasks(
+                source, fmt,
+                project=project,
+                batch_size=options['batch_size'],
+                dry_run=options['dry_run'],
+            )
+
+        for line, message in result.errors:
+            self.stderr.write(f'Line {line}: {message}')
+        if result.error_count > len(result.errors):
+            self.stderr.write(f'... and {result.error_count - len(result.errors)} more error(s).')
+
+        verb = 'validated' if options['dry_run'] else 'imported'
+        summary = f'{result.created} of {result.rows} task(s) {verb} into {len(result.project_ids)} project(s).'
+        self.stdout.write(self.style.SUCCESS(summary) if result.ok else self.style.WARNING(summary))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = 'Isi ulang indeks full-text (FTS5) untuk project dan task'
+
+    def handle(self, *args, **options):
+        if not rebuild_search_index():
+            raise CommandError('Database does not support SQLite FTS5.')
+        self.stdout.write(self.style.SUCCESS('Search index rebuilt.'))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from projects.models import Project
+
+
+class Command(BaseCommand):
+    help = 'Hitung ulang counter task per status pada Project (perbaikan drift)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'project_ids',
+            nargs='*',
+            type=int,
+            help='ID project yang akan dihitung ulang (default: semua project)'
+        )
+
+    def handle(self, *args, **options):
+        queryset = Project.objects.all()
+        if options['project_ids']:
+            queryset = queryset.filter(pk__in=options['project_ids'])
+
+        updated = Project.rebuild_task_counters(queryset)
+        self.stdout.write(self.style.SUCCESS(
+            f'Task counters rebuilt for {updated} project(s).'
+        ))
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from projects.models import Project
+from projects.scheduling import CycleError, reschedule_project
+
+
+class Command(BaseCommand):
+    help = 'Hitung ulang jadwal (earliest start, jalur kritis) seluruh task per project'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'project_ids',
+            nargs='*',
+            type=int,
+            help='ID project yang akan dihitung ulang (default: semua project)'
+        )
+
+    def handle(self, *args, **options):
+        queryset = Project.objects.all()
+        if options['project_ids']:
+            queryset = queryset.filter(pk__in=options['project_ids'])
+
+        count = 0
+        for project_id in queryset.values_list('pk', flat=True).iterator():
+            try:
+                with transaction.atomic():
+                    graph = reschedule_project(project_id)
+            except CycleError as error:
+                raise CommandError(f'Project {project_id}: {error}')
+            count += 1
+            self.stdout.write(f'Project {project_id}: {graph.makespan} day(s)')
+
+        self.stdout.write(self.style.SUCCESS(f'Schedules rebuilt for {count} project(s).'))
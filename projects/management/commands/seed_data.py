@@ -0,0 +1,68 @@
+from time import perf_counter
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from projects.seeding import BATCH_SIZE, DEFAULT_PASSWORD, Scale, seed
+
+
+class Command(BaseCommand):
+    help = (
+        'Isi database dengan data sintetis skala besar (user, kategori, project, anggota tim, '
+        'task, aktivitas) memakai bulk insert per batch'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--projects-per-user', type=int, default=5)
+        parser.add_argument('--tasks-per-project', type=int, default=20)
+        parser.add_argument('--team-size', type=int, default=3)
+        parser.add_argument('--activities-per-user', type=int, default=50)
+        parser.add_argument('--prefix', default='seed', help='Prefix username dan slug project')
+        parser.add_argument('--password', default=DEFAULT_PASSWORD)
+        parser.add_argument('--seed', type=int, default=0, help='Seed generator data (hasil deterministik)')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+        parser.add_argument(
+            '--workers', type=int, default=1,
+            help='Jumlah proses; tiap proses menulis rentang user sendiri'
+        )
+        parser.add_argument('--skip-search-index', action='store_true')
+
+    def handle(self, *args, **options):
+        scale = Scale(
+            users=options['users'],
+            projects_per_user=options['projects_per_user'],
+            tasks_per_project=options['tasks_per_project'],
+            team_size=options['team_size'],
+            activities_per_user=options['activities_per_user'],
+        )
+        prefix = options['prefix']
+        if scale.users < 1:
+            raise CommandError('At least one user is required.')
+        if options['batch_size'] < 1 or options['workers'] < 1:
+            raise CommandError('--batch-size and --workers must be positive.')
+        if options['workers'] > 1 and connection.vendor == 'sqlite' and connection.is_in_memory_db():
+            raise CommandError('--workers requires a file-backed database.')
+        if get_user_model().objects.filter(username=f'{prefix}0').exists():
+            raise CommandError(f'Data with prefix "{prefix}" already exists; use another --prefix.')
+
+        self.stdout.write(f'Seeding {scale.as_dict()} with {options["workers"]} worker(s) ...')
+        started = perf_counter()
+        counts = seed(
+            scale,
+            prefix=prefix,
+            password=options['password'],
+            seed_value=options['seed'],
+            workers=options['workers'],
+            batch_size=options['batch_size'],
+            search_index=not options['skip_search_index'],
+        )
+        elapsed = perf_counter() - started
+
+        total = sum(counts.values())
+        for name, count in counts.items():
+            self.stdout.write(f'{name:<14}{count:>12}')
+        self.stdout.write(self.style.SUCCESS(
+            f'{total} rows in {elapsed:.1f}s ({total / max(elapsed, 1e-9):.0f} rows/s)'
+        ))
@@ -0,0 +1,52 @@
+from django.shortcuts import get_object_or_404
+
+from .models import Project
+
+
+class SingleFetchObjectMixin:
+    """
+    Ambil object sekali per request, lalu pakai ulang di test_func, form, dan context
+    """
+    select_related_fields = ()
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.select_related_fields:
+            queryset = queryset.select_related(*self.select_related_fields)
+        return queryset
+
+    def get_object(self, queryset=None):
+        if queryset is not None:
+            return super().get_object(queryset)
+        if not hasattr(self, '_object_cache'):
+            self._object_cache = super().get_object()
+        return self._object_cache
+
+
+class ProjectObjectMixin(SingleFetchObjectMixin):
+    """
+    Untuk view dengan object Project
+    """
+    select_related_fields = ('owner', 'category')
+
+
+class ProjectTaskObjectMixin(SingleFetchObjectMixin):
+    """
+    Untuk view dengan object ProjectTask (project ikut dimuat untuk cek akses)
+    """
+    select_related_fields = ('project', 'project__owner', 'project__category', 'assigned_to')
+
+
+class ParentProjectMixin:
+    """
+    Untuk view yang bekerja di bawah satu project (kwarg project_pk)
+    """
+    project_url_kwarg = 'project_pk'
+
+    def get_project(self):
+        if not hasattr(self, '_project_cache'):
+            self._project_cache = get_object_or_404(
+                Project.objects.select_related('owner', 'category'),
+                pk=self.kwargs[self.project_url_kwarg]
+            )
+        return self._project_cache
@@ -1,7 +1,10 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings
 from django.utils import timezone
+from django.core.exceptions import ValidationError
 from django.core.validators import MinLengthValidator, MinValueValidator, MaxValueValidator
 from django.utils.text import slugify
 from django.urls import reverse
@@ -151,10 +154,32 @@ class Project(models.Model):
         blank=True
     )
 
+    # Jumlah task per status, dijaga oleh signal ProjectTask
+    tasks_total = models.PositiveIntegerField(_('Total Tasks'), default=0, editable=False)
+    tasks_todo = models.PositiveIntegerField(_('To Do Tasks'), default=0, editable=False)
+    tasks_in_progress = models.PositiveIntegerField(_('In Progress Tasks'), default=0, editable=False)
+    tasks_review = models.PositiveIntegerField(_('In Review Tasks'), default=0, editable=False)
+    tasks_done = models.PositiveIntegerField(_('Done Tasks'), default=0, editable=False)
+
+    TASK_COUNTER_FIELDS = {
+        'todo': 'tasks_todo',
+        'in_progress': 'tasks_in_progress',
+        'review': 'tasks_review',
+        'done': 'tasks_done',
+    }
+    TASK_COUNTER_ATTNAMES = {'tasks_total', *TASK_COUNTER_FIELDS.values()}
+
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Pemilik saat dimuat, untuk invalidasi cache akses bila pemilik berganti
+        instance._original_owner_id = instance.__dict__.get('owner_id')
+        return instance
+
     def save(self, *args, **kwargs):
         # Automatically generate slug if not provided
         if not self.slug:
@@ -165,10 +190,17 @@ class Project(models.Model):
             if self.start_date > self.end_date:
                 raise ValueError(_("End date must be after start date"))
 
+        # Counter task hanya diubah lewat F-expression, jangan ditimpa nilai lama
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.attname not in self.TASK_COUNTER_ATTNAMES
+            ]
+
         super().save(*args, **kwargs)
 
     def get_absolute_url(self):
-        return reverse('project_detail', kwargs={'slug': self.slug})
+        return reverse('project_detail_slug', kwargs={'slug': self.slug})
 
     def __str__(self):
         return self.title
@@ -187,22 +219,113 @@ class Project(models.Model):
             return (self.end_date - self.start_date).days
         return None
 
+    @property
+    def task_progress(self):
+        """
+        Persentase task selesai berdasarkan counter, tanpa query ke tabel task
+        """
+        if not self.tasks_total:
+            return 0
+        return (self.tasks_done / self.tasks_total) * 100
+
     def update_progress(self):
         """
         Update progress proyek berdasarkan task
         """
-        tasks = self.tasks.all()
-        if tasks:
-            completed_tasks = tasks.filter(status='done').count()
-            total_tasks = tasks.count()
-            self.progress = (completed_tasks / total_tasks) * 100
-            self.save()
+        self.refresh_from_db(fields=['tasks_total', 'tasks_done'])
+        if self.tasks_total:
+            self.progress = int(self.task_progress)
+            self.save(update_fields=['progress', 'updated_at'])
+
+    @staticmethod
+    def _shift_counter(field, delta):
+        # Counter yang drift tidak boleh turun di bawah 0 (CHECK PositiveIntegerField)
+        return Greatest(F(field) + delta, Value(0)) if delta < 0 else F(field) + delta
+
+    @classmethod
+    def adjust_task_counters(cls, project_id, added=None, removed=None):
+        """
+        Tambah/kurangi counter task dengan F-expression agar aman untuk penulis bersamaan
+        """
+        changes = {}
+        for status, delta in ((added, 1), (removed, -1)):
+            if status is None:
+                continue
+            changes['tasks_total'] = changes.get('tasks_total', 0) + delta
+            field = cls.TASK_COUNTER_FIELDS.get(status)
+            if field:
+                changes[field] = changes.get(field, 0) + delta
+
+        updates = {
+            field: cls._shift_counter(field, delta)
+            for field, delta in changes.items()
+            if delta
+        }
+        if updates:
+            cls.objects.filter(pk=project_id).update(**updates)
+
+    @classmethod
+    def move_task_counters(cls, project_id, transitions):
+        """
+        Geser counter untuk banyak perpindahan status (status lama, status baru) dalam satu UPDATE
+        """
+        changes = {}
+        for previous, current in transitions:
+            for status, delta in ((previous, -1), (current, 1)):
+                field = cls.TASK_COUNTER_FIELDS.get(status)
+                if field:
+                    changes[field] = changes.get(field, 0) + delta
+
+        updates = {
+            field: cls._shift_counter(field, delta)
+            for field, delta in changes.items()
+            if delta
+        }
+        if updates:
+            cls.objects.filter(pk=project_id).update(**updates)
+
+    @classmethod
+    def rebuild_task_counters(cls, queryset=None):
+        """
+        Hitung ulang semua counter task dalam satu UPDATE (perbaikan drift)
+        """
+        if queryset is None:
+            queryset = cls.objects.all()
+
+        def task_count(status=None):
+            tasks = ProjectTask.objects.filter(project=OuterRef('pk'))
+            if status:
+                tasks = tasks.filter(status=status)
+            counted = tasks.order_by().values('project').annotate(count=Count('pk')).values('count')
+            return Coalesce(Subquery(counted), 0)
+
+        updates = {'tasks_total': task_count()}
+        for status, field in cls.TASK_COUNTER_FIELDS.items():
+            updates[field] = task_count(status)
+        return queryset.order_by().update(**updates)
+
+    @classmethod
+    def recompute_progress(cls, queryset=None):
+        """
+        Set progress dari counter untuk banyak project sekaligus (satu UPDATE)
+        """
+        queryset = cls.objects.all() if queryset is None else queryset
+        return queryset.order_by().filter(tasks_total__gt=0).update(
+            progress=F('tasks_done') * 100 / F('tasks_total'),
+            updated_at=timezone.now(),
+        )
 
     class Meta:
         verbose_name = _('Project')
         verbose_name_plural = _('Projects')
         ordering = ['-created_at']
         unique_together = ['title', 'owner']
+        indexes = [
+            # Urutan default, cursor pagination, dan date_hierarchy admin
+            models.Index(fields=['created_at']),
+            # Project milik user terurut terbaru (dashboard, daftar project)
+            models.Index(fields=['owner', 'created_at'], name='project_owner_created_idx'),
+        ]
 
 
 class ProjectTask(models.Model):
@@ -257,18 +380,74 @@ class ProjectTask(models.Model):
         null=True,
         blank=True
     )
+
+    # Penjadwalan (hari kerja, relatif ke awal project), dijaga oleh projects.scheduling
+    duration = models.PositiveIntegerField(
+        verbose_name=_('Duration (days)'),
+        default=1
+    )
+    earliest_start = models.PositiveIntegerField(
+        verbose_name=_('Earliest Start'),
+        default=0,
+        editable=False
+    )
+    # Jalur terpanjang dari awal task ini sampai akhir project (termasuk durasinya sendiri)
+    downstream_length = models.PositiveIntegerField(
+        verbose_name=_('Downstream Length'),
+        default=1,
+        editable=False
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.remember_counted_state()
+        instance._original_duration = instance.__dict__.get('duration')
+        return instance
+
+    def remember_counted_state(self):
+        """
+        Simpan project dan status yang sudah tercatat di counter Project
+        """
+        project_id = self.__dict__.get('project_id')
+        status = self.__dict__.get('status')
+        # Field yang di-defer berarti state lama tidak diketahui
+        if project_id is None or status is None:
+            self._counted_state = None
+        else:
+            self._counted_state = (project_id, status)
+
+    def get_counted_state(self):
+        return getattr(self, '_counted_state', None)
+
     def save(self, *args, **kwargs):
         # Validate due date
         if self.due_date and self.due_date < timezone.now().date():
             raise ValueError(_("Due date cannot be in the past"))
-        super().save(*args, **kwargs)
+
+        # Task baru belum punya dependensi: mulai di hari 0, jalurnya hanya dirinya
+        if self._state.adding:
+            self.earliest_start = 0
+            self.downstream_length = self.duration
+
+        # Counter project diperbarui oleh signal di transaksi yang sama
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic(using=kwargs.get('using')):
+            return super().delete(*args, **kwargs)
 
     def __str__(self):
         return self.title
 
+    @property
+    def earliest_finish(self):
+        return self.earliest_start + self.duration
+
     def is_overdue(self):
         """
         Cek apakah tugas sudah melewati tanggal jatuh tempo
@@ -279,4 +458,75 @@ class ProjectTask(models.Model):
         verbose_name = _('Project Task')
         verbose_name_plural = _('Project Tasks')
         ordering = ['due_date']
-        unique_together = ['title', 'project']  # Ensure task titles are unique within a project
\ No newline at end of file
+        unique_together = ['title', 'project']  # Ensure task titles are unique within a project
+        indexes = [
+            # Urutan default dan date_hierarchy admin
+            models.Index(fields=['due_date']),
+            # Hitung task per status (counter, index-only)
+            models.Index(fields=['project', 'status'], name='task_project_status_idx'),
+            # Task satu project terurut due_date (papan Kanban, ekspor)
+            models.Index(fields=['project', 'due_date'], name='task_project_due_idx'),
+            # Cursor pagination task di halaman detail project
+            models.Index(fields=['project', 'created_at'], name='task_project_created_idx'),
+            # Task milik assignee per status terurut due_date; task tanpa assignee tidak diindeks
+            models.Index(
+                fields=['assigned_to', 'status', 'due_date'],
+                condition=Q(assigned_to__isnull=False),
+                name='task_assignee_status_due_idx',
+            ),
+        ]
+
+
+class TaskDependency(models.Model):
+    """
+    Dependensi finish-to-start: successor baru bisa mulai setelah predecessor selesai
+    """
+    # Disalin dari task agar seluruh graf satu project bisa dimuat dengan satu query
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name='task_dependencies',
+        editable=False
+    )
+    predecessor = models.ForeignKey(
+        ProjectTask,
+        on_delete=models.CASCADE,
+        related_name='successor_links'
+    )
+    successor = models.ForeignKey(
+        ProjectTask,
+        on_delete=models.CASCADE,
+        related_name='predecessor_links'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def clean(self):
+        from .scheduling import creates_cycle
+
+        if not self.predecessor_id or not self.successor_id:
+            return
+        if self.predecessor.project_id != self.successor.project_id:
+            raise ValidationError(_('Dependent tasks must belong to the same project.'))
+        if creates_cycle(self.predecessor_id, self.successor_id):
+            raise ValidationError(_('This dependency would create a cycle.'))
+
+    def save(self, *args, **kwargs):
+        # Diperiksa juga di sini, bukan hanya di clean(): save() langsung tidak lewat validasi form
+        if self.predecessor.project_id != self.successor.project_id:
+            raise ValidationError(_('Dependent tasks must belong to the same project.'))
+        if self.project_id is None:
+            self.project_id = self.successor.project_id
+        # Jadwal dihitung ulang oleh signal; siklus membatalkan seluruh transaksi
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f'{self.predecessor_id} -> {self.successor_id}'
+
+    class Meta:
+        verbose_name = _('Task Dependency')
+        verbose_name_plural = _('Task Dependencies')
+        unique_together = ['predecessor', 'successor']
+        indexes = [
+            models.Index(fields=['successor']),
+        ]
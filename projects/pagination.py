@@ -0,0 +1,162 @@
+"""
+Pagination berbasis cursor (keyset) untuk listing project dan task
+"""
+import base64
+import datetime
+import decimal
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from django.http import Http404
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _json_value(value):
+    # isoformat penuh: presisi mikrodetik dibutuhkan untuk perbandingan yang tepat
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    return value
+
+
+class CursorPage:
+    """
+    Satu halaman hasil; tidak pernah menghitung total baris
+    """
+
+    def __init__(self, object_list, has_next, has_previous, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+
+class CursorPaginator:
+    """
+    Paginator keyset: setiap halaman memakai WHERE pada kolom urutan,
+    sehingga halaman ke-1000 sama murahnya dengan halaman pertama
+    """
+
+    def __init__(self, queryset, per_page, ordering=('-created_at', '-id')):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+
+    def _field_names(self):
+        return [name.lstrip('-') for name in self.ordering]
+
+    def _to_python(self, name, value):
+        try:
+            field = self.queryset.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            # Anotasi (misalnya search_rank) disimpan apa adanya
+            return value
+        if value is None:
+            return None
+        try:
+            return field.to_python(value)
+        except ValidationError:
+            raise InvalidCursor(name)
+
+    def encode_cursor(self, obj, direction):
+        values = [_json_value(getattr(obj, name)) for name in self._field_names()]
+        payload = json.dumps({'v': values, 'd': direction})
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+            values, direction = payload['v'], payload['d']
+        except (ValueError, TypeError, KeyError):
+            raise InvalidCursor(cursor)
+        if direction not in ('next', 'prev') or len(values) != len(self.ordering):
+            raise InvalidCursor(cursor)
+        names = self._field_names()
+        return [self._to_python(name, value) for name, value in zip(names, values)], direction
+
+    def _keyset_filter(self, values, reverse):
+        """
+        (a, b) setelah (va, vb) => a > va OR (a = va AND b > vb), arah mengikuti ordering
+        """
+        condition = Q()
+        equal = Q()
+        for name, value in zip(self.ordering, values):
+            field = name.lstrip('-')
+            descending = name.startswith('-') != reverse
+            lookup = 'lt' if descending else 'gt'
+            condition |= equal & Q(**{f'{field}__{lookup}': value})
+            equal &= Q(**{field: value})
+        return condition
+
+    def page(self, cursor=None):
+        queryset = self.queryset
+        direction = 'next'
+        if cursor:
+            values, direction = self.decode_cursor(cursor)
+            queryset = queryset.filter(self._keyset_filter(values, reverse=direction == 'prev'))
+
+        ordering = self.ordering
+        if direction == 'prev':
+            ordering = tuple(
+                name[1:] if name.startswith('-') else f'-{name}' for name in ordering
+            )
+
+        # Ambil satu baris lebih untuk tahu apakah masih ada halaman berikutnya
+        rows = list(queryset.order_by(*ordering)[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        if direction == 'prev':
+            rows.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, bool(cursor)
+
+        next_cursor = self.encode_cursor(rows[-1], 'next') if rows and has_next else None
+        previous_cursor = self.encode_cursor(rows[0], 'prev') if rows and has_previous else None
+        return CursorPage(rows, has_next, has_previous, next_cursor, previous_cursor)
+
+
+class CursorPaginationMixin:
+    """
+    Mixin untuk ListView: ganti pagination OFFSET dengan cursor
+    """
+    cursor_ordering = ('-created_at', '-id')
+    cursor_kwarg = 'cursor'
+
+    def get_cursor_ordering(self):
+        return self.cursor_ordering
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = CursorPaginator(queryset, page_size, self.get_cursor_ordering())
+        cursor = self.request.GET.get(self.cursor_kwarg)
+        try:
+            page = paginator.page(cursor)
+        except InvalidCursor:
+            raise Http404('Invalid cursor.')
+        return paginator, page, page.object_list, page.has_other_pages()
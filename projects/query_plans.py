@@ -0,0 +1,189 @@
+"""
+Audit rencana query untuk queryset yang paling sering dijalankan.
+
+Setiap queryset di HOT_QUERIES dikompilasi (tidak dieksekusi) lalu dijalankan
+lewat EXPLAIN QUERY PLAN. Baris rencana yang ditandai:
+
+- full_scan: SCAN tabel tanpa indeks (bukan tabel virtual FTS);
+- temp_btree: USE TEMP B-TREE untuk ORDER BY/GROUP BY/DISTINCT.
+
+SCAN ... USING INDEX tidak ditandai: itu penelusuran indeks terurut (ORDER BY
+dengan LIMIT). Temuan yang memang tidak terhindarkan dicantumkan di `allow`
+beserta alasannya. Hanya untuk SQLite.
+"""
+import uuid
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.db.models import Count
+
+from accounts.models import UserActivity
+
+from .access import TeamMembership, visible_projects
+from .kanban import board_queryset
+from .models import Project, ProjectTask, TaskDependency
+from .pagination import CursorPaginator
+from .search import search_projects
+
+FULL_SCAN = 'full_scan'
+TEMP_BTREE = 'temp_btree'
+
+
+class HotQuery:
+    def __init__(self, name, build, allow=(), note=''):
+        self.name = name
+        self.build = build
+        self.allow = frozenset(allow)
+        self.note = note
+
+
+HOT_QUERIES = {}
+
+
+def hot_query(name, allow=(), note=''):
+    """
+    Daftarkan fungsi `build(context) -> QuerySet` sebagai query yang diaudit
+    """
+    def register(build):
+        HOT_QUERIES[name] = HotQuery(name, build, allow, note)
+        return build
+    return register
+
+
+class AuditContext:
+    """
+    Object contoh yang tidak disimpan; rencana query tidak bergantung pada nilai parameter
+    """
+
+    def __init__(self):
+        self.user = get_user_model()(pk=uuid.UUID(int=1), username='audit')
+        self.project = Project(pk=1, owner_id=self.user.pk)
+        self.today = date(2000, 1, 1)
+
+
+def _page_query(queryset, ordering, per_page):
+    return queryset.order_by(*ordering)[:per_page + 1]
+
+
+@hot_query('visible_project_ids')
+def _visible_project_ids(context):
+    return visible_projects(context.user).order_by().values_list('pk', flat=True)
+
+
+@hot_query(
+    'project_list', allow={TEMP_BTREE},
+    note='OR pemilik/anggota tim digabung dari dua indeks lalu diurutkan (sebanyak project user)',
+)
+def _project_list(context):
+    return _page_query(visible_projects(context.user), ('-created_at', '-id'), 10)
+
+
+@hot_query(
+    'project_search', allow={TEMP_BTREE},
+    note='Hasil FTS diurutkan berdasarkan relevansi (bm25)',
+)
+def _project_search(context):
+    return search_projects(visible_projects(context.user), 'alpha')[:11]
+
+
+@hot_query('owned_projects')
+def _owned_projects(context):
+    return _page_query(Project.objects.filter(owner_id=context.user.pk), ('-created_at', '-id'), 10)
+
+
+@hot_query('user_team_projects')
+def _user_team_projects(context):
+    return TeamMembership.objects.filter(customuser_id=context.user.pk).values('project_id')
+
+
+@hot_query('project_team_members')
+def _project_team_members(context):
+    return TeamMembership.objects.filter(project_id=context.project.pk).values('customuser_id')
+
+
+@hot_query('project_detail_tasks')
+def _project_detail_tasks(context):
+    tasks = context.project.tasks.select_related('assigned_to')
+    return _page_query(tasks, CursorPaginator(tasks, 20).ordering, 20)
+
+
+@hot_query('project_board')
+def _project_board(context):
+    return board_queryset(context.project)
+
+
+@hot_query('project_task_status_counts')
+def _project_task_status_counts(context):
+    # Bentuk subquery Project.rebuild_task_counters
+    return (
+        ProjectTask.objects.filter(project_id=context.project.pk, status='done')
+        .order_by().values('project').annotate(count=Count('pk')).values('count')
+    )
+
+
+@hot_query('assigned_open_tasks')
+def _assigned_open_tasks(context):
+    return ProjectTask.objects.filter(assigned_to_id=context.user.pk, status='todo').order_by('due_date')[:20]
+
+
+@hot_query('tasks_by_due_date')
+def _tasks_by_due_date(context):
+    return ProjectTask.objects.filter(due_date__gte=context.today).order_by('due_date')[:100]
+
+
+@hot_query('project_schedule_graph')
+def _project_schedule_graph(context):
+    return TaskDependency.objects.filter(project_id=context.project.pk).values_list(
+        'predecessor_id', 'successor_id'
+    ).order_by()
+
+
+@hot_query('user_recent_activities')
+def _user_recent_activities(context):
+    return UserActivity.get_user_activities(context.user)[:50]
+
+
+def explain(queryset, using=None):
+    """
+    Baris `detail` EXPLAIN QUERY PLAN untuk queryset (tanpa mengeksekusinya)
+    """
+    using = using or queryset.db
+    sql, params = queryset.query.sql_with_params()
+    with connections[using].cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+        return [row[-1] for row in cursor.fetchall()]
+
+
+def classify(detail):
+    """
+    Jenis temuan untuk satu baris rencana, atau None bila baik
+    """
+    if detail.startswith('SCAN ') and ' INDEX' not in detail and 'VIRTUAL TABLE' not in detail:
+        return FULL_SCAN
+    if 'USE TEMP B-TREE' in detail:
+        return TEMP_BTREE
+    return None
+
+
+def audit(names=None, using='default'):
+    """
+    Rencana dan temuan per query; `issues` hanya berisi temuan yang tidak diizinkan
+    """
+    if connections[using].vendor != 'sqlite':
+        raise ImproperlyConfigured('Query plan audit supports SQLite only.')
+    context = AuditContext()
+    results = []
+    for name in names or HOT_QUERIES:
+        query = HOT_QUERIES[name]
+        plan = explain(query.build(context).using(using), using)
+        findings = [(classify(detail), detail) for detail in plan if classify(detail)]
+        results.append({
+            'name': name,
+            'plan': plan,
+            'issues': [(kind, detail) for kind, detail in findings if kind not in query.allow],
+            'allowed': [(kind, detail) for kind, detail in findings if kind in query.allow],
+            'note': query.note,
+        })
+    return results
@@ -0,0 +1,314 @@
+"""
+Penjadwalan task dengan metode jalur kritis (critical path).
+
+Dependensi finish-to-start disimpan sebagai tabel adjacency (TaskDependency).
+Per task disimpan dua angka, dalam hari relatif ke awal project:
+
+- earliest_start: jalur terpanjang dari awal project sampai task ini,
+  hanya bergantung pada task di hulu;
+- downstream_length: jalur terpanjang dari awal task ini sampai akhir
+  project, hanya bergantung pada task di hilir.
+
+Latest start dan slack diturunkan dari keduanya dan panjang project
+(makespan), sehingga perubahan satu task hanya menghitung ulang earliest_start
+di subgraf hilirnya dan downstream_length di subgraf hulunya. Perhitungan
+penuh memakai urutan topologis (Kahn), O(V+E).
+"""
+from collections import defaultdict, deque
+from datetime import timedelta
+
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from .models import ProjectTask, TaskDependency
+
+UPDATE_BATCH_SIZE = 500
+
+
+class CycleError(ValueError):
+    pass
+
+
+def _closure(task_ids, downstream=True):
+    """
+    Subquery (CTE rekursif) berisi `task_ids` beserta semua task di hilir/hulunya
+    """
+    dependency = TaskDependency._meta
+    source = dependency.get_field('predecessor' if downstream else 'successor').column
+    target = dependency.get_field('successor' if downstream else 'predecessor').column
+    placeholders = ', '.join(['%s'] * len(task_ids))
+    return RawSQL(
+        f"WITH RECURSIVE reach(id) AS ("
+        f"SELECT id FROM {ProjectTask._meta.db_table} WHERE id IN ({placeholders}) "
+        f"UNION SELECT dep.{target} FROM {dependency.db_table} dep JOIN reach ON dep.{source} = reach.id"
+        f") SELECT id FROM reach",
+        list(task_ids)
+    )
+
+
+def creates_cycle(predecessor_id, successor_id, using=None):
+    """
+    Cek siklus dengan satu query: predecessor sudah ada di hilir successor
+    """
+    if predecessor_id == successor_id:
+        return True
+    return ProjectTask.objects.using(using).filter(
+        pk=predecessor_id, pk__in=_closure([successor_id])
+    ).exists()
+
+
+class TaskGraph:
+    """
+    Graf dependensi satu project di memori
+    """
+
+    def __init__(self, durations, edges=(), earliest_start=None, downstream_length=None):
+        self.durations = dict(durations)
+        self.successors = defaultdict(list)
+        self.predecessors = defaultdict(list)
+        for predecessor, successor in edges:
+            self.add_edge(predecessor, successor)
+        self.earliest_start = dict(earliest_start or {})
+        self.downstream_length = dict(downstream_length or {})
+
+    @classmethod
+    def load(cls, project_id, using=None):
+        """
+        Dua query: task (dengan jadwal tersimpan) dan semua dependensi project
+        """
+        tasks = ProjectTask.objects.using(using).filter(project_id=project_id).values_list(
+            'pk', 'duration', 'earliest_start', 'downstream_length'
+        )
+        durations, earliest_start, downstream_length = {}, {}, {}
+        for pk, duration, start, downstream in tasks.order_by():
+            durations[pk] = duration
+            earliest_start[pk] = start
+            downstream_length[pk] = downstream
+        edges = TaskDependency.objects.using(using).filter(project_id=project_id).values_list(
+            'predecessor_id', 'successor_id'
+        )
+        return cls(durations, edges.order_by(), earliest_start, downstream_length)
+
+    @classmethod
+    def load_around(cls, project_id, forward=(), backward=(), using=None):
+        """
+        Dua query, hanya subgraf yang dibutuhkan reschedule(forward, backward):
+        hilir `forward` beserta predecessor-nya dan hulu `backward` beserta successor-nya
+        """
+        condition = Q()
+        if forward:
+            condition |= Q(successor_id__in=_closure(forward))
+        if backward:
+            condition |= Q(predecessor_id__in=_closure(backward, downstream=False))
+        if not condition:
+            return cls({})
+        edges = TaskDependency.objects.using(using).filter(condition, project_id=project_id).order_by()
+        tasks = ProjectTask.objects.using(using).filter(
+            Q(pk__in=[*forward, *backward])
+            | Q(pk__in=edges.values('predecessor_id'))
+            | Q(pk__in=edges.values('successor_id')),
+            project_id=project_id,
+        ).values_list('pk', 'duration', 'earliest_start', 'downstream_length')
+        durations, earliest_start, downstream_length = {}, {}, {}
+        edges = list(edges.values_list('predecessor_id', 'successor_id'))
+        for pk, duration, start, downstream in tasks.order_by():
+            durations[pk] = duration
+            earliest_start[pk] = start
+            downstream_length[pk] = downstream
+        return cls(durations, edges, earliest_start, downstream_length)
+
+    def add_edge(self, predecessor, successor):
+        self.successors[predecessor].append(successor)
+        self.predecessors[successor].append(predecessor)
+
+    def remove_edge(self, predecessor, successor):
+        self.successors[predecessor].remove(successor)
+        self.predecessors[successor].remove(predecessor)
+
+    def _reachable(self, roots, neighbours):
+        seen = set()
+        queue = deque(node for node in roots if node in self.durations)
+        seen.update(queue)
+        while queue:
+            for node in neighbours[queue.popleft()]:
+                if node not in seen and node in self.durations:
+                    seen.add(node)
+                    queue.append(node)
+        return seen
+
+    def descendants(self, roots):
+        return self._reachable(roots, self.successors)
+
+    def ancestors(self, roots):
+        return self._reachable(roots, self.predecessors)
+
+    def would_create_cycle(self, predecessor, successor):
+        return predecessor == successor or predecessor in self.descendants([successor])
+
+    def topological_order(self, nodes=None):
+        """
+        Urutan topologis (Kahn) atas `nodes` (default semua task); CycleError bila ada siklus
+        """
+        nodes = self.durations.keys() if nodes is None else nodes
+        indegree = dict.fromkeys(nodes, 0)
+        for node in indegree:
+            for successor in self.successors[node]:
+                if successor in indegree:
+                    indegree[successor] += 1
+
+        queue = deque(node for node, degree in indegree.items() if not degree)
+        order = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for successor in self.successors[node]:
+                if successor in indegree:
+                    indegree[successor] -= 1
+                    if not indegree[successor]:
+                        queue.append(successor)
+
+        if len(order) != len(indegree):
+            raise CycleError('Task dependencies contain a cycle.')
+        return order
+
+    def _forward(self, order):
+        changed = set()
+        durations, earliest_start = self.durations, self.earliest_start
+        for node in order:
+            start = 0
+            for predecessor in self.predecessors[node]:
+                if predecessor in durations:
+                    start = max(start, earliest_start[predecessor] + durations[predecessor])
+            if earliest_start.get(node) != start:
+                earliest_start[node] = start
+                changed.add(node)
+        return changed
+
+    def _backward(self, order):
+        changed = set()
+        durations, downstream_length = self.durations, self.downstream_length
+        for node in reversed(order):
+            tail = 0
+            for successor in self.successors[node]:
+                if successor in durations:
+                    tail = max(tail, downstream_length[successor])
+            length = durations[node] + tail
+            if downstream_length.get(node) != length:
+                downstream_length[node] = length
+                changed.add(node)
+        return changed
+
+    def schedule(self):
+        """
+        Hitung ulang seluruh graf; mengembalikan id task yang jadwalnya berubah
+        """
+        order = self.topological_order()
+        return self._forward(order) | self._backward(order)
+
+    def reschedule(self, forward=(), backward=()):
+        """
+        Hitung ulang hanya hilir dari `forward` (earliest_start) dan hulu dari
+        `backward` (downstream_length)
+        """
+        changed = set()
+        if forward:
+            changed |= self._forward(self.topological_order(self.descendants(forward)))
+        if backward:
+            changed |= self._backward(self.topological_order(self.ancestors(backward)))
+        return changed
+
+    @property
+    def makespan(self):
+        return max(self.downstream_length.values(), default=0)
+
+    def latest_start(self, node, makespan=None):
+        makespan = self.makespan if makespan is None else makespan
+        return makespan - self.downstream_length[node]
+
+    def slack(self, node, makespan=None):
+        return self.latest_start(node, makespan) - self.earliest_start[node]
+
+    def critical_path(self):
+        """
+        Satu jalur kritis (slack 0) dari awal sampai akhir project
+        """
+        makespan = self.makespan
+        current = next(
+            (node for node in self.durations
+             if not self.earliest_start[node] and self.downstream_length[node] == makespan),
+            None
+        )
+        path = []
+        while current is not None:
+            path.append(current)
+            remaining = self.downstream_length[current] - self.durations[current]
+            current = next(
+                (successor for successor in self.successors[current]
+                 if successor in self.durations and self.downstream_length[successor] == remaining
+                 and self.earliest_start[successor] == self.earliest_start[current] + self.durations[current]),
+                None
+            ) if remaining else None
+        return path
+
+
+def save_schedule(graph, task_ids, using=None):
+    """
+    Simpan jadwal task yang berubah dengan bulk_update
+    """
+    tasks = [
+        ProjectTask(
+            pk=pk,
+            earliest_start=graph.earliest_start[pk],
+            downstream_length=graph.downstream_length[pk],
+        )
+        for pk in task_ids
+        if pk in graph.durations
+    ]
+    if tasks:
+        ProjectTask.objects.using(using).bulk_update(
+            tasks, ['earliest_start', 'downstream_length'], batch_size=UPDATE_BATCH_SIZE
+        )
+    return len(tasks)
+
+
+def reschedule_project(project_id, using=None):
+    """
+    Perhitungan ulang penuh (mis. setelah impor atau perbaikan data)
+    """
+    graph = TaskGraph.load(project_id, using=using)
+    save_schedule(graph, graph.schedule(), using=using)
+    return graph
+
+
+def reschedule_around(project_id, forward=(), backward=(), using=None):
+    """
+    Perhitungan ulang inkremental setelah task/dependensi berubah (hanya subgraf terdampak)
+    """
+    graph = TaskGraph.load_around(project_id, forward=forward, backward=backward, using=using)
+    save_schedule(graph, graph.reschedule(forward=forward, backward=backward), using=using)
+    return graph
+
+
+def project_schedule(project):
+    """
+    Ringkasan jadwal project dari nilai tersimpan (tanpa perhitungan ulang)
+    """
+    graph = TaskGraph.load(project.pk)
+    start_date = project.start_date
+    makespan = graph.makespan
+    path = graph.critical_path()
+    titles = dict(ProjectTask.objects.filter(pk__in=path).values_list('pk', 'title'))
+    return {
+        'makespan': makespan,
+        'start_date': start_date,
+        'end_date': start_date + timedelta(days=makespan) if start_date else None,
+        'critical_path': [
+            {
+                'id': pk,
+                'title': titles.get(pk),
+                'earliest_start': graph.earliest_start[pk],
+                'duration': graph.durations[pk],
+            }
+            for pk in path
+        ],
+    }
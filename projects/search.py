@@ -0,0 +1,220 @@
+"""
+Indeks pencarian full-text (SQLite FTS5) untuk Project dan ProjectTask
+"""
+import re
+
+from django.db import connections, DEFAULT_DB_ALIAS
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+PROJECT_INDEX = 'projects_project_fts'
+TASK_INDEX = 'projects_projecttask_fts'
+
+# Bobot bm25 per kolom: judul lebih penting dari deskripsi
+TITLE_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+
+# Penanda sementara untuk highlight snippet, diganti setelah teks di-escape
+_MARK_START = '\x02'
+_MARK_END = '\x03'
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+_fts5_support = {}
+
+
+def search_available(using=DEFAULT_DB_ALIAS):
+    """
+    Cek apakah database mendukung FTS5
+    """
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return False
+    if using not in _fts5_support:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+            _fts5_support[using] = bool(cursor.fetchone()[0])
+    return _fts5_support[using]
+
+
+def create_search_tables(using=DEFAULT_DB_ALIAS, **kwargs):
+    """
+    Buat tabel virtual FTS5 (dipanggil dari post_migrate)
+    """
+    if not search_available(using):
+        return
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {PROJECT_INDEX} USING fts5("
+            "title, description, "
+            "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+        )
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {TASK_INDEX} USING fts5("
+            "title, description, project_id UNINDEXED, "
+            "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+        )
+
+
+def build_match_query(text):
+    """
+    Ubah input user menjadi query MATCH FTS5: setiap kata dicari sebagai prefix
+    """
+    tokens = _TOKEN_RE.findall(text or '')
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+
+def index_project(project, using=DEFAULT_DB_ALIAS):
+    if not search_available(using):
+        return
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {PROJECT_INDEX} WHERE rowid = %s", [project.pk])
+        cursor.execute(
+            f"INSERT INTO {PROJECT_INDEX} (rowid, title, description) VALUES (%s, %s, %s)",
+            [project.pk, project.title, project.description or '']
+        )
+
+
+def remove_project(project_id, using=DEFAULT_DB_ALIAS):
+    """
+    Hapus project beserta semua task-nya dari indeks (satu DELETE per tabel)
+    """
+    if not search_available(using):
+        return
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {PROJECT_INDEX} WHERE rowid = %s", [project_id])
+        cursor.execute(f"DELETE FROM {TASK_INDEX} WHERE project_id = %s", [project_id])
+
+
+def index_task(task, using=DEFAULT_DB_ALIAS):
+    if not search_available(using):
+        return
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {TASK_INDEX} WHERE rowid = %s", [task.pk])
+        cursor.execute(
+            f"INSERT INTO {TASK_INDEX} (rowid, title, description, project_id) "
+            "VALUES (%s, %s, %s, %s)",
+            [task.pk, task.title, task.description or '', task.project_id]
+        )
+
+
+def index_tasks(tasks, using=DEFAULT_DB_ALIAS):
+    """
+    Indeks banyak task baru sekaligus (misalnya hasil bulk_create)
+    """
+    if not search_available(using) or not tasks:
+        return
+    with connections[using].cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {TASK_INDEX} (rowid, title, description, project_id) "
+            "VALUES (%s, %s, %s, %s)",
+            [(task.pk, task.title, task.description or '', task.project_id) for task in tasks]
+        )
+
+
+def remove_task(task_id, using=DEFAULT_DB_ALIAS):
+    if not search_available(using):
+        return
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {TASK_INDEX} WHERE rowid = %s", [task_id])
+
+
+def rebuild_search_index(using=DEFAULT_DB_ALIAS):
+    """
+    Isi ulang seluruh indeks dari tabel project dan task
+    """
+    from .models import Project, ProjectTask
+
+    if not search_available(using):
+        return False
+    create_search_tables(using)
+    project_table = Project._meta.db_table
+    task_table = ProjectTask._meta.db_table
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {PROJECT_INDEX}")
+        cursor.execute(
+            f"INSERT INTO {PROJECT_INDEX} (rowid, title, description) "
+            f"SELECT id, title, COALESCE(description, '') FROM {project_table}"
+        )
+        cursor.execute(f"DELETE FROM {TASK_INDEX}")
+        cursor.execute(
+            f"INSERT INTO {TASK_INDEX} (rowid, title, description, project_id) "
+            f"SELECT id, title, COALESCE(description, ''), project_id FROM {task_table}"
+        )
+        cursor.execute(f"INSERT INTO {PROJECT_INDEX} ({PROJECT_INDEX}) VALUES ('optimize')")
+        cursor.execute(f"INSERT INTO {TASK_INDEX} ({TASK_INDEX}) VALUES ('optimize')")
+    return True
+
+
+def _ranked_search(queryset, index, text, fallback_fields):
+    match = build_match_query(text)
+    if not match:
+        return queryset
+    if not search_available(queryset.db):
+        # Database tanpa FTS5: kembali ke pencarian LIKE
+        condition = Q()
+        for field in fallback_fields:
+            condition |= Q(**{f'{field}__icontains': text})
+        return queryset.filter(condition)
+
+    table = queryset.model._meta.db_table
+    return queryset.filter(
+        pk__in=RawSQL(f"SELECT rowid FROM {index} WHERE {index} MATCH %s", [match])
+    ).annotate(
+        search_rank=RawSQL(
+            f"SELECT bm25({index}, %s, %s) FROM {index} "
+            f"WHERE {index} MATCH %s AND {index}.rowid = {table}.id",
+            [TITLE_WEIGHT, DESCRIPTION_WEIGHT, match]
+        )
+    ).order_by('search_rank', *queryset.model._meta.ordering)
+
+
+def search_projects(queryset, text):
+    """
+    Filter queryset Project dengan indeks FTS, diurutkan berdasarkan relevansi (bm25)
+    """
+    return _ranked_search(queryset, PROJECT_INDEX, text, ['title', 'description'])
+
+
+def search_tasks(queryset, text):
+    """
+    Filter queryset ProjectTask dengan indeks FTS, diurutkan berdasarkan relevansi (bm25)
+    """
+    return _ranked_search(queryset, TASK_INDEX, text, ['title', 'description'])
+
+
+def _highlight(snippet):
+    return mark_safe(
+        escape(snippet).replace(_MARK_START, '<mark>').replace(_MARK_END, '</mark>')
+    )
+
+
+def get_snippets(index, ids, text, using=DEFAULT_DB_ALIAS, tokens=16):
+    """
+    Snippet ber-highlight untuk baris tertentu saja (misalnya satu halaman hasil)
+    """
+    match = build_match_query(text)
+    ids = list(ids)
+    if not match or not ids or not search_available(using):
+        return {}
+
+    placeholders = ', '.join(['%s'] * len(ids))
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            f"SELECT rowid, snippet({index}, -1, %s, %s, '…', %s) FROM {index} "
+            f"WHERE {index} MATCH %s AND rowid IN ({placeholders})",
+            [_MARK_START, _MARK_END, tokens, match, *ids]
+        )
+        return {row_id: _highlight(snippet) for row_id, snippet in cursor.fetchall()}
+
+
+def attach_snippets(objects, text, index=PROJECT_INDEX):
+    """
+    Tambahkan atribut search_snippet ke setiap objek hasil pencarian
+    """
+    objects = list(objects)
+    snippets = get_snippets(index, [obj.pk for obj in objects], text)
+    for obj in objects:
+        obj.search_snippet = snippets.get(obj.pk, '')
+    return objects
@@ -0,0 +1,301 @@
+"""
+Dataset sintetis skala besar untuk benchmark dan staging.
+
+- Baris ditulis per batch besar (TableWriter: executemany; bulk_create hanya
+  untuk project yang pk-nya dibutuhkan) dalam satu transaksi per potongan
+  user, tanpa save() per objek dan tanpa signal.
+- Password di-hash sekali; semua user memakai hash yang sama.
+- Deterministik: ID user, slug project, dan isi acak diturunkan dari indeks
+  user dan seed, tidak bergantung pada urutan atau jumlah worker.
+- Pekerjaan dibagi per rentang user (CHUNK_USERS) sehingga bisa dikerjakan
+  beberapa proses, masing-masing menulis batch-nya sendiri. Semua user dibuat
+  lebih dulu agar anggota tim lintas rentang sudah ada.
+- Counter task, progress, dan indeks pencarian dihitung ulang sekali di akhir.
+"""
+import hashlib
+import multiprocessing
+import random
+import uuid
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection, connections, transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+from accounts.models import UserActivity
+
+from .models import Project, ProjectCategory, ProjectTask
+from .search import rebuild_search_index
+
+BATCH_SIZE = 5000
+CHUNK_USERS = 500
+DEFAULT_PASSWORD = 'bench-pass-123'
+# Worker menunggu lock tulis SQLite, bukan langsung gagal "database is locked"
+WORKER_BUSY_TIMEOUT_MS = 120000
+
+WORDS = (
+    'alpha', 'apollo', 'atlas', 'aurora', 'beacon', 'comet', 'delta', 'falcon',
+    'gemini', 'helios', 'horizon', 'nebula', 'orion', 'phoenix', 'polaris', 'zenith',
+)
+
+PROJECT_STATUSES = [value for value, _ in Project.STATUS_CHOICES]
+PROJECT_PRIORITIES = [value for value, _ in Project.PRIORITY_CHOICES]
+TASK_STATUSES = [value for value, _ in ProjectTask.STATUS_CHOICES]
+TASK_PRIORITIES = [value for value, _ in ProjectTask.PRIORITY_CHOICES]
+ACTIVITY_TYPES = [tag.value for tag in UserActivity.ActivityType]
+
+
+class Scale:
+    def __init__(self, users=20, projects_per_user=5, tasks_per_project=20, team_size=3,
+                 activities_per_user=20):
+        self.users = users
+        self.projects_per_user = projects_per_user
+        self.tasks_per_project = tasks_per_project
+        self.team_size = min(team_size, max(users - 1, 0))
+        self.activities_per_user = activities_per_user
+
+    def as_dict(self):
+        return dict(vars(self))
+
+
+def stable_uuid(*parts):
+    return uuid.UUID(bytes=hashlib.md5(':'.join(map(str, parts)).encode()).digest(), version=4)
+
+
+def user_id(prefix, index):
+    return stable_uuid(prefix, index)
+
+
+def user_rng(seed_value, index):
+    return random.Random(seed_value * 1000003 + index)
+
+
+def chunks(total, size=CHUNK_USERS):
+    return [(start, min(start + size, total)) for start in range(0, total, size)]
+
+
+def ensure_categories():
+    """
+    Semua ProjectCategory.CATEGORY_CHOICES ada; mengembalikan id terurut nama
+    """
+    ProjectCategory.objects.bulk_create(
+        [ProjectCategory(name=value, slug=slugify(value)) for value, _ in ProjectCategory.CATEGORY_CHOICES],
+        ignore_conflicts=True,
+    )
+    return list(ProjectCategory.objects.order_by('name').values_list('pk', flat=True))
+
+
+class TableWriter:
+    """
+    INSERT ke satu tabel lewat executemany per `batch_size` baris.
+
+    Statement disiapkan sekali, tanpa batas 999 parameter SQLite per
+    statement dan tanpa membuat instance model seperti bulk_create. Baris
+    berisi nilai untuk `fields` (urutan sama); hanya tipe yang perlu konversi
+    (tanggal, UUID, JSON) yang lewat get_db_prep_save. Kolom lain diisi nilai
+    default model yang dihitung sekali. pk tidak dikembalikan.
+    """
+    PREPARED_TYPES = {'DateField', 'DateTimeField', 'TimeField', 'DurationField', 'DecimalField',
+                      'UUIDField', 'JSONField'}
+
+    def __init__(self, model, fields, batch_size=BATCH_SIZE, using='default'):
+        self.database = connections[using]
+        self.batch_size = batch_size
+        self.rows = []
+        self.count = 0
+
+        opts = model._meta
+        given = [opts.get_field(name) for name in fields]
+        template = model()
+        defaults = [
+            field for field in opts.concrete_fields
+            if field not in given and not (field.primary_key and field.db_returning)
+        ]
+        self.defaults = [field.get_db_prep_save(field.pre_save(template, True), self.database) for field in defaults]
+        self.preparers = [
+            (index, field) for index, field in enumerate(given)
+            if (field.target_field if field.is_relation else field).get_internal_type() in self.PREPARED_TYPES
+        ]
+
+        quote = self.database.ops.quote_name
+        columns = given + defaults
+        self.sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+            quote(opts.db_table),
+            ', '.join(quote(field.column) for field in columns),
+            ', '.join(['%s'] * len(columns)),
+        )
+
+    def add(self, *values):
+        row = list(values)
+        for index, field in self.preparers:
+            row[index] = field.get_db_prep_save(row[index], self.database)
+        row.extend(self.defaults)
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.rows:
+            with self.database.cursor() as cursor:
+                cursor.executemany(self.sql, self.rows)
+            self.count += len(self.rows)
+            self.rows = []
+        return self.count
+
+
+def seed_users(prefix, password_hash, start, stop, batch_size=BATCH_SIZE):
+    users = TableWriter(
+        get_user_model(), ['id', 'username', 'email', 'password', 'first_name', 'last_name'], batch_size
+    )
+    with transaction.atomic():
+        for index in range(start, stop):
+            users.add(
+                user_id(prefix, index),
+                f'{prefix}{index}',
+                f'{prefix}{index}@example.com',
+                password_hash,
+                WORDS[index % len(WORDS)].title(),
+                f'User{index}',
+            )
+        return {'users': users.flush()}
+
+
+def seed_user_data(scale, prefix, start, stop, category_ids, seed_value=0, batch_size=BATCH_SIZE):
+    """
+    Project, anggota tim, task, dan aktivitas untuk user [start, stop)
+    """
+    today = timezone.now().date()
+    now = timezone.now()
+    team_members = TableWriter(Project.team_members.through, ['project', 'customuser'], batch_size)
+    tasks = TableWriter(ProjectTask, [
+        'project', 'title', 'description', 'status', 'priority', 'due_date', 'duration', 'downstream_length',
+    ], batch_size)
+    activities = TableWriter(
+        UserActivity, ['id', 'user', 'activity_type', 'ip_address', 'timestamp'], batch_size
+    )
+
+    with transaction.atomic():
+        projects = []
+        rngs = {}
+        for index in range(start, stop):
+            rng = rngs[index] = user_rng(seed_value, index)
+            owner_id = user_id(prefix, index)
+            for number in range(scale.projects_per_user):
+                projects.append(Project(
+                    title=f'{rng.choice(WORDS).title()} {prefix} {index}-{number}',
+                    # Slug deterministik, tidak lewat Project.save()
+                    slug=f'{prefix}-{index}-{number}',
+                    description=' '.join(rng.choices(WORDS, k=12)),
+                    owner_id=owner_id,
+                    # Round-robin atas urutan global project
+                    category_id=category_ids[(index * scale.projects_per_user + number) % len(category_ids)],
+                    status=rng.choice(PROJECT_STATUSES),
+                    priority=rng.choice(PROJECT_PRIORITIES),
+                ))
+        # pk dibutuhkan untuk task dan anggota tim (RETURNING)
+        projects = Project.objects.bulk_create(projects, batch_size=batch_size)
+
+        for offset, project in enumerate(projects):
+            index = start + offset // scale.projects_per_user
+            rng = rngs[index]
+            for step in range(1, scale.team_size + 1):
+                team_members.add(project.pk, user_id(prefix, (index + step) % scale.users))
+            for number in range(scale.tasks_per_project):
+                duration = rng.randint(1, 5)
+                tasks.add(
+                    project.pk,
+                    f'Task {number} {rng.choice(WORDS)}',
+                    ' '.join(rng.choices(WORDS, k=8)),
+                    rng.choice(TASK_STATUSES),
+                    rng.choice(TASK_PRIORITIES),
+                    today + timedelta(days=rng.randint(1, 180)),
+                    duration,
+                    duration,
+                )
+
+        for index in range(start, stop):
+            rng = rngs[index]
+            owner_id = user_id(prefix, index)
+            for number in range(scale.activities_per_user):
+                # Selang tetap per aktivitas: (user, activity_type, timestamp) selalu unik
+                activities.add(
+                    stable_uuid(prefix, 'activity', index, number),
+                    owner_id,
+                    rng.choice(ACTIVITY_TYPES),
+                    f'10.0.{rng.randint(0, 255)}.{rng.randint(1, 254)}',
+                    now - timedelta(seconds=number * 600 + rng.randint(0, 599)),
+                )
+
+        return {
+            'projects': len(projects),
+            'team_members': team_members.flush(),
+            'tasks': tasks.flush(),
+            'activities': activities.flush(),
+        }
+
+
+def _init_worker():
+    import django
+
+    django.setup()
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute(f'PRAGMA busy_timeout = {WORKER_BUSY_TIMEOUT_MS}')
+
+
+def _seed_users_chunk(args):
+    return seed_users(*args)
+
+
+def _seed_data_chunk(args):
+    return seed_user_data(*args)
+
+
+def _merge(results, counts):
+    for result in results:
+        for name, value in result.items():
+            counts[name] = counts.get(name, 0) + value
+    return counts
+
+
+def _run(function, jobs, workers):
+    if workers <= 1:
+        return [function(job) for job in jobs]
+    # Koneksi induk tidak boleh diwarisi proses anak
+    connections.close_all()
+    method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn'
+    with multiprocessing.get_context(method).Pool(workers, initializer=_init_worker) as pool:
+        return pool.map(function, jobs, chunksize=1)
+
+
+def seed(scale, prefix='bench', password=DEFAULT_PASSWORD, seed_value=0, workers=1,
+         batch_size=BATCH_SIZE, search_index=True):
+    """
+    Isi database sesuai `scale`; mengembalikan jumlah baris per jenis.
+    workers > 1 membutuhkan database file (bukan SQLite in-memory).
+    """
+    password_hash = make_password(password)
+    category_ids = ensure_categories()
+    ranges = chunks(scale.users)
+
+    counts = {'categories': len(category_ids), 'users': 0, 'projects': 0, 'team_members': 0,
+              'tasks': 0, 'activities': 0}
+    _merge(_run(
+        _seed_users_chunk,
+        [(prefix, password_hash, start, stop, batch_size) for start, stop in ranges],
+        workers,
+    ), counts)
+    _merge(_run(
+        _seed_data_chunk,
+        [(scale, prefix, start, stop, category_ids, seed_value, batch_size) for start, stop in ranges],
+        workers,
+    ), counts)
+
+    seeded = Project.objects.filter(slug__startswith=f'{prefix}-')
+    Project.rebuild_task_counters(seeded)
+    Project.recompute_progress(seeded)
+    if search_index:
+        rebuild_search_index()
+    return counts
@@ -0,0 +1,238 @@
+# projects/signals.py
+from django.db.models.signals import post_save, pre_delete, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from django.db.models import Q, QuerySet
+
+from . import search
+from .access import invalidate_on_commit
+from .cache import bump_on_commit, project_audience
+from .models import Project, ProjectTask, TaskDependency
+from .scheduling import reschedule_around
+
+SEARCH_FIELDS = {'title', 'description'}
+
+
+def _origin_model(origin):
+    return origin.model if isinstance(origin, QuerySet) else type(origin)
+
+
+@receiver(post_save, sender=ProjectTask)
+def update_task_counters_on_save(sender, instance, created, raw=False, **kwargs):
+    """
+    Sinkronkan counter task Project saat task dibuat atau diubah
+    """
+    if raw:
+        return
+
+    current = (instance.project_id, instance.status)
+    previous = None if created else instance.get_counted_state()
+
+    if created:
+        Project.adjust_task_counters(instance.project_id, added=instance.status)
+    elif previous is None:
+        # Status lama tidak diketahui, hitung ulang project ini saja
+        Project.rebuild_task_counters(Project.objects.filter(pk=instance.project_id))
+    elif previous != current:
+        previous_project_id, previous_status = previous
+        if previous_project_id == instance.project_id:
+            Project.adjust_task_counters(
+                instance.project_id, added=instance.status, removed=previous_status
+            )
+        else:
+            Project.adjust_task_counters(previous_project_id, removed=previous_status)
+            Project.adjust_task_counters(instance.project_id, added=instance.status)
+
+    instance._previous_counted_state = previous
+    instance.remember_counted_state()
+
+
+@receiver(post_delete, sender=ProjectTask)
+def update_task_counters_on_delete(sender, instance, origin=None, **kwargs):
+    """
+    Kurangi counter task Project saat task dihapus
+    """
+    if _origin_model(origin) is Project:
+        # Project-nya sendiri ikut terhapus: counter tidak perlu diubah
+        return
+    previous = instance.get_counted_state()
+    project_id, status = previous if previous else (instance.project_id, instance.status)
+    Project.adjust_task_counters(project_id, removed=status)
+
+
+@receiver(post_save, sender=Project)
+def index_project_on_save(sender, instance, using, update_fields=None, **kwargs):
+    """
+    Sinkronkan indeks pencarian saat judul/deskripsi project berubah
+    """
+    if update_fields is not None and not SEARCH_FIELDS & set(update_fields):
+        return
+    search.index_project(instance, using=using)
+
+
+@receiver(post_delete, sender=Project)
+def remove_project_from_index(sender, instance, using, **kwargs):
+    search.remove_project(instance.pk, using=using)
+
+
+@receiver(post_save, sender=ProjectTask)
+def index_task_on_save(sender, instance, using, update_fields=None, **kwargs):
+    """
+    Sinkronkan indeks pencarian task
+    """
+    if update_fields is not None and not (SEARCH_FIELDS | {'project'}) & set(update_fields):
+        return
+    search.index_task(instance, using=using)
+
+
+@receiver(post_delete, sender=ProjectTask)
+def remove_task_from_index(sender, instance, using, origin=None, **kwargs):
+    # Ikut terhapus bersama project: dihapus sekaligus oleh remove_project_from_index
+    if _origin_model(origin) is Project:
+        return
+    search.remove_task(instance.pk, using=using)
+
+
+@receiver(post_save, sender=Project)
+def invalidate_access_on_owner_change(sender, instance, created, using, **kwargs):
+    """
+    Reset cache project yang terlihat bila project baru dibuat atau pemilik berganti
+    """
+    previous_owner_id = getattr(instance, '_original_owner_id', None)
+    if created or previous_owner_id != instance.owner_id:
+        invalidate_on_commit(previous_owner_id, instance.owner_id, using=using)
+    instance._original_owner_id = instance.owner_id
+
+
+@receiver(post_delete, sender=Project)
+def invalidate_access_on_delete(sender, instance, using, **kwargs):
+    # ID project yang sudah terhapus di cache anggota tim tidak berbahaya: tidak ada lagi barisnya
+    invalidate_on_commit(instance.owner_id, using=using)
+
+
+@receiver(m2m_changed, sender=Project.team_members.through)
+def invalidate_access_on_team_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Reset cache akses untuk user yang ditambah/dihapus dari tim
+    """
+    if action == 'pre_clear':
+        # Simpan anggota lama sebelum dihapus semua
+        if reverse:
+            instance._cleared_team_user_ids = [instance.pk]
+        else:
+            instance._cleared_team_user_ids = list(
+                instance.team_members.values_list('pk', flat=True)
+            )
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if reverse:
+        user_ids = [instance.pk]
+    elif action == 'post_clear':
+        user_ids = getattr(instance, '_cleared_team_user_ids', [])
+    else:
+        user_ids = pk_set or []
+    invalidate_on_commit(*user_ids, using=kwargs.get('using'))
+    bump_on_commit(*user_ids, using=kwargs.get('using'))
+
+
+@receiver(post_save, sender=Project)
+def invalidate_fragments_on_project_save(sender, instance, created, using, **kwargs):
+    """
+    Naikkan versi cache dashboard/listing untuk semua user yang melihat project ini
+    """
+    user_ids = {instance.owner_id} if created else project_audience(instance.pk)
+    bump_on_commit(*user_ids, using=using)
+
+
+@receiver(pre_delete, sender=Project)
+def collect_audience_before_delete(sender, instance, **kwargs):
+    # Anggota tim ikut terhapus bersama project, simpan dulu
+    instance._cache_audience = project_audience(instance.pk)
+
+
+@receiver(post_delete, sender=Project)
+def invalidate_fragments_on_project_delete(sender, instance, using, **kwargs):
+    user_ids = getattr(instance, '_cache_audience', {instance.owner_id})
+    bump_on_commit(*user_ids, using=using)
+
+
+@receiver(post_save, sender=ProjectTask)
+@receiver(post_delete, sender=ProjectTask)
+def invalidate_fragments_on_task_change(sender, instance, using, origin=None, **kwargs):
+    """
+    Perubahan task mengubah counter/progress project di dashboard dan listing
+    """
+    if _origin_model(origin) is Project:
+        # Ikut terhapus bersama project: audiens sudah dikumpulkan collect_audience_before_delete
+        return
+    user_ids = project_audience(instance.project_id)
+    previous = getattr(instance, '_previous_counted_state', None)
+    if previous and previous[0] != instance.project_id:
+        user_ids |= project_audience(previous[0])
+    bump_on_commit(*user_ids, using=using)
+
+
+@receiver(post_save, sender=ProjectTask)
+def reschedule_on_duration_change(sender, instance, created, using, raw=False, update_fields=None, **kwargs):
+    """
+    Durasi berubah: hitung ulang hilir (earliest start) dan hulu (downstream length) task ini
+    """
+    previous = getattr(instance, '_original_duration', None)
+    instance._original_duration = instance.duration
+    if raw or created:
+        return
+    if update_fields is not None and 'duration' not in update_fields:
+        return
+    if previous != instance.duration:
+        reschedule_around(instance.project_id, forward=[instance.pk], backward=[instance.pk], using=using)
+
+
+@receiver(post_save, sender=TaskDependency)
+def reschedule_on_dependency_added(sender, instance, created, using, raw=False, **kwargs):
+    if raw or not created:
+        return
+    # CycleError di sini membatalkan transaksi TaskDependency.save()
+    reschedule_around(
+        instance.project_id, forward=[instance.successor_id], backward=[instance.predecessor_id], using=using
+    )
+
+
+@receiver(post_delete, sender=TaskDependency)
+def reschedule_on_dependency_removed(sender, instance, using, origin=None, **kwargs):
+    # Ikut terhapus bersama task/project: ditangani sekali oleh receiver task
+    if _origin_model(origin) is not TaskDependency:
+        return
+    reschedule_around(
+        instance.project_id, forward=[instance.successor_id], backward=[instance.predecessor_id], using=using
+    )
+
+
+@receiver(pre_delete, sender=ProjectTask)
+def collect_task_neighbours(sender, instance, origin=None, **kwargs):
+    """
+    Simpan tetangga di graf dependensi sebelum link-nya ikut terhapus
+    """
+    if _origin_model(origin) is Project:
+        return
+    links = TaskDependency.objects.filter(
+        Q(predecessor=instance) | Q(successor=instance)
+    ).values_list('predecessor_id', 'successor_id')
+    instance._schedule_neighbours = list(links)
+
+
+@receiver(post_delete, sender=ProjectTask)
+def reschedule_on_task_delete(sender, instance, using, origin=None, **kwargs):
+    if _origin_model(origin) is Project:
+        # Seluruh graf project ikut terhapus: tidak ada yang perlu dijadwal ulang
+        return
+    links = getattr(instance, '_schedule_neighbours', None)
+    if not links:
+        return
+    reschedule_around(
+        instance.project_id,
+        forward=[successor for predecessor, successor in links if predecessor == instance.pk],
+        backward=[predecessor for predecessor, successor in links if successor == instance.pk],
+        using=using,
+    )
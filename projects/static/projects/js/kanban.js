@@ -0,0 +1,72 @@
+// Drag-and-drop Kanban: perpindahan dikumpulkan lalu dikirim sebagai satu batch
+// ke endpoint task_status_batch ({"changes": {"<id>": "<status>"}}).
+document.addEventListener('DOMContentLoaded', function () {
+    const board = document.querySelector('[data-kanban-url]');
+    if (!board) return;
+
+    const url = board.dataset.kanbanUrl;
+    const csrfToken = board.dataset.csrfToken;
+    const pending = new Map();
+    let timer = null;
+    let dragged = null;
+
+    function refreshCounts() {
+        board.querySelectorAll('.kanban-column').forEach(function (column) {
+            column.querySelector('[data-kanban-count]').textContent =
+                column.querySelectorAll('.kanban-card').length;
+        });
+    }
+
+    function flush() {
+        if (!pending.size) return;
+        const changes = Object.fromEntries(pending);
+        pending.clear();
+        fetch(url, {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json', 'X-CSRFToken': csrfToken},
+            body: JSON.stringify({changes: changes})
+        })
+            .then(function (response) {
+                if (!response.ok) throw new Error(response.status);
+                return response.json();
+            })
+            .then(function (data) {
+                const progress = document.querySelector('[data-kanban-progress]');
+                if (progress) progress.textContent = data.progress;
+            })
+            .catch(function () {
+                // Papan sudah tidak sesuai dengan server
+                window.location.reload();
+            });
+    }
+
+    board.querySelectorAll('.kanban-card').forEach(function (card) {
+        card.addEventListener('dragstart', function (event) {
+            dragged = card;
+            event.dataTransfer.effectAllowed = 'move';
+        });
+    });
+
+    board.querySelectorAll('.kanban-column').forEach(function (column) {
+        column.addEventListener('dragover', function (event) {
+            event.preventDefault();
+            column.classList.add('drag-over');
+        });
+        column.addEventListener('dragleave', function () {
+            column.classList.remove('drag-over');
+        });
+        column.addEventListener('drop', function (event) {
+            event.preventDefault();
+            column.classList.remove('drag-over');
+            if (!dragged || dragged.parentNode === column) return;
+            column.appendChild(dragged);
+            pending.set(dragged.dataset.taskId, column.dataset.status);
+            refreshCounts();
+            // Beberapa perpindahan berturut-turut digabung dalam satu request
+            clearTimeout(timer);
+            timer = setTimeout(flush, 800);
+        });
+    });
+
+    window.addEventListener('beforeunload', flush);
+});
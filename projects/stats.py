@@ -0,0 +1,31 @@
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+
+from .access import visible_projects
+
+
+def get_dashboard_stats(user, recent_limit=5):
+    """
+    Statistik dashboard: satu query agregat untuk total, satu query untuk project terbaru
+    """
+    user_projects = visible_projects(user)
+
+    totals = user_projects.aggregate(
+        total_projects=Count('pk'),
+        ongoing_projects=Count('pk', filter=Q(status='in_progress')),
+        completed_projects=Count('pk', filter=Q(status='completed')),
+        total_tasks=Coalesce(Sum('tasks_total'), 0),
+    )
+
+    # Progress dibaca dari counter task yang tersimpan di Project
+    recent_projects = list(user_projects.order_by('-created_at', '-pk')[:recent_limit])
+    for project in recent_projects:
+        project.progress = project.task_progress
+
+    return {
+        'total_projects': totals['total_projects'],
+        'ongoing_projects': totals['ongoing_projects'],
+        'completed_projects': totals['completed_projects'],
+        'total_tasks': totals['total_tasks'],
+        'recent_projects': recent_projects,
+    }
@@ -1,3 +1,1071 @@
-from django.test import TestCase
+import csv
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase, RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils import timezone
+from django.urls import reverse
+
+from accounts.admin_tools import EstimatedCountPaginator
+
+from .benchmark import BenchmarkData, compare, percentile, run_benchmarks
+from .export import export_stream
+from .importer import import_tasks
+from .kanban import board_columns, move_tasks
+from .scheduling import CycleError, TaskGraph
+from .seeding import DEFAULT_PASSWORD, Scale, seed
+from .forms import ProjectForm, ProjectTaskForm, ProjectTeamForm
+from .access import can_manage_project, can_view_project, visible_project_ids, visible_projects
+from .models import Project, ProjectCategory, ProjectTask, TaskDependency
+from .pagination import CursorPaginator, InvalidCursor
+from .query_plans import FULL_SCAN, HOT_QUERIES, TEMP_BTREE, HotQuery, audit, classify, explain
+from .search import TASK_INDEX, attach_snippets, search_projects, search_tasks
+from .write_benchmark import run_write_benchmark
+from .stats import get_dashboard_stats
+from .views import (
+    DashboardView,
+    ProjectDeleteView,
+    ProjectDetailView,
+    ProjectListView,
+    ProjectTaskCreateView,
+    ProjectUpdateView,
+)
+
+
+def create_user(username):
+    return get_user_model().objects.create_user(
+        email=f'{username}@example.com',
+        username=username,
+        password='secret-pass-123'
+    )
+
+
+def create_projects(owner, count, tasks_per_project=3, prefix='Project'):
+    projects = []
+    for i in range(count):
+        project = Project.objects.create(
+            title=f'{prefix} {owner.username} {i}',
+            owner=owner,
+            status='in_progress' if i % 2 else 'completed'
+        )
+        for j in range(tasks_per_project):
+            ProjectTask.objects.create(
+                project=project,
+                title=f'Task {j}',
+                status='done' if j == 0 else 'todo'
+            )
+        projects.append(project)
+    return projects
+
+
+class DashboardStatsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = create_user('dashboard')
+        self.member = create_user('member')
+
+    def test_stats_values(self):
+        owned = create_projects(self.user, 3)
+        shared = create_projects(self.member, 1, prefix='Shared')[0]
+        shared.team_members.add(self.user, self.member)
+        create_projects(self.member, 2, prefix='Hidden')
+
+        stats = get_dashboard_stats(self.user)
+
+        self.assertEqual(stats['total_projects'], 4)
+        self.assertEqual(stats['ongoing_projects'], 1)
+        self.assertEqual(stats['completed_projects'], 3)
+        self.assertEqual(stats['total_tasks'], 12)
+        self.assertEqual(len(stats['recent_projects']), 4)
+        for project in stats['recent_projects']:
+            self.assertAlmostEqual(project.progress, 100 / 3)
+        self.assertIn(owned[0], stats['recent_projects'])
+
+    def test_query_count_does_not_grow_with_projects(self):
+        create_projects(self.user, 2)
+        with CaptureQueriesContext(connection) as small:
+            get_dashboard_stats(self.user)
+
+        create_projects(self.user, 20, prefix='More')
+        with CaptureQueriesContext(connection) as large:
+            get_dashboard_stats(self.user)
+
+        self.assertEqual(len(small), len(large))
+        self.assertLessEqual(len(large), 2)
+
+    def test_dashboard_view_query_count(self):
+        create_projects(self.user, 15)
+        request = RequestFactory().get('/projects/dashboard/')
+        request.user = self.user
+        view = DashboardView()
+        view.setup(request)
+
+        with self.assertNumQueries(2):
+            context = view.get_context_data()
+        self.assertEqual(context['total_projects'], 15)
+
+
+class ProjectTaskCounterTest(TestCase):
+    def setUp(self):
+        self.user = create_user('counter')
+        self.project = Project.objects.create(title='Counter project', owner=self.user)
+        self.other = Project.objects.create(title='Other project', owner=self.user)
+
+    def assertCounters(self, project, **expected):
+        project.refresh_from_db()
+        for field, value in expected.items():
+            self.assertEqual(getattr(project, field), value, field)
+
+    def test_create_update_delete(self):
+        task = ProjectTask.objects.create(project=self.project, title='One')
+        ProjectTask.objects.create(project=self.project, title='Two', status='done')
+        self.assertCounters(self.project, tasks_total=2, tasks_todo=1, tasks_done=1)
+
+        task = ProjectTask.objects.get(pk=task.pk)
+        task.status = 'review'
+        task.save()
+        self.assertCounters(self.project, tasks_total=2, tasks_todo=0, tasks_review=1)
+
+        task.project = self.other
+        task.save()
+        self.assertCounters(self.project, tasks_total=1, tasks_review=0, tasks_done=1)
+        self.assertCounters(self.other, tasks_total=1, tasks_review=1)
+
+        task.delete()
+        self.project.tasks.all().delete()
+        self.assertCounters(self.project, tasks_total=0, tasks_done=0)
+        self.assertCounters(self.other, tasks_total=0, tasks_review=0)
+
+    def test_rebuild_repairs_drift(self):
+        ProjectTask.objects.create(project=self.project, title='One', status='in_progress')
+        Project.objects.filter(pk=self.project.pk).update(tasks_total=7, tasks_in_progress=0)
+
+        Project.rebuild_task_counters()
+        self.assertCounters(self.project, tasks_total=1, tasks_in_progress=1, tasks_todo=0)
+        self.assertCounters(self.other, tasks_total=0)
+
+    def test_update_progress_reads_counters(self):
+        ProjectTask.objects.create(project=self.project, title='One', status='done')
+        ProjectTask.objects.create(project=self.project, title='Two')
+        self.project.update_progress()
+        self.assertCounters(self.project, progress=50)
+
+    def test_drifted_counters_never_block_deletes(self):
+        ProjectTask.objects.create(project=self.project, title='One')
+        task = ProjectTask.objects.create(project=self.project, title='Two', status='done')
+        Project.objects.filter(pk=self.project.pk).update(tasks_total=0, tasks_todo=0, tasks_done=0)
+
+        task.delete()
+        self.assertCounters(self.project, tasks_total=0, tasks_done=0)
+
+        self.project.delete()
+        self.assertFalse(Project.objects.filter(pk=self.project.pk).exists())
+
+    def test_stale_project_save_keeps_counters(self):
+        stale = Project.objects.get(pk=self.project.pk)
+        ProjectTask.objects.create(project=self.project, title='One')
+        stale.status = 'in_progress'
+        stale.save()
+        self.assertCounters(self.project, tasks_total=1, tasks_todo=1, status='in_progress')
+
+
+class ProjectSearchTest(TestCase):
+    def setUp(self):
+        self.user = create_user('searcher')
+        self.match = Project.objects.create(
+            title='Kubernetes migration',
+            description='Move <legacy> services to the cluster',
+            owner=self.user
+        )
+        self.weaker = Project.objects.create(
+            title='Website refresh',
+            description='Also touches kubernetes ingress',
+            owner=self.user
+        )
+        self.other = Project.objects.create(title='Mobile release', owner=self.user)
+
+    def test_ranked_prefix_search(self):
+        results = list(search_projects(Project.objects.all(), 'kube'))
+        self.assertEqual(results, [self.match, self.weaker])
+
+    def test_index_follows_updates_and_deletes(self):
+        self.other.description = 'Kubernetes operators'
+        self.other.save()
+        self.weaker.delete()
+        results = set(search_projects(Project.objects.all(), 'kubernetes'))
+        self.assertEqual(results, {self.match, self.other})
+
+    def test_snippets_are_escaped_and_highlighted(self):
+        project = attach_snippets([self.match], 'legacy')[0]
+        self.assertIn('<mark>legacy</mark>', project.search_snippet)
+        self.assertIn('&lt;', project.search_snippet)
+
+    def test_task_search(self):
+        task = ProjectTask.objects.create(project=self.other, title='Write release notes')
+        ProjectTask.objects.create(project=self.other, title='Sign build')
+        self.assertEqual(list(search_tasks(ProjectTask.objects.all(), 'notes')), [task])
+
+    def test_project_delete_clears_task_index_in_one_statement(self):
+        for number in range(5):
+            ProjectTask.objects.create(project=self.other, title=f'Release step {number}')
+        kept = ProjectTask.objects.create(project=self.match, title='Release cluster')
+
+        with CaptureQueriesContext(connection) as queries:
+            self.other.delete()
+        task_index_deletes = [
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].startswith(f'DELETE FROM {TASK_INDEX}')
+        ]
+        self.assertEqual(len(task_index_deletes), 1)
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT rowid FROM {TASK_INDEX}')
+            self.assertEqual([row[0] for row in cursor.fetchall()], [kept.pk])
+
+
+class CursorPaginatorTest(TestCase):
+    def setUp(self):
+        self.user = create_user('pager')
+        create_projects(self.user, 25, tasks_per_project=0)
+        # created_at kembar untuk menguji tie-breaker id
+        Project.objects.filter(title__endswith='1').update(
+            created_at=Project.objects.earliest('created_at').created_at
+        )
+        self.expected = list(Project.objects.order_by('-created_at', '-id'))
+
+    def test_walk_forward_and_back(self):
+        paginator = CursorPaginator(Project.objects.all(), 10)
+        pages, cursor = [], None
+        while True:
+            page = paginator.page(cursor)
+            pages.append(page)
+            if not page.has_next():
+                break
+            cursor = page.next_cursor
+
+        self.assertEqual([len(page) for page in pages], [10, 10, 5])
+        self.assertEqual([p for page in pages for p in page], self.expected)
+        self.assertFalse(pages[0].has_previous())
+
+        previous = paginator.page(pages[2].previous_cursor)
+        self.assertEqual(list(previous), list(pages[1]))
+        self.assertTrue(previous.has_previous())
+
+    def test_deep_page_is_single_query(self):
+        paginator = CursorPaginator(Project.objects.all(), 10)
+        cursor = paginator.page().next_cursor
+        with self.assertNumQueries(1):
+            paginator.page(cursor)
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(InvalidCursor):
+            CursorPaginator(Project.objects.all(), 10).page('not-a-cursor')
+
+
+class ProjectAccessTest(TestCase):
+    def setUp(self):
+        self.owner = create_user('owner')
+        self.member = create_user('teammate')
+        self.project = Project.objects.create(title='Access project', owner=self.owner)
+
+    def test_membership_changes_invalidate_cache(self):
+        self.assertFalse(can_view_project(self.member, self.project))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.team_members.add(self.member)
+        self.assertTrue(can_view_project(self.member, self.project))
+        with self.assertNumQueries(0):
+            can_view_project(self.member, self.project)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.team_members.clear()
+        self.assertFalse(can_view_project(self.member, self.project))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.member.team_projects.add(self.project)
+        self.assertTrue(can_view_project(self.member, self.project))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.team_members.remove(self.member)
+        self.assertFalse(can_view_project(self.member, self.project))
+
+    def test_cache_is_invalidated_only_after_commit(self):
+        self.project.team_members.add(self.member)
+        self.assertTrue(can_view_project(self.member, self.project))
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.project.team_members.remove(self.member)
+            # Belum commit: cache lama tetap, request lain tidak bisa mengisinya ulang sebelum commit
+            self.assertTrue(can_view_project(self.member, self.project))
+        for callback in callbacks:
+            callback()
+        self.assertFalse(can_view_project(self.member, self.project))
+
+    def test_owner_change_invalidates_cache(self):
+        self.assertEqual(visible_project_ids(self.member), frozenset())
+        project = Project.objects.get(pk=self.project.pk)
+        project.owner = self.member
+        with self.captureOnCommitCallbacks(execute=True):
+            project.save()
+        self.assertIn(project.pk, visible_project_ids(self.member))
+        self.assertNotIn(project.pk, visible_project_ids(self.owner))
+        self.assertFalse(can_manage_project(self.owner, project))
+
+    def test_visible_projects_has_no_duplicates(self):
+        self.project.team_members.add(self.owner, self.member)
+        self.assertEqual(list(visible_projects(self.owner)), [self.project])
+        self.assertEqual(list(visible_projects(self.member)), [self.project])
+
+
+class SingleFetchViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = create_user('fetchowner')
+        self.member = create_user('fetchmember')
+        self.project = create_projects(self.owner, 1, tasks_per_project=3)[0]
+        self.project.team_members.add(self.member)
+        self.factory = RequestFactory()
+
+    def request(self, view_class, user, method='get', data=None, **kwargs):
+        request = getattr(self.factory, method)('/', data or {})
+        request.user = user
+        request._messages = CookieStorage(request)
+        return view_class.as_view()(request, **kwargs)
+
+    def test_detail_view_queries(self):
+        with self.assertNumQueries(2):
+            response = self.request(ProjectDetailView, self.owner, pk=self.project.pk)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context_data['total_tasks'], 3)
+
+        # Anggota tim: satu query tambahan untuk set project yang terlihat
+        with self.assertNumQueries(3):
+            self.request(ProjectDetailView, self.member, pk=self.project.pk)
+
+    def test_detail_url_names_are_distinct(self):
+        self.assertEqual(reverse('project_detail', kwargs={'pk': self.project.pk}), f'/projects/{self.project.pk}/')
+        self.assertEqual(self.project.get_absolute_url(), f'/projects/{self.project.slug}/')
+
+    def test_update_and_delete_views_fetch_once(self):
+        with self.assertNumQueries(1):
+            response = self.request(ProjectUpdateView, self.owner, pk=self.project.pk)
+        self.assertEqual(response.status_code, 200)
+
+        with self.assertNumQueries(1):
+            response = self.request(ProjectDeleteView, self.owner, pk=self.project.pk)
+        self.assertEqual(response.status_code, 200)
+
+    def test_task_create_view_fetches_project_once(self):
+        with self.assertNumQueries(1):
+            response = self.request(ProjectTaskCreateView, self.owner, project_pk=self.project.pk)
+        self.assertEqual(response.context_data['project'], self.project)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.request(
+                ProjectTaskCreateView, self.owner, method='post',
+                data={
+                    'title': 'New task', 'status': 'todo', 'priority': 'medium',
+                    'assigned_to': self.member.pk
+                },
+                project_pk=self.project.pk
+            )
+        self.assertEqual(response.status_code, 302)
+        # Query yang memuat object Project lengkap (bukan subquery/ID saja)
+        project_selects = [
+            query['sql'] for query in queries.captured_queries
+            if query['sql'].startswith('SELECT "projects_project"."id", "projects_project"."title"')
+        ]
+        self.assertEqual(len(project_selects), 1)
+        self.assertTrue(self.project.tasks.filter(title='New task').exists())
+
+
+class FragmentCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = create_user('cached')
+        self.member = create_user('cachedmember')
+        self.project = create_projects(self.user, 3, tasks_per_project=1)[0]
+        self.factory = RequestFactory()
+
+    def get_dashboard(self, user):
+        request = self.factory.get('/projects/dashboard/')
+        request.user = user
+        view = DashboardView()
+        view.setup(request)
+        return view.get_context_data()
+
+    def get_list(self, user, **params):
+        request = self.factory.get('/projects/', params)
+        request.user = user
+        return ProjectListView.as_view()(request).context_data
+
+    def test_repeat_hits_skip_database(self):
+        self.get_dashboard(self.user)
+        self.get_list(self.user)
+        with self.assertNumQueries(0):
+            context = self.get_dashboard(self.user)
+            list_context = self.get_list(self.user)
+        self.assertEqual(context['total_tasks'], 3)
+        self.assertEqual(list_context['total_projects'], 3)
+
+    def test_task_change_invalidates_dashboard(self):
+        self.get_dashboard(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            ProjectTask.objects.create(project=self.project, title='Extra task')
+        self.assertEqual(self.get_dashboard(self.user)['total_tasks'], 4)
+
+    def test_team_change_invalidates_member_list(self):
+        self.assertEqual(self.get_list(self.member)['total_projects'], 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.team_members.add(self.member)
+        context = self.get_list(self.member)
+        self.assertEqual(context['total_projects'], 1)
+        self.assertEqual(list(context['projects']), [self.project])
+
+    def test_lost_version_key_does_not_revive_old_fragments(self):
+        self.get_dashboard(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            ProjectTask.objects.create(project=self.project, title='Extra task')
+        # Versi terhapus (eviction) sementara fragment versi sebelumnya masih tersimpan
+        cache.delete(f'projects:cache_version:{self.user.pk}')
+        self.assertEqual(self.get_dashboard(self.user)['total_tasks'], 4)
+
+    def test_project_delete_queries_do_not_grow_with_tasks(self):
+        small, large = create_projects(self.user, 2, tasks_per_project=2, prefix='Delete')
+        for number in range(30):
+            ProjectTask.objects.create(project=large, title=f'Bulk {number}')
+        large.team_members.add(self.member)
+        self.assertEqual(self.get_list(self.member)['total_projects'], 1)
+
+        with CaptureQueriesContext(connection) as small_queries:
+            small.delete()
+        with CaptureQueriesContext(connection) as large_queries:
+            with self.captureOnCommitCallbacks(execute=True):
+                large.delete()
+
+        self.assertEqual(len(small_queries), len(large_queries))
+        self.assertEqual(self.get_list(self.member)['total_projects'], 0)
+
+
+class UserPickerTest(TestCase):
+    def setUp(self):
+        self.owner = create_user('picker_owner')
+        self.member = create_user('picker_member')
+        get_user_model().objects.bulk_create([
+            get_user_model()(email=f'bulk{i}@example.com', username=f'bulk{i}') for i in range(200)
+        ])
+        self.project = Project.objects.create(title='Picker', owner=self.owner)
+        self.project.team_members.add(self.member)
+
+    def test_forms_do_not_load_every_user(self):
+        forms = [
+            ProjectForm(user=self.owner),
+            ProjectTeamForm(instance=self.project),
+            ProjectTaskForm(project=self.project),
+        ]
+        for form in forms:
+            with CaptureQueriesContext(connection) as queries:
+                html = str(form)
+            self.assertLessEqual(len(queries), 1)
+            self.assertNotIn('bulk1@example.com', html)
+
+    def test_team_form_renders_and_saves_selected_ids(self):
+        form = ProjectTeamForm(instance=self.project)
+        self.assertIn('picker_member', str(form['team_members']))
+
+        bulk_user = get_user_model().objects.get(username='bulk7')
+        form = ProjectTeamForm({'team_members': [str(self.member.pk), str(bulk_user.pk)]}, instance=self.project)
+        self.assertTrue(form.is_valid(), form.errors)
+        form.save()
+        self.assertEqual(self.project.team_members.count(), 2)
+
+    def test_member_autocomplete_is_limited_to_project(self):
+        self.client.force_login(self.owner)
+        url = reverse('project_member_autocomplete', kwargs={'project_pk': self.project.pk})
+
+        results = self.client.get(url, {'q': 'picker'}).json()['results']
+        self.assertEqual([item['id'] for item in results], [str(self.member.pk)])
+
+        self.client.force_login(create_user('outsider'))
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+
+class ScalableAdminTest(TestCase):
+    def setUp(self):
+        self.admin_user = get_user_model().objects.create_superuser(
+            email='root@example.com', username='root', password='secret-pass-123'
+        )
+        self.client.force_login(self.admin_user)
+        self.owner = create_user('admin_owner')
+
+    def changelist_queries(self, url, params=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries)
+
+    def test_task_changelist_queries_do_not_grow_with_rows(self):
+        url = reverse('admin:projects_projecttask_changelist')
+        create_projects(self.owner, 2, tasks_per_project=2)
+        self.changelist_queries(url)  # session dan snapshot user
+        _, small = self.changelist_queries(url)
+
+        assignee = create_user('assignee')
+        for project in create_projects(self.owner, 10, tasks_per_project=3, prefix='More'):
+            project.tasks.update(assigned_to=assignee)
+        response, large = self.changelist_queries(url)
+
+        self.assertEqual(small, large)
+        self.assertNotContains(response, 'More admin_owner 3</option>')
+
+    def test_autocomplete_filter_shows_selected_object(self):
+        project = create_projects(self.owner, 1, tasks_per_project=2, prefix='Chosen')[0]
+        create_projects(self.owner, 3, tasks_per_project=1, prefix='Other')
+        url = reverse('admin:projects_projecttask_changelist')
+
+        response, _ = self.changelist_queries(url, {'project__id__exact': project.pk})
+        self.assertContains(response, f'<option value="{project.pk}" selected>{project}</option>', html=True)
+        self.assertContains(response, 'data-autocomplete-url="/admin/autocomplete/?app_label=projects')
+        self.assertEqual(response.context['cl'].result_count, 2)
+
+    def test_estimated_count_paginator(self):
+        create_projects(self.owner, 5, tasks_per_project=0)
+        queryset = Project.objects.all()
+
+        paginator = EstimatedCountPaginator(queryset, 2)
+        self.assertEqual(paginator.count, 5)
+
+        paginator = EstimatedCountPaginator(queryset, 2)
+        paginator.exact_count_limit = 3
+        self.assertGreaterEqual(paginator.count, 5)
+
+        paginator = EstimatedCountPaginator(queryset.filter(status='completed'), 2)
+        paginator.exact_count_limit = 1
+        self.assertEqual(paginator.count, 2)
+        self.assertTrue(paginator.is_lower_bound)
+
+    def test_filtered_estimate_allows_pages_past_the_bound(self):
+        create_projects(self.owner, 5, tasks_per_project=0)
+        paginator = EstimatedCountPaginator(Project.objects.filter(owner=self.owner).order_by('pk'), 2)
+        paginator.exact_count_limit = 1
+        self.assertEqual(paginator.num_pages, 1)
+
+        # Halaman penuh di ujung perkiraan: masih ada halaman berikutnya
+        page = paginator.page(2)
+        self.assertEqual(len(page), 2)
+        self.assertTrue(page.has_next())
+        self.assertTrue(paginator.is_lower_bound)
+
+        # Halaman pendek: count menjadi persis
+        page = paginator.page(3)
+        self.assertEqual(len(page), 1)
+        self.assertFalse(page.has_next())
+        self.assertEqual(paginator.count, 5)
+        self.assertFalse(paginator.is_estimate)
+
+    def test_table_estimate_with_deleted_rows_does_not_raise(self):
+        projects = create_projects(self.owner, 5, tasks_per_project=0)
+        Project.objects.filter(pk__in=[project.pk for project in projects[:3]]).delete()
+        paginator = EstimatedCountPaginator(Project.objects.order_by('pk'), 1)
+        paginator.exact_count_limit = 1
+        self.assertGreaterEqual(paginator.count, 5)
+
+        page = paginator.page(paginator.num_pages)
+        self.assertEqual(len(page), 0)
+        self.assertEqual(len(paginator.page(2)), 1)
+        self.assertEqual(paginator.page(3).paginator.count, 2)
+
+    def test_changelist_labels_estimated_count(self):
+        project = create_projects(self.owner, 1, tasks_per_project=3)[0]
+        url = reverse('admin:projects_projecttask_changelist')
+        with mock.patch.object(EstimatedCountPaginator, 'exact_count_limit', 2):
+            response, _ = self.changelist_queries(url, {'project__id__exact': project.pk})
+        self.assertContains(response, 'more than 2 results')
+        self.assertContains(response, 'more than 2 Project Tasks')
+
+
+class ProjectExportTest(TestCase):
+    def setUp(self):
+        self.owner = create_user('exporter')
+        self.member = create_user('export_member')
+        self.projects = create_projects(self.owner, 3, tasks_per_project=2)
+        self.projects[0].team_members.add(self.member)
+        create_projects(create_user('export_stranger'), 2)
+
+    def read(self, response):
+        return b''.join(response.streaming_content)
+
+    def test_csv_export_streams_visible_projects(self):
+        self.client.force_login(self.member)
+        response = self.client.get(reverse('project_export', kwargs={'kind': 'projects'}))
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="projects.csv"')
+        rows = list(csv.DictReader(io.StringIO(self.read(response).decode())))
+        self.assertEqual([row['title'] for row in rows], [self.projects[0].title])
+        self.assertEqual(rows[0]['owner'], 'exporter')
+
+    def test_gzipped_jsonl_task_export(self):
+        self.client.force_login(self.owner)
+        response = self.client.get(
+            reverse('project_export', kwargs={'kind': 'tasks'}), {'format': 'jsonl', 'gzip': '1'}
+        )
+
+        self.assertEqual(response['Content-Type'], 'application/gzip')
+        lines = gzip.decompress(self.read(response)).decode().splitlines()
+        tasks = [json.loads(line) for line in lines]
+        self.assertEqual(len(tasks), 6)
+        self.assertEqual({task['project_id'] for task in tasks}, {project.pk for project in self.projects})
+
+    def test_export_reads_rows_in_chunks(self):
+        with CaptureQueriesContext(connection) as queries:
+            data = b''.join(export_stream(self.owner, 'tasks', 'csv', chunk_size=2))
+        self.assertEqual(len(data.decode().splitlines()), 7)
+        self.assertEqual(len(queries), 1)
+
+    def test_unknown_export_is_404(self):
+        self.client.force_login(self.owner)
+        url = reverse('project_export', kwargs={'kind': 'users'})
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_export_command_writes_file(self):
+        handle, path = tempfile.mkstemp(suffix='.csv.gz')
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+
+        call_command('export_projects', 'exporter@example.com', '--type', 'tasks', '--gzip', '-o', path)
+        with gzip.open(path, 'rt') as export:
+            self.assertEqual(len(list(csv.reader(export))), 7)
+
+
+class TaskImportTest(TestCase):
+    def setUp(self):
+        self.owner = create_user('importer')
+        self.member = create_user('import_member')
+        self.project = Project.objects.create(title='Import target', owner=self.owner)
+        self.project.team_members.add(self.member)
+        ProjectTask.objects.create(project=self.project, title='Existing', status='done')
+        self.due = (timezone.now().date() + timedelta(days=7)).isoformat()
+
+    def csv_file(self, rows):
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=['title', 'status', 'due_date', 'assigned_to'])
+        writer.writeheader()
+        writer.writerows(rows)
+        return io.BytesIO(output.getvalue().encode())
+
+    def test_import_updates_counters_progress_and_search(self):
+        rows = [
+            {'title': 'Write migration plan', 'status': 'done', 'due_date': self.due, 'assigned_to': 'import_member'},
+            {'title': 'Review plan', 'status': 'todo', 'due_date': '', 'assigned_to': 'IMPORT_MEMBER@example.com'},
+            {'title': 'Ship it', 'status': 'todo', 'due_date': '', 'assigned_to': ''},
+        ]
+        result = import_tasks(self.csv_file(rows), project=self.project)
+
+        self.assertTrue(result.ok, result.errors)
+        self.assertEqual(result.created, 3)
+        self.project.refresh_from_db()
+        self.assertEqual((self.project.tasks_total, self.project.tasks_done), (4, 2))
+        self.assertEqual(self.project.progress, 50)
+        self.assertEqual(ProjectTask.objects.filter(assigned_to=self.member).count(), 2)
+        self.assertEqual([task.title for task in search_tasks(ProjectTask.objects.all(), 'migration')], ['Write migration plan'])
+
+    def test_invalid_rows_are_reported_per_line(self):
+        past = (timezone.now().date() - timedelta(days=1)).isoformat()
+        rows = [
+            {'title': 'Existing', 'status': 'todo', 'due_date': '', 'assigned_to': ''},
+            {'title': 'Late', 'status': 'todo', 'due_date': past, 'assigned_to': ''},
+            {'title': 'Outsider', 'status': 'todo', 'due_date': '', 'assigned_to': 'importer'},
+            {'title': 'Weird', 'status': 'archived', 'due_date': '', 'assigned_to': ''},
+            {'title': 'Fine', 'status': 'todo', 'due_date': '', 'assigned_to': ''},
+            {'title': 'Fine', 'status': 'todo', 'due_date': '', 'assigned_to': ''},
+        ]
+        result = import_tasks(self.csv_file(rows), project=self.project)
+
+        self.assertEqual(result.created, 1)
+        self.assertEqual(sorted(line for line, _ in result.errors), [2, 3, 4, 5, 7])
+        self.assertEqual(self.project.tasks.count(), 2)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        def run(count, prefix):
+            rows = [
+                {'title': f'{prefix} {i}', 'status': 'todo', 'due_date': self.due, 'assigned_to': 'import_member'}
+                for i in range(count)
+            ]
+            with CaptureQueriesContext(connection) as queries:
+                result = import_tasks(self.csv_file(rows), project=self.project)
+            self.assertEqual(result.created, count)
+            return len(queries)
+
+        # 60 baris masih muat dalam satu INSERT di batas parameter SQLite
+        self.assertEqual(run(5, 'Small'), run(60, 'Large'))
+
+    def test_jsonl_dry_run_saves_nothing(self):
+        data = b'{"title": "Dry", "status": "todo"}\nnot json\n'
+        result = import_tasks(io.BytesIO(data), 'jsonl', project=self.project, dry_run=True)
+
+        self.assertEqual(result.created, 1)
+        self.assertEqual(result.errors, [(2, 'Invalid row.')])
+        self.assertFalse(ProjectTask.objects.filter(title='Dry').exists())
+
+    def test_upload_view_redirects_on_success(self):
+        self.client.force_login(self.member)
+        upload = SimpleUploadedFile('tasks.csv', self.csv_file([
+            {'title': 'Uploaded', 'status': 'todo', 'due_date': '', 'assigned_to': ''},
+        ]).getvalue())
+        response = self.client.post(
+            reverse('task_import', kwargs={'project_pk': self.project.pk}), {'file': upload}
+        )
+
+        self.assertRedirects(response, reverse('project_detail', kwargs={'pk': self.project.pk}),
+                             fetch_redirect_response=False)
+        self.assertTrue(self.project.tasks.filter(title='Uploaded').exists())
+
+    def test_import_command_uses_project_column(self):
+        handle, path = tempfile.mkstemp(suffix='.jsonl')
+        self.addCleanup(os.remove, path)
+        with os.fdopen(handle, 'w') as source:
+            source.write(json.dumps({'project_id': self.project.pk, 'title': 'From command'}) + '\n')
+            source.write(json.dumps({'project_id': 0, 'title': 'Nowhere'}) + '\n')
+
+        out, err = io.StringIO(), io.StringIO()
+        call_command('import_tasks', path, stdout=out, stderr=err)
+        self.assertIn('1 of 2 task(s) imported', out.getvalue())
+        self.assertIn('Line 2: Project 0 not found.', err.getvalue())
+        self.assertTrue(self.project.tasks.filter(title='From command').exists())
+
+
+class KanbanBoardTest(TestCase):
+    def setUp(self):
+        self.owner = create_user('kanban_owner')
+        self.project = Project.objects.create(title='Kanban project', owner=self.owner)
+        ProjectTask.objects.bulk_create([
+            ProjectTask(project=self.project, title=f'Card {i}', status='todo') for i in range(40)
+        ])
+        Project.rebuild_task_counters(Project.objects.filter(pk=self.project.pk))
+        self.task_ids = list(self.project.tasks.order_by('pk').values_list('pk', flat=True))
+
+    def test_board_columns_use_one_query(self):
+        ProjectTask.objects.filter(pk__in=self.task_ids[:5]).update(status='review')
+        with self.assertNumQueries(1):
+            columns = board_columns(self.project)
+        self.assertEqual([column['status'] for column in columns], ['todo', 'in_progress', 'review', 'done'])
+        self.assertEqual([len(column['tasks']) for column in columns], [35, 0, 5, 0])
+
+    def test_batch_updates_counters_and_progress_once(self):
+        def move(task_ids):
+            changes = {}
+            for i, task_id in enumerate(task_ids):
+                changes[task_id] = 'done' if i % 2 else 'in_progress'
+            with CaptureQueriesContext(connection) as queries:
+                result = move_tasks(self.project, changes)
+            self.assertEqual(result['updated'], len(task_ids))
+            return len(queries)
+
+        self.assertEqual(move(self.task_ids[:4]), move(self.task_ids[4:40]))
+        self.project.refresh_from_db()
+        self.assertEqual(
+            (self.project.tasks_todo, self.project.tasks_in_progress, self.project.tasks_done), (0, 20, 20)
+        )
+        self.assertEqual(self.project.progress, 50)
+
+    def test_unchanged_and_missing_tasks_are_skipped(self):
+        result = move_tasks(self.project, {self.task_ids[0]: 'todo', self.task_ids[1]: 'done', 0: 'done'})
+        self.assertEqual(result['updated'], 1)
+        self.assertEqual(result['missing'], [0])
+        self.assertEqual(result['counters']['tasks_done'], 1)
+
+    def test_status_api(self):
+        self.client.force_login(self.owner)
+        url = reverse('task_status_batch', kwargs={'project_pk': self.project.pk})
+        response = self.client.post(
+            url, json.dumps({'changes': {str(self.task_ids[0]): 'review'}}), content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['counters']['tasks_review'], 1)
+
+        response = self.client.post(
+            url, json.dumps({'changes': {str(self.task_ids[0]): 'archived'}}), content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_board_and_api_require_access(self):
+        self.client.force_login(create_user('kanban_outsider'))
+        board = self.client.get(reverse('project_board', kwargs={'pk': self.project.pk}))
+        api = self.client.post(
+            reverse('task_status_batch', kwargs={'project_pk': self.project.pk}),
+            json.dumps({'changes': {str(self.task_ids[0]): 'done'}}), content_type='application/json'
+        )
+        self.assertEqual((board.status_code, api.status_code), (403, 403))
+        self.assertEqual(ProjectTask.objects.get(pk=self.task_ids[0]).status, 'todo')
+
+    def test_board_renders_columns(self):
+        self.client.force_login(self.owner)
+        response = self.client.get(reverse('project_board', kwargs={'pk': self.project.pk}))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'data-task-id="%d"' % self.task_ids[0])
+
+
+class TaskScheduleTest(TestCase):
+    def setUp(self):
+        self.owner = create_user('planner')
+        self.project = Project.objects.create(title='Scheduled project', owner=self.owner)
+        durations = {'design': 3, 'frontend': 2, 'backend': 5, 'release': 1, 'docs': 1}
+        self.tasks = {
+            name: ProjectTask.objects.create(project=self.project, title=name, duration=duration)
+            for name, duration in durations.items()
+        }
+        for predecessor, successor in (
+            ('design', 'frontend'), ('design', 'backend'), ('frontend', 'release'), ('backend', 'release')
+        ):
+            self.depend(predecessor, successor)
+
+    def depend(self, predecessor, successor):
+        return TaskDependency.objects.create(
+            predecessor=self.tasks[predecessor], successor=self.tasks[successor]
+        )
+
+    def stored(self, name):
+        task = ProjectTask.objects.get(pk=self.tasks[name].pk)
+        return task.earliest_start, task.downstream_length
+
+    def test_schedule_and_critical_path(self):
+        graph = TaskGraph.load(self.project.pk)
+        self.assertEqual(graph.makespan, 9)
+        self.assertEqual(self.stored('release'), (8, 1))
+        self.assertEqual(graph.slack(self.tasks['frontend'].pk), 3)
+        self.assertEqual(graph.slack(self.tasks['backend'].pk), 0)
+        self.assertEqual(graph.slack(self.tasks['docs'].pk), 8)
+        self.assertEqual(
+            graph.critical_path(), [self.tasks[name].pk for name in ('design', 'backend', 'release')]
+        )
+        # Nilai tersimpan sama dengan perhitungan ulang penuh
+        self.assertEqual(graph.schedule(), set())
+
+    def test_cycles_are_rejected(self):
+        with self.assertRaises(CycleError):
+            self.depend('release', 'design')
+        self.assertFalse(TaskDependency.objects.filter(predecessor=self.tasks['release']).exists())
+
+        dependency = TaskDependency(predecessor=self.tasks['release'], successor=self.tasks['design'])
+        with self.assertRaises(ValidationError):
+            dependency.full_clean()
+
+    def test_cross_project_dependency_is_rejected_on_save(self):
+        other = Project.objects.create(title='Other project', owner=self.owner)
+        foreign = ProjectTask.objects.create(project=other, title='foreign', duration=2)
+
+        with self.assertRaises(ValidationError):
+            TaskDependency.objects.create(predecessor=foreign, successor=self.tasks['docs'])
+        self.assertFalse(TaskDependency.objects.filter(predecessor=foreign).exists())
+        self.assertEqual(self.stored('docs'), (0, 1))
+
+    def test_duration_change_updates_only_affected_tasks(self):
+        task = ProjectTask.objects.get(pk=self.tasks['frontend'].pk)
+        task.duration = 10
+        with CaptureQueriesContext(connection) as queries:
+            task.save()
+
+        self.assertEqual(self.stored('release'), (13, 1))
+        self.assertEqual(self.stored('design'), (0, 14))
+        self.assertEqual(self.stored('docs'), (0, 1))
+        updates = [query['sql'] for query in queries.captured_queries if 'earliest_start" = CASE' in query['sql']]
+        self.assertEqual(len(updates), 1)
+        self.assertNotIn(str(self.tasks['docs'].pk), updates[0].split('WHERE')[1])
+
+    def test_removing_dependency_and_task_reschedules(self):
+        TaskDependency.objects.get(
+            predecessor=self.tasks['backend'], successor=self.tasks['release']
+        ).delete()
+        self.assertEqual(self.stored('release'), (5, 1))
+        self.assertEqual(self.stored('backend'), (3, 5))
+
+        self.tasks['frontend'].delete()
+        self.assertEqual(self.stored('release'), (0, 1))
+        self.assertEqual(self.stored('design'), (0, 8))
+
+        self.project.delete()
+        self.assertFalse(TaskDependency.objects.exists())
+
+    def test_reschedule_loads_only_affected_subgraph(self):
+        # Rantai task lain yang tidak terhubung dengan frontend
+        previous = self.tasks['docs']
+        for index in range(20):
+            task = ProjectTask.objects.create(project=self.project, title=f'extra {index}', duration=1)
+            TaskDependency.objects.create(predecessor=previous, successor=task)
+            previous = task
+
+        frontend = self.tasks['frontend'].pk
+        graph = TaskGraph.load_around(self.project.pk, forward=[frontend], backward=[frontend])
+        self.assertEqual(
+            set(graph.durations), {self.tasks[name].pk for name in ('design', 'frontend', 'backend', 'release')}
+        )
+        self.assertEqual(graph.reschedule(forward=[frontend], backward=[frontend]), set())
+        self.assertEqual(TaskGraph.load_around(self.project.pk).durations, {})
+
+        with self.assertRaises(CycleError):
+            TaskDependency.objects.create(predecessor=previous, successor=self.tasks['docs'])
+
+    def test_project_delete_does_not_reschedule_each_task(self):
+        with mock.patch('projects.signals.reschedule_around') as reschedule:
+            self.project.delete()
+        reschedule.assert_not_called()
+
+    def test_large_layered_graph(self):
+        # 50.000 task dalam 500 lapis, tiap task bergantung pada dua task di lapis sebelumnya
+        width = 100
+        durations = {node: 1 + node % 7 for node in range(50000)}
+        edges = [
+            (node - width - offset, node)
+            for node in range(width, 50000)
+            for offset in (0, 1)
+            if (node - offset) // width == node // width
+        ]
+        graph = TaskGraph(durations, edges)
+        graph.schedule()
+
+        self.assertEqual(len(graph.critical_path()), 500)
+        changed = graph.reschedule(forward=[49950], backward=[49950])
+        self.assertEqual(changed, set())
+
+    def test_schedule_api(self):
+        self.client.force_login(self.owner)
+        response = self.client.get(reverse('project_schedule', kwargs={'pk': self.project.pk}))
+        data = response.json()
+        self.assertEqual(data['makespan'], 9)
+        self.assertEqual([item['title'] for item in data['critical_path']], ['design', 'backend', 'release'])
+
+
+class BenchmarkTest(TestCase):
+    def setUp(self):
+        self.counts = seed(Scale(users=4, projects_per_user=2, tasks_per_project=3, team_size=2,
+                                 activities_per_user=2))
+
+    def test_seed_builds_consistent_dataset(self):
+        self.assertEqual(self.counts, {
+            'categories': 6, 'users': 4, 'projects': 8, 'team_members': 16, 'tasks': 24, 'activities': 8,
+        })
+        project = Project.objects.get(slug='bench-0-0')
+        self.assertEqual(project.tasks_total, 3)
+        self.assertEqual(project.tasks_done, project.tasks.filter(status='done').count())
+        self.assertTrue(get_user_model().objects.get(username='bench0').check_password(DEFAULT_PASSWORD))
+        self.assertTrue(search_projects(Project.objects.all(), project.title.split()[0]).exists())
+
+    def test_seed_is_deterministic_and_spreads_categories(self):
+        seed(Scale(users=4, projects_per_user=2, tasks_per_project=3, team_size=2, activities_per_user=2),
+             prefix='again', search_index=False)
+        for index in range(4):
+            first = Project.objects.get(slug=f'bench-{index}-1')
+            second = Project.objects.get(slug=f'again-{index}-1')
+            self.assertEqual(first.title.split()[0], second.title.split()[0])
+            self.assertEqual(first.category_id, second.category_id)
+            self.assertEqual(
+                list(first.tasks.order_by('title').values_list('title', 'status', 'duration')),
+                list(second.tasks.order_by('title').values_list('title', 'status', 'duration')),
+            )
+        self.assertEqual(ProjectCategory.objects.count(), 6)
+        self.assertEqual(Project.objects.filter(slug__startswith='bench-').values('category').distinct().count(), 6)
+        members = Project.objects.get(slug='again-3-0').team_members.order_by('username')
+        self.assertEqual([member.username for member in members], ['again0', 'again1'])
+
+    def test_seed_data_command_refuses_existing_prefix(self):
+        output = io.StringIO()
+        call_command('seed_data', users=2, projects_per_user=1, tasks_per_project=1, activities_per_user=1,
+                     prefix='cmd', skip_search_index=True, stdout=output)
+        self.assertIn('rows in', output.getvalue())
+        self.assertEqual(Project.objects.filter(slug__startswith='cmd-').count(), 2)
+        with self.assertRaises(CommandError):
+            call_command('seed_data', users=2, prefix='cmd', stdout=io.StringIO())
+
+    def test_percentile_interpolates(self):
+        values = [10.0, 20.0, 30.0, 40.0]
+        self.assertEqual(percentile(values, 50), 25.0)
+        self.assertEqual(percentile(values, 100), 40.0)
+        self.assertEqual(percentile([5.0], 95), 5.0)
+
+    def test_run_records_latency_and_queries(self):
+        results = run_benchmarks(BenchmarkData(), names=['project_board', 'login'], iterations=2, warmup=0)
+
+        board = results['scenarios']['project_board']
+        self.assertEqual(board['iterations'], 2)
+        self.assertEqual(board['status'], 200)
+        self.assertGreater(board['queries'], 0)
+        self.assertLessEqual(board['p50_ms'], board['p95_ms'])
+        self.assertEqual(results['scenarios']['login']['status'], 302)
+
+    def test_compare_flags_regressions_over_threshold(self):
+        baseline = {'scenarios': {
+            'dashboard': {'p50_ms': 10.0, 'p95_ms': 20.0, 'queries': 5},
+            'login': {'error': 'HTTP 500'},
+        }}
+        current = {'scenarios': {
+            'dashboard': {'p50_ms': 11.5, 'p95_ms': 30.0, 'queries': 6},
+            'login': {'p50_ms': 99.0, 'p95_ms': 99.0, 'queries': 1},
+        }}
+        regressions = compare(current, baseline, threshold=0.2)
+        self.assertEqual([(item['scenario'], item['metric']) for item in regressions],
+                         [('dashboard', 'p95_ms'), ('dashboard', 'queries')])
+
+
+class QueryPlanAuditTest(TestCase):
+    def test_hot_queries_have_no_scans(self):
+        problems = {result['name']: result['issues'] for result in audit() if result['issues']}
+        self.assertEqual(problems, {})
+
+    def test_classify_flags_scans_and_temp_btrees(self):
+        self.assertEqual(
+            [classify(detail) for detail in explain(Project.objects.filter(description='x').order_by())], [FULL_SCAN]
+        )
+        plan = explain(Project.objects.filter(owner_id=1).order_by('budget'))
+        self.assertIn(TEMP_BTREE, [classify(detail) for detail in plan])
+        self.assertIsNone(classify('SCAN projects_projecttask USING INDEX projects_pr_due_dat_31c46b_idx'))
+        self.assertIsNone(classify('SCAN projects_project_fts VIRTUAL TABLE INDEX 0:M2'))
+
+    def test_command_fails_on_flagged_query(self):
+        bad = HotQuery('unindexed', lambda context: ProjectTask.objects.filter(description='x').order_by())
+        with mock.patch.dict(HOT_QUERIES, {'unindexed': bad}):
+            output = io.StringIO()
+            with self.assertRaises(CommandError):
+                call_command('audit_query_plans', fail_on_issues=True, stdout=output)
+        self.assertIn('FLAGGED unindexed', output.getvalue())
+        self.assertIn(f'! {FULL_SCAN}', output.getvalue())
+
+    def test_non_sqlite_backend_is_reported_as_configuration_error(self):
+        with mock.patch.object(connection, 'vendor', 'postgresql'):
+            with self.assertRaises(ImproperlyConfigured):
+                audit()
+            with self.assertRaisesMessage(CommandError, 'SQLite only'):
+                call_command('audit_query_plans', stdout=io.StringIO())
+
+
+class WriteContentionBenchmarkTest(unittest.TestCase):
+    # Database file sendiri per profil; tidak menyentuh database test
+    def test_configured_sqlite_serializes_writers_without_lock_errors(self):
+        self.assertEqual(connection.settings_dict['OPTIONS'].get('transaction_mode'), 'IMMEDIATE')
+        results = {
+            result['profile']: result
+            for result in run_write_benchmark(writers=4, readers=1, iterations=15)
+        }
+        configured = results['configured']
+        self.assertEqual(configured['failed'], 0)
+        self.assertEqual(configured['committed'], configured['attempted'])
+        self.assertTrue(configured['consistent'])
+        self.assertTrue(results['stock']['consistent'])
+
+    def test_non_sqlite_backend_is_reported_as_configuration_error(self):
+        database = {**connection.settings_dict, 'ENGINE': 'django.db.backends.postgresql'}
+        with mock.patch.dict('django.conf.settings.DATABASES', {'default': database}):
+            with self.assertRaisesRegex(CommandError, 'SQLite only'):
+                call_command('benchmark_writes', stdout=io.StringIO())
@@ -0,0 +1,57 @@
+from django.urls import path
+
+from .views import (
+    ProjectListView,
+    ProjectDetailView,
+    ProjectBoardView,
+    ProjectScheduleView,
+    ProjectCreateView,
+    ProjectUpdateView,
+    ProjectDeleteView,
+    ProjectTaskCreateView,
+    ProjectTaskImportView,
+    ProjectTaskStatusBatchView,
+    ProjectTaskUpdateView,
+    ProjectTaskDeleteView,
+    ProjectTeamManagementView,
+    DashboardView,
+    ProjectExportView,
+    project_member_autocomplete,
+    project_category_list,
+    project_category_create,
+    project_category_detail,
+    project_category_update,
+    project_category_delete,
+)
+
+urlpatterns = [
+    # Project
+    path('', ProjectListView.as_view(), name='project_list'),
+    path('dashboard/', DashboardView.as_view(), name='dashboard'),
+    path('create/', ProjectCreateView.as_view(), name='project_create'),
+    path('export/<slug:kind>/', ProjectExportView.as_view(), name='project_export'),
+    path('<int:pk>/', ProjectDetailView.as_view(), name='project_detail'),
+    path('<int:pk>/update/', ProjectUpdateView.as_view(), name='project_update'),
+    path('<int:pk>/delete/', ProjectDeleteView.as_view(), name='project_delete'),
+    path('<int:pk>/board/', ProjectBoardView.as_view(), name='project_board'),
+    path('<int:pk>/schedule/', ProjectScheduleView.as_view(), name='project_schedule'),
+    path('<int:pk>/team/', ProjectTeamManagementView.as_view(), name='project_team'),
+    path('<int:project_pk>/members/autocomplete/', project_member_autocomplete, name='project_member_autocomplete'),
+
+    # Task
+    path('<int:project_pk>/tasks/create/', ProjectTaskCreateView.as_view(), name='task_create'),
+    path('<int:project_pk>/tasks/import/', ProjectTaskImportView.as_view(), name='task_import'),
+    path('<int:project_pk>/tasks/status/', ProjectTaskStatusBatchView.as_view(), name='task_status_batch'),
+    path('tasks/<int:pk>/update/', ProjectTaskUpdateView.as_view(), name='task_update'),
+    path('tasks/<int:pk>/delete/', ProjectTaskDeleteView.as_view(), name='task_delete'),
+
+    # Kategori
+    path('categories/', project_category_list, name='project_category_list'),
+    path('categories/create/', project_category_create, name='project_category_create'),
+    path('categories/<slug:slug>/', project_category_detail, name='project_category_detail'),
+    path('categories/<slug:slug>/update/', project_category_update, name='project_category_update'),
+    path('categories/<slug:slug>/delete/', project_category_delete, name='project_category_delete'),
+
+    # Detail project lewat slug (Project.get_absolute_url)
+    path('<slug:slug>/', ProjectDetailView.as_view(), name='project_detail_slug'),
+]
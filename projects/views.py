@@ -1,12 +1,17 @@
+import json
+
 from django.views.generic import (
     ListView,
     DetailView,
     CreateView,
     UpdateView,
-    DeleteView
+    DeleteView,
+    FormView,
+    View
 )
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.db.models import Q
+from django.http import Http404, JsonResponse, StreamingHttpResponse
 from django.urls import reverse_lazy
 from django.contrib import messages
 from django.shortcuts import redirect
@@ -14,14 +19,28 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import TemplateView
 from .models import Project, ProjectTask
 from .models import Project, ProjectTask, ProjectCategory
-from .forms import ProjectForm, ProjectTaskForm, ProjectSearchForm, ProjectCategoryForm
+from .forms import (
+    ProjectForm, ProjectTaskForm, ProjectSearchForm, ProjectCategoryForm, ProjectTeamForm, TaskImportForm
+)
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from .models import ProjectCategory
 from .forms import ProjectCategoryForm
-
-class ProjectListView(LoginRequiredMixin, ListView):
+from accounts.autocomplete import active_users, autocomplete_response
+from .access import TeamMembership, can_manage_project, can_view_project, visible_projects
+from .cache import cached_fragment, params_digest
+from .export import EXPORT_FIELDS, FORMATS, export_filename, export_stream
+from .importer import detect_format, import_tasks
+from .kanban import board_columns, move_tasks, parse_changes
+from .scheduling import project_schedule
+from .mixins import ParentProjectMixin, ProjectObjectMixin, ProjectTaskObjectMixin
+from .pagination import CursorPaginationMixin, CursorPaginator, InvalidCursor
+from .search import search_projects, attach_snippets
+from .stats import get_dashboard_stats
+
+
+class ProjectListView(LoginRequiredMixin, CursorPaginationMixin, ListView):
     """
     Halaman daftar project dengan fitur search dan filter
     """
@@ -30,24 +49,52 @@ class ProjectListView(LoginRequiredMixin, ListView):
     context_object_name = 'projects'
     paginate_by = 10
 
+    def get_cursor_ordering(self):
+        # Hasil pencarian diurutkan berdasarkan relevansi terlebih dahulu
+        if self.search_query:
+            return ('search_rank',) + self.cursor_ordering
+        return self.cursor_ordering
+
+    def get_total_count(self):
+        """
+        Jumlah project untuk filter ini, di-cache per versi user agar tidak COUNT setiap halaman
+        """
+        digest = params_digest(self.request.GET, exclude=[self.cursor_kwarg])
+        return cached_fragment(
+            self.request.user, 'project_list_count', self.object_list.count, digest
+        )
+
+    def paginate_queryset(self, queryset, page_size):
+        """
+        Halaman hasil (beserta snippet pencarian) di-cache per versi user
+        """
+        def build_page():
+            page = super(ProjectListView, self).paginate_queryset(queryset, page_size)[1]
+            if self.search_query:
+                page.object_list = attach_snippets(page.object_list, self.search_query)
+            return page
+
+        page = cached_fragment(
+            self.request.user, 'project_list', build_page, params_digest(self.request.GET)
+        )
+        return None, page, page.object_list, page.has_other_pages()
+
     def get_queryset(self):
         # Dapatkan project yang dimiliki atau di-team
-        queryset = Project.objects.filter(
-            Q(owner=self.request.user) | Q(team_members=self.request.user)
-        ).distinct()
+        queryset = visible_projects(self.request.user)
 
         # Inisialisasi form pencarian
         self.search_form = ProjectSearchForm(self.request.GET)
+        self.search_query = ''
 
         # Filtering berdasarkan form pencarian
         if self.search_form.is_valid():
             # Filter berdasarkan query pencarian
             search_query = self.search_form.cleaned_data.get('search_query')
             if search_query:
-                queryset = queryset.filter(
-                    Q(title__icontains=search_query) |
-                    Q(description__icontains=search_query)
-                )
+                # Pencarian lewat indeks FTS, hasil diurutkan berdasarkan relevansi
+                queryset = search_projects(queryset, search_query)
+                self.search_query = search_query
 
             # Filter berdasarkan kategori
             category = self.search_form.cleaned_data.get('category')
@@ -77,37 +124,48 @@ class ProjectListView(LoginRequiredMixin, ListView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['search_form'] = self.search_form
-        context['total_projects'] = self.get_queryset().count()
+        context['total_projects'] = self.get_total_count()
         context['title'] = 'My Projects'
         return context
 
 
-class ProjectDetailView(LoginRequiredMixin, UserPassesTestMixin, DetailView):
+class ProjectDetailView(LoginRequiredMixin, ProjectObjectMixin, UserPassesTestMixin, DetailView):
     """
     Halaman detail project
     """
     model = Project
     template_name = 'projects/project_detail.html'
     context_object_name = 'project'
+    task_paginate_by = 20
 
     def test_func(self):
         # Pastikan user adalah pemilik atau anggota tim
         project = self.get_object()
-        return self.request.user == project.owner or \
-            self.request.user in project.team_members.all()
+        return can_view_project(self.request.user, project)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         project = self.object
-        tasks = project.tasks.all()
 
-        # Hitung statistik
-        total_tasks = tasks.count()
-        completed_tasks = tasks.filter(status='done').count()
-        task_completion_percentage = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+        # Task ditampilkan per halaman dengan cursor
+        paginator = CursorPaginator(
+            project.tasks.select_related('assigned_to'),
+            self.task_paginate_by
+        )
+        try:
+            task_page = paginator.page(self.request.GET.get('task_cursor'))
+        except InvalidCursor:
+            raise Http404('Invalid task cursor.')
+        tasks = task_page.object_list
+
+        # Statistik dibaca dari counter task di Project
+        total_tasks = project.tasks_total
+        completed_tasks = project.tasks_done
+        task_completion_percentage = project.task_progress
 
         context.update({
             'tasks': tasks,
+            'task_page': task_page,
             'total_tasks': total_tasks,
             'completed_tasks': completed_tasks,
             'task_completion_percentage': task_completion_percentage,
@@ -116,6 +174,54 @@ class ProjectDetailView(LoginRequiredMixin, UserPassesTestMixin, DetailView):
         return context
 
 
+class ProjectBoardView(LoginRequiredMixin, ProjectObjectMixin, UserPassesTestMixin, DetailView):
+    """
+    Papan Kanban project: satu kolom per status task
+    """
+    model = Project
+    template_name = 'projects/project_board.html'
+    context_object_name = 'project'
+
+    def test_func(self):
+        return can_view_project(self.request.user, self.get_object())
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['columns'] = board_columns(self.object)
+        context['title'] = f'{self.object.title} Board'
+        return context
+
+
+class ProjectTaskStatusBatchView(LoginRequiredMixin, ParentProjectMixin, UserPassesTestMixin, View):
+    """
+    API JSON: terapkan perubahan status dari satu sesi drag-and-drop
+    Body: {"changes": {"<task_id>": "<status>", ...}}
+    """
+
+    def test_func(self):
+        return can_view_project(self.request.user, self.get_project())
+
+    def post(self, request, project_pk):
+        try:
+            changes = parse_changes(json.loads(request.body or b'null'))
+        except ValueError as error:
+            return JsonResponse({'error': str(error)}, status=400)
+        return JsonResponse(move_tasks(self.get_project(), changes))
+
+
+class ProjectScheduleView(LoginRequiredMixin, ProjectObjectMixin, UserPassesTestMixin, DetailView):
+    """
+    API JSON: panjang project dan jalur kritis dari jadwal tersimpan
+    """
+    model = Project
+
+    def test_func(self):
+        return can_view_project(self.request.user, self.get_object())
+
+    def get(self, request, *args, **kwargs):
+        return JsonResponse(project_schedule(self.get_object()))
+
+
 class ProjectCreateView(LoginRequiredMixin, CreateView):
     """
     Halaman untuk membuat project baru
@@ -144,7 +250,7 @@ class ProjectCreateView(LoginRequiredMixin, CreateView):
         return context
 
 
-class ProjectUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
+class ProjectUpdateView(LoginRequiredMixin, ProjectObjectMixin, UserPassesTestMixin, UpdateView):
     """
     Halaman untuk mengupdate project
     """
@@ -155,7 +261,7 @@ class ProjectUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
     def test_func(self):
         # Pastikan hanya pemilik yang bisa update
         project = self.get_object()
-        return self.request.user == project.owner
+        return can_manage_project(self.request.user, project)
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
@@ -175,7 +281,7 @@ class ProjectUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
         return context
 
 
-class ProjectDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
+class ProjectDeleteView(LoginRequiredMixin, ProjectObjectMixin, UserPassesTestMixin, DeleteView):
     """
     Hapus project
     """
@@ -186,7 +292,7 @@ class ProjectDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
     def test_func(self):
         # Pastikan hanya pemilik yang bisa delete
         project = self.get_object()
-        return self.request.user == project.owner
+        return can_manage_project(self.request.user, project)
 
     def form_valid(self, form):
         project_title = self.object.title
@@ -197,7 +303,7 @@ class ProjectDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
         return super().form_valid(form)
 
 
-class ProjectTaskCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView):
+class ProjectTaskCreateView(LoginRequiredMixin, ParentProjectMixin, UserPassesTestMixin, CreateView):
     """
     Tambah task baru ke project
     """
@@ -207,250 +313,277 @@ class ProjectTaskCreateView(LoginRequiredMixin, UserPassesTestMixin, CreateView)
 
     def test_func(self):
         # Pastikan user adalah pemilik atau anggota tim
-        project = Project.objects.get(pk=self.kwargs['project_pk'])
-        return self.request.user == project.owner or \
-            self.request.user in project.team_members.all()
+        return can_view_project(self.request.user, self.get_project())
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
-        project = Project.objects.get(pk=self.kwargs['project_pk'])
-        kwargs['project'] = project
+        kwargs['project'] = self.get_project()
         return kwargs
 
     def form_valid(self, form):
-        project = Project.objects.get(pk=self.kwargs['project_pk'])
-        form.instance.project = project
+        form.instance.project = self.get_project()
         messages.success(
             self.request,
             f'Task "{form.instance.title}" has been added to project.'
         )
         return super().form_valid(form)
 
-        def get_success_url(self):
-            return reverse_lazy('project_detail', kwargs={'pk': self.kwargs['project_pk']})
+    def get_success_url(self):
+        return reverse_lazy('project_detail', kwargs={'pk': self.kwargs['project_pk']})
 
-        def get_context_data(self, **kwargs):
-            context = super().get_context_data(**kwargs)
-            context['project'] = Project.objects.get(pk=self.kwargs['project_pk'])
-            context['title'] = 'Add New Task'
-            return context
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['project'] = self.get_project()
+        context['title'] = 'Add New Task'
+        return context
 
-    class ProjectTaskUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
-        """
-        Update task yang sudah ada
-        """
-        model = ProjectTask
-        form_class = ProjectTaskForm
-        template_name = 'projects/task_form.html'
-
-        def test_func(self):
-            # Pastikan user adalah pemilik project atau anggota tim
-            task = self.get_object()
-            return (self.request.user == task.project.owner or
-                    self.request.user in task.project.team_members.all())
-
-        def get_form_kwargs(self):
-            kwargs = super().get_form_kwargs()
-            kwargs['project'] = self.object.project
-            return kwargs
-
-        def form_valid(self, form):
-            messages.success(
-                self.request,
-                f'Task "{form.instance.title}" has been updated successfully.'
-            )
-            return super().form_valid(form)
 
-        def get_success_url(self):
-            return reverse_lazy('project_detail', kwargs={'pk': self.object.project.pk})
+class ProjectTaskImportView(LoginRequiredMixin, ParentProjectMixin, UserPassesTestMixin, FormView):
+    """
+    Impor task massal dari file CSV/JSON Lines ke project
+    """
+    form_class = TaskImportForm
+    template_name = 'projects/task_import.html'
 
-        def get_context_data(self, **kwargs):
-            context = super().get_context_data(**kwargs)
-            context['project'] = self.object.project
-            context['title'] = 'Update Task'
-            return context
+    def test_func(self):
+        return can_view_project(self.request.user, self.get_project())
 
-    class ProjectTaskDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
-        """
-        Hapus task dari project
-        """
-        model = ProjectTask
-        template_name = 'projects/task_confirm_delete.html'
-
-        def test_func(self):
-            # Pastikan user adalah pemilik project
-            task = self.get_object()
-            return self.request.user == task.project.owner
-
-        def form_valid(self, form):
-            project = self.object.project
-            task_title = self.object.title
-            messages.success(
+    def form_valid(self, form):
+        upload = form.cleaned_data['file']
+        result = import_tasks(
+            upload.file,
+            detect_format(upload.name),
+            project=self.get_project(),
+            dry_run=form.cleaned_data['dry_run'],
+        )
+        if result.ok and not form.cleaned_data['dry_run']:
+            messages.success(self.request, f'{result.created} task(s) have been imported.')
+            return redirect('project_detail', pk=self.get_project().pk)
+
+        if result.ok:
+            messages.info(self.request, f'{result.created} task(s) are valid and ready to import.')
+        else:
+            messages.error(
                 self.request,
-                f'Task "{task_title}" has been deleted successfully.'
+                f'{result.error_count} row(s) have errors; {result.created} task(s) were imported.'
             )
-            return super().form_valid(form)
+        return self.render_to_response(self.get_context_data(form=form, import_result=result))
 
-        def get_success_url(self):
-            return reverse_lazy('project_detail', kwargs={'pk': self.object.project.pk})
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['project'] = self.get_project()
+        context['title'] = 'Import Tasks'
+        return context
 
-    class ProjectCategoryCreateView(LoginRequiredMixin, CreateView):
-        """
-        Halaman untuk membuat kategori project baru
-        """
-        model = ProjectCategory
-        form_class = ProjectCategoryForm
-        template_name = 'projects/category_form.html'
-        success_url = reverse_lazy('project_category_list')
 
-        def form_valid(self, form):
-            messages.success(
-                self.request,
-                'Project category has been created successfully.'
-            )
-            return super().form_valid(form)
+class ProjectTaskUpdateView(LoginRequiredMixin, ProjectTaskObjectMixin, UserPassesTestMixin, UpdateView):
+    """
+    Update task yang sudah ada
+    """
+    model = ProjectTask
+    form_class = ProjectTaskForm
+    template_name = 'projects/task_form.html'
 
-        def get_context_data(self, **kwargs):
-            context = super().get_context_data(**kwargs)
-            context['title'] = 'Create New Project Category'
-            return context
+    def test_func(self):
+        # Pastikan user adalah pemilik project atau anggota tim
+        task = self.get_object()
+        return can_view_project(self.request.user, task.project)
 
-    class ProjectCategoryListView(LoginRequiredMixin, ListView):
-        """
-        Halaman daftar kategori project
-        """
-        model = ProjectCategory
-        template_name = 'projects/category_list.html'
-        context_object_name = 'categories'
+    def get_form_kwargs(self):
+        kwargs = super().get_form_kwargs()
+        kwargs['project'] = self.object.project
+        return kwargs
 
-        def get_context_data(self, **kwargs):
-            context = super().get_context_data(**kwargs)
-            context['title'] = 'Project Categories'
-            return context
+    def form_valid(self, form):
+        messages.success(
+            self.request,
+            f'Task "{form.instance.title}" has been updated successfully.'
+        )
+        return super().form_valid(form)
 
-    class ProjectCategoryUpdateView(LoginRequiredMixin, UpdateView):
-        """
-        Halaman untuk mengupdate kategori project
-        """
-        model = ProjectCategory
-        form_class = ProjectCategoryForm
-        template_name = 'projects/category_form.html'
-        success_url = reverse_lazy('project_category_list')
+    def get_success_url(self):
+        return reverse_lazy('project_detail', kwargs={'pk': self.object.project.pk})
 
-        def form_valid(self, form):
-            messages.success(
-                self.request,
-                'Project category has been updated successfully.'
-            )
-            return super().form_valid(form)
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['project'] = self.object.project
+        context['title'] = 'Update Task'
+        return context
 
-        def get_context_data(self, **kwargs):
-            context = super().get_context_data(**kwargs)
-            context['title'] = 'Update Project Category'
-            return context
 
-    class ProjectCategoryDeleteView(LoginRequiredMixin, DeleteView):
-        """
-        Hapus kategori project
-        """
-        model = ProjectCategory
-        template_name = 'projects/category_confirm_delete.html'
-        success_url = reverse_lazy('project_category_list')
+class ProjectTaskDeleteView(LoginRequiredMixin, ProjectTaskObjectMixin, UserPassesTestMixin, DeleteView):
+    """
+    Hapus task dari project
+    """
+    model = ProjectTask
+    template_name = 'projects/task_confirm_delete.html'
 
-        def form_valid(self, form):
-            messages.success(
-                self.request,
-                'Project category has been deleted successfully.'
-            )
-            return super().form_valid(form)
+    def test_func(self):
+        # Pastikan user adalah pemilik project
+        task = self.get_object()
+        return can_manage_project(self.request.user, task.project)
 
-    class ProjectTeamManagementView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
-        """
-        Manajemen anggota tim project
-        """
-        model = Project
-        template_name = 'projects/team_management.html'
-        fields = ['team_members']
-
-        def test_func(self):
-            # Hanya pemilik project yang bisa mengelola tim
-            project = self.get_object()
-            return self.request.user == project.owner
-
-        def get_form(self, form_class=None):
-            form = super().get_form(form_class)
-            # Filter pilihan anggota tim
-            form.fields['team_members'].queryset = self.request.user.get_all_users()
-            return form
-
-        def form_valid(self, form):
-            messages.success(
-                self.request,
-                'Project team members have been updated successfully.'
-            )
-            return super().form_valid(form)
+    def form_valid(self, form):
+        project = self.object.project
+        task_title = self.object.title
+        messages.success(
+            self.request,
+            f'Task "{task_title}" has been deleted successfully.'
+        )
+        return super().form_valid(form)
+
+    def get_success_url(self):
+        return reverse_lazy('project_detail', kwargs={'pk': self.object.project.pk})
+
+
+class ProjectCategoryCreateView(LoginRequiredMixin, CreateView):
+    """
+    Halaman untuk membuat kategori project baru
+    """
+    model = ProjectCategory
+    form_class = ProjectCategoryForm
+    template_name = 'projects/category_form.html'
+    success_url = reverse_lazy('project_category_list')
+
+    def form_valid(self, form):
+        messages.success(
+            self.request,
+            'Project category has been created successfully.'
+        )
+        return super().form_valid(form)
 
-        def get_success_url(self):
-            return reverse_lazy('project_detail', kwargs={'pk': self.object.pk})
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['title'] = 'Create New Project Category'
+        return context
+
+
+class ProjectCategoryListView(LoginRequiredMixin, ListView):
+    """
+    Halaman daftar kategori project
+    """
+    model = ProjectCategory
+    template_name = 'projects/category_list.html'
+    context_object_name = 'categories'
 
-        def get_context_data(self, **kwargs):
-            context = super().get_context_data(**kwargs)
-            context['title'] = 'Manage Project Team'
-            return context
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['title'] = 'Project Categories'
+        return context
 
 
+class ProjectCategoryUpdateView(LoginRequiredMixin, UpdateView):
+    """
+    Halaman untuk mengupdate kategori project
+    """
+    model = ProjectCategory
+    form_class = ProjectCategoryForm
+    template_name = 'projects/category_form.html'
+    success_url = reverse_lazy('project_category_list')
 
-class DashboardView(LoginRequiredMixin, TemplateView):
-    template_name = 'projects/dashboard.html'
+    def form_valid(self, form):
+        messages.success(
+            self.request,
+            'Project category has been updated successfully.'
+        )
+        return super().form_valid(form)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['title'] = 'Update Project Category'
+        return context
+
+
+class ProjectCategoryDeleteView(LoginRequiredMixin, DeleteView):
+    """
+    Hapus kategori project
+    """
+    model = ProjectCategory
+    template_name = 'projects/category_confirm_delete.html'
+    success_url = reverse_lazy('project_category_list')
+
+    def form_valid(self, form):
+        messages.success(
+            self.request,
+            'Project category has been deleted successfully.'
+        )
+        return super().form_valid(form)
+
+
+class ProjectTeamManagementView(LoginRequiredMixin, ProjectObjectMixin, UserPassesTestMixin, UpdateView):
+    """
+    Manajemen anggota tim project
+    """
+    model = Project
+    template_name = 'projects/team_management.html'
+    form_class = ProjectTeamForm
+
+    def test_func(self):
+        # Hanya pemilik project yang bisa mengelola tim
+        project = self.get_object()
+        return can_manage_project(self.request.user, project)
+
+    def form_valid(self, form):
+        messages.success(
+            self.request,
+            'Project team members have been updated successfully.'
+        )
+        return super().form_valid(form)
+
+    def get_success_url(self):
+        return reverse_lazy('project_detail', kwargs={'pk': self.object.pk})
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        context['title'] = 'Manage Project Team'
+        return context
 
-        # Project yang dimiliki atau di-team
-        user_projects = Project.objects.filter(
-            Q(owner=self.request.user) | Q(team_members=self.request.user)
-        ).distinct()
 
-    from django.contrib.auth.mixins import LoginRequiredMixin
-    from django.views.generic import TemplateView
-    from django.db.models import Q
-    from .models import Project, ProjectTask
 
-    class DashboardView(LoginRequiredMixin, TemplateView):
-        template_name = 'projects/dashboard.html'
+class DashboardView(LoginRequiredMixin, TemplateView):
+    """
+    Dashboard ringkasan project dan task milik user
+    """
+    template_name = 'projects/dashboard.html'
 
-        def get_context_data(self, **kwargs):
-            context = super().get_context_data(**kwargs)
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
 
-            # Project yang dimiliki atau di-team
-            user_projects = Project.objects.filter(
-                Q(owner=self.request.user) | Q(team_members=self.request.user)
-            ).distinct()
+        # Statistik dihitung dengan query agregat, bukan per project, lalu di-cache per user
+        user = self.request.user
+        context.update(cached_fragment(user, 'dashboard', lambda: get_dashboard_stats(user)))
+        return context
 
-            # Tambahkan method untuk menghitung progress
-            def calculate_project_progress(project):
-                tasks = project.tasks.all()
-                if not tasks:
-                    return 0
-                completed_tasks = tasks.filter(status='done').count()
-                return (completed_tasks / tasks.count()) * 100
 
-            # Tambahkan progress ke setiap project
-            for project in user_projects:
-                project.progress = calculate_project_progress(project)
+class ProjectExportView(LoginRequiredMixin, View):
+    """
+    Unduh semua project/task yang bisa dilihat user (?format=csv|jsonl&gzip=1), di-stream
+    """
 
-            # Statistik
-            context.update({
-                'total_projects': user_projects.count(),
-                'ongoing_projects': user_projects.filter(status='in_progress').count(),
-                'completed_projects': user_projects.filter(status='completed').count(),
-                'total_tasks': ProjectTask.objects.filter(project__in=user_projects).count(),
-                'recent_projects': list(user_projects.order_by('-created_at')[:5]),  # Konversi ke list
-            })
-            return context
+    def get(self, request, kind):
+        fmt = request.GET.get('format', 'csv')
+        if kind not in EXPORT_FIELDS or fmt not in FORMATS:
+            raise Http404
+        compress = request.GET.get('gzip') in ('1', 'true')
 
+        response = StreamingHttpResponse(
+            export_stream(request.user, kind, fmt, compress=compress),
+            content_type='application/gzip' if compress else f'{FORMATS[fmt]}; charset=utf-8',
+        )
+        response['Content-Disposition'] = f'attachment; filename="{export_filename(kind, fmt, compress)}"'
+        return response
 
 
+@login_required
+def project_member_autocomplete(request, project_pk):
+    """
+    Typeahead anggota tim project (untuk assignee task)
+    """
+    project = get_object_or_404(Project.objects.only('pk', 'owner_id'), pk=project_pk)
+    if not can_view_project(request.user, project):
+        raise Http404
+    members = TeamMembership.objects.filter(project_id=project.pk).values('customuser_id')
+    return autocomplete_response(request, active_users().filter(pk__in=members))
 
 
 @login_required
@@ -0,0 +1,193 @@
+"""
+Benchmark kontensi tulis SQLite.
+
+Beberapa thread penulis menjalankan transaksi baca-lalu-tulis (pola atomic()
+aplikasi: baca counter, UPDATE, INSERT log) ke satu file database, sementara
+thread pembaca terus membaca. Setiap "request" diakhiri seperti di Django:
+koneksi ditutup bila CONN_MAX_AGE sudah lewat (0 = setiap request).
+
+Profil yang dibandingkan:
+- stock: konfigurasi bawaan Django (journal rollback, DEFERRED, tanpa koneksi persisten);
+- configured: OPTIONS dan CONN_MAX_AGE dari DATABASES['default'].
+
+Setiap profil memakai file database baru di direktori sementara.
+"""
+import os
+import random
+import tempfile
+import threading
+from time import perf_counter
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections, transaction
+
+HOT_ROWS = 16
+
+
+def get_profiles():
+    default = settings.DATABASES[DEFAULT_DB_ALIAS]
+    if 'sqlite3' not in default['ENGINE']:
+        raise ImproperlyConfigured('Write contention benchmark supports SQLite only.')
+    return {
+        'stock': {'OPTIONS': {}, 'CONN_MAX_AGE': 0},
+        'configured': {
+            'OPTIONS': default.get('OPTIONS', {}),
+            'CONN_MAX_AGE': default.get('CONN_MAX_AGE', 0),
+        },
+    }
+
+
+def _register(alias, path, profile):
+    # configure_settings mengisi default yang sama seperti DATABASES biasa
+    configured = connections.configure_settings({
+        DEFAULT_DB_ALIAS: {'ENGINE': 'django.db.backends.sqlite3', 'NAME': path, **profile},
+    })
+    connections.settings[alias] = configured[DEFAULT_DB_ALIAS]
+
+
+def _unregister(alias):
+    connections[alias].close()
+    del connections[alias]
+    connections.settings.pop(alias, None)
+
+
+def _create_schema(alias):
+    with connections[alias].cursor() as cursor:
+        cursor.execute('CREATE TABLE bench_counter (id INTEGER PRIMARY KEY, value INTEGER NOT NULL)')
+        cursor.execute(
+            'CREATE TABLE bench_log (id INTEGER PRIMARY KEY, counter_id INTEGER NOT NULL, '
+            'value INTEGER NOT NULL, thread TEXT NOT NULL)'
+        )
+        cursor.executemany('INSERT INTO bench_counter (id, value) VALUES (%s, 0)', [(i,) for i in range(HOT_ROWS)])
+    connections[alias].close()
+
+
+def _end_request(connection):
+    connection.close_if_unusable_or_obsolete()
+
+
+class ThreadStats:
+    def __init__(self):
+        self.committed = 0
+        self.failed = 0
+        self.reads = 0
+        self.read_failures = 0
+
+
+def _writer(alias, iterations, start, stats, seed):
+    connection = connections[alias]
+    rng = random.Random(seed)
+    name = threading.current_thread().name
+    start.wait()
+    try:
+        for _ in range(iterations):
+            key = rng.randrange(HOT_ROWS)
+            try:
+                with transaction.atomic(using=alias):
+                    with connection.cursor() as cursor:
+                        cursor.execute('SELECT value FROM bench_counter WHERE id = %s', [key])
+                        value = cursor.fetchone()[0] + 1
+                        cursor.execute('UPDATE bench_counter SET value = %s WHERE id = %s', [value, key])
+                        cursor.execute(
+                            'INSERT INTO bench_log (counter_id, value, thread) VALUES (%s, %s, %s)',
+                            [key, value, name],
+                        )
+                stats.committed += 1
+            except OperationalError:
+                # "database is locked": request gagal
+                stats.failed += 1
+            finally:
+                _end_request(connection)
+    finally:
+        connection.close()
+
+
+def _reader(alias, stop, start, stats):
+    connection = connections[alias]
+    start.wait()
+    try:
+        while not stop.is_set():
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT SUM(value), COUNT(*) FROM bench_counter')
+                    cursor.fetchone()
+                stats.reads += 1
+            except OperationalError:
+                stats.read_failures += 1
+            finally:
+                _end_request(connection)
+    finally:
+        connection.close()
+
+
+def _totals(alias):
+    with connections[alias].cursor() as cursor:
+        cursor.execute('SELECT SUM(value) FROM bench_counter')
+        counter_total = cursor.fetchone()[0]
+        cursor.execute('SELECT COUNT(*) FROM bench_log')
+        log_total = cursor.fetchone()[0]
+    connections[alias].close()
+    return counter_total, log_total
+
+
+def run_contention(profile_name, profile, writers=8, readers=2, iterations=100, directory=None):
+    """
+    Satu putaran benchmark untuk satu profil; mengembalikan ringkasan
+    """
+    alias = f'write_benchmark_{profile_name}'
+    with tempfile.TemporaryDirectory(dir=directory) as workdir:
+        _register(alias, os.path.join(workdir, f'{profile_name}.sqlite3'), profile)
+        try:
+            _create_schema(alias)
+            start, stop = threading.Barrier(writers + readers + 1), threading.Event()
+            writer_stats = [ThreadStats() for _ in range(writers)]
+            reader_stats = [ThreadStats() for _ in range(readers)]
+            threads = [
+                threading.Thread(target=_writer, args=(alias, iterations, start, stats, index),
+                                 name=f'writer-{index}')
+                for index, stats in enumerate(writer_stats)
+            ] + [
+                threading.Thread(target=_reader, args=(alias, stop, start, stats), name=f'reader-{index}')
+                for index, stats in enumerate(reader_stats)
+            ]
+            for thread in threads:
+                thread.start()
+            start.wait()
+            started = perf_counter()
+            for thread in threads[:writers]:
+                thread.join()
+            elapsed = perf_counter() - started
+            stop.set()
+            for thread in threads[writers:]:
+                thread.join()
+
+            committed = sum(stats.committed for stats in writer_stats)
+            reads = sum(stats.reads for stats in reader_stats)
+            counter_total, log_total = _totals(alias)
+        finally:
+            _unregister(alias)
+
+    return {
+        'profile': profile_name,
+        'writers': writers,
+        'readers': readers,
+        'attempted': writers * iterations,
+        'committed': committed,
+        'failed': sum(stats.failed for stats in writer_stats),
+        'seconds': round(elapsed, 3),
+        'writes_per_s': round(committed / elapsed, 1) if elapsed else 0.0,
+        'reads': reads,
+        'reads_per_s': round(reads / elapsed, 1) if elapsed else 0.0,
+        'read_failures': sum(stats.read_failures for stats in reader_stats),
+        # Setiap commit menambah tepat 1 ke counter dan 1 baris log
+        'consistent': counter_total == log_total == committed,
+    }
+
+
+def run_write_benchmark(names=None, writers=8, readers=2, iterations=100, directory=None):
+    profiles = get_profiles()
+    return [
+        run_contention(name, profiles[name], writers, readers, iterations, directory)
+        for name in names or profiles
+    ]